@@ -0,0 +1,329 @@
+"""
+입장 제어(부하 차단) 모듈
+
+SQLite는 쓰기를 한 번에 하나만 처리하므로, 쓰기 경합이 심해지면 등록/수정 요청이
+스레드풀에서 잠금을 기다리며 쌓이고 스레드풀을 함께 쓰는 조회 요청까지 느려집니다.
+이 모듈은 요청이 라우트에 들어가기 전에 두 단계로 걸러 냅니다.
+
+1. 클라이언트별 토큰 버킷 (RATE_LIMIT_READ/WRITE): 초당 허용량을 넘으면 429
+2. 동시 실행 제한 (READ/WRITE_CONCURRENCY): 슬롯이 모두 차 있으면 대기열에서 기다리고,
+   대기열이 가득 찼거나(queue_full) 기다린 시간이 한도를 넘으면(queue_timeout) 503
+
+조회(GET 등)와 쓰기(POST, PUT, PATCH, DELETE)는 예산(토큰 버킷, 동시 실행 슬롯)을
+따로 쓰므로 쓰기가 몰려도 조회는 계속 처리됩니다. 거절한 응답에는 Retry-After를 붙입니다.
+업로드가 끝날 때까지 오래 걸리는 가져오기(POST /questions/import)는 쓰기와 토큰 버킷만
+함께 쓰고 동시 실행 슬롯은 따로 두어, 느린 가져오기가 등록/수정/삭제를 막지 않게 합니다.
+
+상태 확인(/ready), 계측(/metrics), 진단(/debug/...) 경로는 제한하지 않고, 오래 열려 있는
+실시간 스트림(/api/question/stream)은 토큰 버킷만 적용하고 동시 실행 슬롯은 쓰지 않습니다.
+그룹 커밋(BOARD_GROUP_COMMIT=1)을 켜면 질문 등록도 동시 실행 슬롯을 쓰지 않습니다.
+등록 요청이 많이 모일수록 배치가 커지므로, 쓰기 큐가 가득 찼을 때의 503으로 부하를 차단합니다.
+
+모든 상태는 이벤트 루프 하나에서만 바뀌므로 잠금을 쓰지 않으며, 여러 워커(BOARD_WORKERS)로
+실행하면 한도는 워커마다 따로 적용됩니다. 거절 수는 /metrics의 board_admission_shed_total과
+GET /debug/admission에서 확인할 수 있습니다.
+"""
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from config import (
+    ADMISSION_CLIENT_HEADER,
+    ADMISSION_MAX_CLIENTS,
+    ADMISSION_RETRY_AFTER,
+    GROUP_COMMIT_ENABLED,
+    IMPORT_CONCURRENCY,
+    IMPORT_QUEUE_SIZE,
+    IMPORT_QUEUE_TIMEOUT_MS,
+    RATE_LIMIT_READ,
+    RATE_LIMIT_READ_BURST,
+    RATE_LIMIT_WRITE,
+    RATE_LIMIT_WRITE_BURST,
+    READ_CONCURRENCY,
+    READ_QUEUE_SIZE,
+    READ_QUEUE_TIMEOUT_MS,
+    WRITE_CONCURRENCY,
+    WRITE_QUEUE_SIZE,
+    WRITE_QUEUE_TIMEOUT_MS,
+)
+from metrics import ADMISSION_QUEUE_WAIT, ADMISSION_SHED
+
+WRITE_METHODS = frozenset(('POST', 'PUT', 'PATCH', 'DELETE'))
+# 동작: 부하가 높을수록 더 필요한 상태 확인/계측/진단 경로는 제한하지 않습니다.
+EXEMPT_PREFIXES = ('/ready', '/metrics', '/debug/')
+# 동작: 연결이 끝날 때까지 슬롯을 차지하는 스트림은 동시 실행 제한에서 뺍니다.
+LONG_LIVED_PATHS = frozenset(('/api/question/stream',))
+# 동작: 쓰기 슬롯 대신 가져오기 전용 슬롯을 쓰는 경로
+IMPORT_PATHS = frozenset(('/questions/import',))
+# 동작: 그룹 커밋이 켜져 있으면 쓰기 큐가 부하를 차단하므로 동시 실행 제한에서 빼는 등록 경로
+GROUP_COMMIT_PATHS = frozenset(('/questions', '/api/question/create')) if GROUP_COMMIT_ENABLED else frozenset()
+
+
+class OverloadedError(Exception):
+    """동시 실행 슬롯을 얻지 못했을 때 발생하는 예외 (reason: queue_full, queue_timeout)"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class RateLimiter:
+    """
+    클라이언트별 토큰 버킷
+
+    버킷마다 최대 burst개의 토큰을 담고 초당 rate개씩 채우며, 요청 하나가 토큰 하나를 씁니다.
+    최근에 쓴 max_clients개의 버킷만 보관하므로 클라이언트가 많아도 메모리가 늘지 않습니다.
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int = ADMISSION_MAX_CLIENTS):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_clients = max_clients
+        # 클라이언트 -> [남은 토큰, 마지막으로 채운 시각]
+        self._buckets: 'OrderedDict[str, list]' = OrderedDict()
+
+    def take(self, client: str) -> Optional[float]:
+        """
+        클라이언트의 토큰 하나를 씁니다.
+
+        Args:
+            client: 클라이언트 식별자 (주소 또는 ADMISSION_CLIENT_HEADER 값)
+
+        Returns:
+            허용하면 None, 거절하면 토큰 하나가 채워질 때까지 남은 시간(초)
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = [float(self.burst), now]
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return None
+        return (1 - bucket[0]) / self.rate
+
+    @property
+    def clients(self) -> int:
+        return len(self._buckets)
+
+
+class ConcurrencyLimiter:
+    """
+    동시 실행 수를 limit개로 제한하고, 나머지는 대기열에서 도착 순서대로 기다리게 하는 제한기
+
+    슬롯을 반납하면 다음 대기자에게 바로 넘기므로 새로 도착한 요청이 기다리던 요청을
+    앞지르지 않습니다.
+    """
+
+    def __init__(self, limit: int, queue_size: int, queue_timeout_ms: float):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout_ms / 1000
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> float:
+        """
+        슬롯 하나를 얻습니다.
+
+        Returns:
+            슬롯을 얻기까지 기다린 시간(초)
+
+        Raises:
+            OverloadedError: 대기열이 가득 찼거나 queue_timeout 안에 슬롯을 얻지 못한 경우
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return 0.0
+        if len(self._waiters) >= self.queue_size:
+            raise OverloadedError('queue_full')
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            # 동작: 슬롯을 넘겨받은 것과 시간 초과가 겹쳤으면 (받은 슬롯을 쓰지 않으므로) 돌려줍니다.
+            if future.done() and not future.cancelled():
+                self.release()
+            raise OverloadedError('queue_timeout') from None
+        except asyncio.CancelledError:
+            # 동작: 슬롯을 넘겨받은 직후 취소(클라이언트 연결 종료 등)되었으면 슬롯을 돌려줍니다.
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        finally:
+            if not future.done() or future.cancelled():
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+        return time.perf_counter() - started
+
+    def release(self) -> None:
+        """슬롯을 반납합니다. 기다리는 요청이 있으면 그 요청에 슬롯을 넘깁니다."""
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+class Budget:
+    """조회 또는 쓰기 요청이 함께 쓰는 토큰 버킷과 동시 실행 제한, 거절 통계"""
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: int,
+        concurrency: int,
+        queue_size: int,
+        queue_timeout_ms: float
+    ):
+        self.name = name
+        self.rate_limiter = RateLimiter(rate, burst) if rate > 0 else None
+        self.limiter = (
+            ConcurrencyLimiter(concurrency, queue_size, queue_timeout_ms) if concurrency > 0 else None
+        )
+        self.admitted = 0
+        self.shed: Dict[str, int] = {}
+
+    def record_shed(self, reason: str) -> None:
+        self.shed[reason] = self.shed.get(reason, 0) + 1
+        ADMISSION_SHED.inc((self.name, reason))
+
+    def stats(self) -> Dict[str, Any]:
+        """허용/거절 수와 현재 동시 실행/대기 수를 반환합니다."""
+        rate_limiter, limiter = self.rate_limiter, self.limiter
+        return {
+            'rate_limit': rate_limiter.rate if rate_limiter else None,
+            'burst': rate_limiter.burst if rate_limiter else None,
+            'clients': rate_limiter.clients if rate_limiter else 0,
+            'concurrency': limiter.limit if limiter else None,
+            'queue_size': limiter.queue_size if limiter else None,
+            'queue_timeout_ms': limiter.queue_timeout * 1000 if limiter else None,
+            'active': limiter.active if limiter else None,
+            'waiting': limiter.waiting if limiter else None,
+            'admitted': self.admitted,
+            'shed': dict(self.shed),
+        }
+
+
+read_budget = Budget(
+    'read', RATE_LIMIT_READ, RATE_LIMIT_READ_BURST,
+    READ_CONCURRENCY, READ_QUEUE_SIZE, READ_QUEUE_TIMEOUT_MS
+)
+write_budget = Budget(
+    'write', RATE_LIMIT_WRITE, RATE_LIMIT_WRITE_BURST,
+    WRITE_CONCURRENCY, WRITE_QUEUE_SIZE, WRITE_QUEUE_TIMEOUT_MS
+)
+import_budget = Budget(
+    'import', 0, 0, IMPORT_CONCURRENCY, IMPORT_QUEUE_SIZE, IMPORT_QUEUE_TIMEOUT_MS
+)
+# 동작: 가져오기도 쓰기이므로 클라이언트별 토큰 버킷은 쓰기 예산의 것을 함께 씁니다.
+import_budget.rate_limiter = write_budget.rate_limiter
+
+
+def admission_stats() -> Dict[str, Any]:
+    """조회/쓰기/가져오기 예산별 입장 제어 통계를 반환합니다."""
+    return {
+        'client_header': ADMISSION_CLIENT_HEADER or None,
+        'read': read_budget.stats(),
+        'write': write_budget.stats(),
+        'import': import_budget.stats(),
+    }
+
+
+def client_key(scope) -> str:
+    """ADMISSION_CLIENT_HEADER 값(여러 개면 첫 번째) 또는 접속한 주소로 클라이언트를 구분합니다."""
+    if ADMISSION_CLIENT_HEADER:
+        value = Headers(scope=scope).get(ADMISSION_CLIENT_HEADER)
+        if value:
+            return value.split(',', 1)[0].strip()
+    client = scope.get('client')
+    return client[0] if client else 'unknown'
+
+
+def budget_for(scope) -> Budget:
+    """요청 메서드와 경로에 맞는 예산을 고릅니다."""
+    if scope['method'] not in WRITE_METHODS:
+        return read_budget
+    if scope['path'] in IMPORT_PATHS:
+        return import_budget
+    return write_budget
+
+
+def _shed_response(status_code: int, message: str, retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        {'detail': message},
+        status_code=status_code,
+        headers={'Retry-After': str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class AdmissionMiddleware:
+    """
+    요청을 조회/쓰기 예산으로 나눠 토큰 버킷과 동시 실행 제한을 적용하는 ASGI 미들웨어
+
+    거절할 때는 라우트를 호출하지 않으므로 스레드풀 스레드와 DB 연결을 쓰지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['path'].startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        budget = budget_for(scope)
+
+        if budget.rate_limiter is not None:
+            retry_after = budget.rate_limiter.take(client_key(scope))
+            if retry_after is not None:
+                budget.record_shed('rate_limited')
+                response = _shed_response(429, '요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.', retry_after)
+                await response(scope, receive, send)
+                return
+
+        limiter = budget.limiter
+        path = scope['path']
+        if limiter is None or path in LONG_LIVED_PATHS or (
+            scope['method'] == 'POST' and path in GROUP_COMMIT_PATHS
+        ):
+            budget.admitted += 1
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            waited = await limiter.acquire()
+        except OverloadedError as exc:
+            ADMISSION_QUEUE_WAIT.observe(
+                limiter.queue_timeout if exc.reason == 'queue_timeout' else 0.0, (budget.name,)
+            )
+            budget.record_shed(exc.reason)
+            response = _shed_response(
+                503, '서버가 요청을 처리할 여유가 없습니다. 잠시 후 다시 시도해 주세요.',
+                ADMISSION_RETRY_AFTER
+            )
+            await response(scope, receive, send)
+            return
+        ADMISSION_QUEUE_WAIT.observe(waited, (budget.name,))
+        budget.admitted += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
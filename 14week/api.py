@@ -3,24 +3,39 @@ FastAPI 라우터 정의
 
 질문(Question)에 대한 CRUD API 엔드포인트를 정의합니다.
 """
-from fastapi import FastAPI, APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import List
-from database import get_db
+from datetime import datetime
+import anyio
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Body, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from typing import Any, Dict, List, Literal, Optional
+from cache import question_etag, etag_matches, parse_if_match_versions
+from config import BULK_MAX_ITEMS, EXPORT_BATCH_SIZE, MAX_PAGE_SIZE
+from database import allow_stale_reads, get_db, get_read_db, is_stale_session
 from schemas import (
     QuestionCreate, 
     QuestionUpdate, 
     QuestionResponse, 
     QuestionListResponse,
+    QuestionListApiResponse,
     ApiResponse
 )
 from domain.question.service import (
     create_question,
-    get_question,
-    get_questions,
+    create_questions_bulk,
+    get_question_changes,
+    get_question_fields,
+    get_question_version,
+    get_question_rows,
+    get_question_total,
     update_question,
-    delete_question
+    delete_question,
+    VersionConflictError
 )
+from domain.question.group_commit import WriterBusyError, question_writer
+from domain.question.listing import ListPage, ListParams, list_params
+from domain.question.serialization import parse_fields, question_changes_body, question_dict
 
 router = APIRouter()
 
@@ -28,19 +43,31 @@ router = APIRouter()
 @router.post('/questions', response_model=ApiResponse, status_code=201)
 def create_question_endpoint(
     question: QuestionCreate,
-    db: Session = Depends(get_db)
+    # get_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_db)
 ) -> ApiResponse:
     """
     새로운 질문을 생성합니다.
     
     Args:
         question: 생성할 질문 정보
-        db: 데이터베이스 세션 (의존성 주입)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
         
     Returns:
         생성된 질문 정보를 포함한 응답
+        
+    Raises:
+        HTTPException: 그룹 커밋 큐가 가득 찬 경우 503 에러
     """
-    db_question = create_question(db, question)
+    if question_writer is not None:
+        # 동작: 그룹 커밋 모드에서는 쓰기 스레드가 다른 요청과 함께 커밋할 때까지 기다립니다.
+        try:
+            db_question = question_writer.submit(question).result()
+        except WriterBusyError as exc:
+            raise HTTPException(status_code=503, detail=str(exc), headers={'Retry-After': '1'})
+    else:
+        with db_context as db:
+            db_question = create_question(db, question)
     return ApiResponse(
         status='success',
         message='질문이 성공적으로 생성되었습니다.',
@@ -53,121 +80,470 @@ def create_question_endpoint(
     )
 
 
-@router.get('/questions', response_model=ApiResponse)
-def get_questions_endpoint(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+@router.post('/questions/bulk', response_model=ApiResponse, status_code=201)
+def create_questions_bulk_endpoint(
+    response: Response,
+    items: List[Dict[str, Any]] = Body(...),
+    # get_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_db)
 ) -> ApiResponse:
     """
-    질문 목록을 조회합니다.
+    여러 질문을 한 번에 생성합니다.
+    
+    항목마다 QuestionCreate 규칙으로 검증하고, 통과한 항목만 배치 트랜잭션으로
+    저장합니다. 일부 항목이 실패해도 나머지 항목은 저장됩니다.
     
     Args:
-        skip: 건너뛸 레코드 수
-        limit: 최대 조회할 레코드 수
-        db: 데이터베이스 세션 (의존성 주입)
+        response: 응답 객체 (저장된 항목이 없을 때 상태 코드 변경용)
+        items: 생성할 질문 정보 리스트 (각 항목은 subject, content를 가짐)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
         
     Returns:
-        질문 목록을 포함한 응답
+        입력 순서대로의 생성된 ID 리스트(실패 항목은 null)와 항목별 에러를 포함한 응답
+        
+    Raises:
+        HTTPException: 항목 수가 BULK_MAX_ITEMS를 넘는 경우 413 에러
     """
-    questions = get_questions(db, skip=skip, limit=limit)
+    if len(items) > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f'한 번에 최대 {BULK_MAX_ITEMS}개까지 등록할 수 있습니다.'
+        )
+    
+    # 동작: 모든 항목을 먼저 검증하고, 유효한 항목의 원래 위치를 기억합니다.
+    valid: List[QuestionCreate] = []
+    positions: List[int] = []
+    errors: List[Dict[str, Any]] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append(QuestionCreate.model_validate(item))
+            positions.append(index)
+        except ValidationError as exc:
+            errors.append({
+                'index': index,
+                'errors': [
+                    {'loc': list(e['loc']), 'msg': e['msg']} for e in exc.errors()
+                ]
+            })
+    
+    ids: List[Optional[int]] = [None] * len(items)
+    if valid:
+        with db_context as db:
+            created_ids = create_questions_bulk(db, valid)
+        for index, question_id in zip(positions, created_ids):
+            ids[index] = question_id
+            if question_id is None:
+                errors.append({
+                    'index': index,
+                    'errors': [{'loc': [], 'msg': '데이터베이스 저장에 실패했습니다.'}]
+                })
+    
+    created = sum(1 for question_id in ids if question_id is not None)
+    if created == 0 and errors:
+        response.status_code = 422
+    errors.sort(key=lambda e: e['index'])
     return ApiResponse(
-        status='success',
+        status='success' if not errors else 'partial',
+        message=f'{created}개의 질문이 생성되었습니다.',
         data={
-            'questions': [
-                {
-                    'id': q.id,
-                    'subject': q.subject,
-                    'content': q.content,
-                    'create_date': q.create_date.isoformat()
-                }
-                for q in questions
-            ],
-            'count': len(questions)
+            'ids': ids,
+            'created': created,
+            'failed': len(items) - created,
+            'errors': errors
         }
     )
 
 
+@router.post('/questions/import', response_model=ApiResponse)
+async def import_questions_endpoint(
+    request: Request,
+    response: Response,
+    import_format: Optional[Literal['ndjson', 'csv']] = Query(None, alias='format'),
+    # get_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_db)
+) -> ApiResponse:
+    """
+    NDJSON 또는 CSV 본문으로 질문을 대량 등록합니다.
+    
+    본문을 받는 대로 한 줄씩 해석하고 BULK_BATCH_SIZE개씩 트랜잭션으로 저장하므로
+    업로드 크기와 관계없이 메모리 사용량이 일정합니다. 진행 중인 작업은
+    GET /debug/imports에서 확인할 수 있습니다.
+    
+    CSV는 subject, content 컬럼이 있는 머리글 행이 필요하며,
+    GET /questions/export 결과를 그대로 가져올 수 있습니다.
+    
+    Args:
+        request: 요청 객체 (본문 스트리밍용)
+        response: 응답 객체 (저장된 항목이 없을 때 상태 코드 변경용)
+        import_format: 본문 형식 (쿼리 파라미터 이름은 format).
+            생략하면 Content-Type이 text/csv일 때 csv, 그 외에는 ndjson
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+        
+    Returns:
+        처리한 레코드 수, 저장/거부 건수, 거부된 줄의 에러(최대 100개)를 포함한 응답
+        
+    Raises:
+        HTTPException: 본문을 해석할 수 없는 경우 400 에러 (이미 저장된 배치는 유지됨)
+    """
+    # 동작: 가져오기/검색/내보내기 모듈은 이 라우트를 처음 호출할 때 import해 시작 시간을 줄입니다.
+    from domain.question.importer import import_questions
+    
+    if import_format is None:
+        content_type = request.headers.get('content-type', '')
+        import_format = 'csv' if content_type.startswith('text/csv') else 'ndjson'
+    
+    body = request.stream()
+    
+    async def receive() -> Optional[bytes]:
+        try:
+            return await body.__anext__()
+        except StopAsyncIteration:
+            return None
+    
+    def chunks():
+        # 동작: 워커 스레드에서 이벤트 루프로 돌아가 본문 조각을 하나씩 받아옵니다.
+        while True:
+            chunk = anyio.from_thread.run(receive)
+            if chunk is None:
+                return
+            if chunk:
+                yield chunk
+    
+    def run():
+        with db_context as db:
+            return import_questions(db, import_format, chunks())
+    
+    # 동작: 해석과 DB 저장은 동기 코드이므로 스레드풀에서 실행해 이벤트 루프를 막지 않습니다.
+    try:
+        progress = await run_in_threadpool(run)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    
+    if progress.accepted == 0 and progress.rejected > 0:
+        response.status_code = 422
+    return ApiResponse(
+        status='success' if progress.rejected == 0 else 'partial',
+        message=f'{progress.accepted}개의 질문이 등록되었습니다.',
+        data={**progress.snapshot(), 'errors': progress.errors}
+    )
+
+
+@router.get('/questions', response_model=QuestionListApiResponse)
+@allow_stale_reads
+def get_questions_endpoint(
+    params: ListParams = Depends(list_params),
+    if_none_match: Optional[str] = Header(None),
+    # get_read_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_read_db)
+) -> ApiResponse:
+    """
+    질문 목록을 조회합니다.
+    
+    cursor를 넘기면 키셋 페이지네이션으로 조회하며, 응답의 next_cursor를
+    다음 요청의 cursor로 넘기면 됩니다. skip은 기존 클라이언트 호환용입니다.
+    
+    created_after/created_before로 작성일시 범위를, order=desc로 최신 순 정렬을 지정할 수 있으며
+    모두 삭제되지 않은 질문의 (create_date, id) 부분 인덱스를 탐색합니다. 응답의 total은
+    범위와 관계없이 전체 질문 수입니다 (질문 수 카운터에서 읽으므로 COUNT를 실행하지 않음).
+    
+    직렬화된 응답은 (데이터 버전, 페이지네이션, 필드, 범위, 정렬)을 키로 캐시되며,
+    질문이 생성/수정/삭제되면 데이터 버전이 바뀌어 자동으로 무효화됩니다.
+    응답의 ETag도 데이터 버전으로 만들어지므로, If-None-Match가 일치하면
+    DB를 조회하지 않고 304 Not Modified로 응답합니다. (domain.question.listing.ListPage)
+    
+    늦게 반영된 데이터를 허용하는 라우트(allow_stale_reads)이므로 읽기 복제본이
+    설정되어 있으면 복제본에서 조회할 수 있으며, 이때는 캐시와 ETag를 쓰지 않습니다.
+    
+    Args:
+        params: 목록 조회 파라미터 (skip, limit, cursor, fields, created_after,
+            created_before, order. domain.question.listing.list_params 참고)
+        if_none_match: 클라이언트가 가진 응답의 ETag (If-None-Match 헤더)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+        
+    Returns:
+        질문 목록을 포함한 응답
+        
+    Raises:
+        HTTPException: cursor 또는 fields 형식이 올바르지 않은 경우 400 에러
+    """
+    page = ListPage(params, if_none_match)
+    response = page.cached_response()
+    if response is not None:
+        return response
+    
+    with db_context as db:
+        try:
+            rows = get_question_rows(db, **params.query_kwargs())
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        return page.respond(rows, get_question_total(db), is_stale_session(db))
+
+
+# 동작: /questions/{question_id}보다 먼저 등록해야 'changes'가 question_id로 해석되지 않습니다.
+@router.get('/questions/changes', response_model=ApiResponse)
+@allow_stale_reads
+def get_question_changes_endpoint(
+    since: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    # get_read_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_read_db)
+) -> Response:
+    """
+    since 커서 이후에 생성, 수정, 삭제된 질문을 커밋 순서로 조회합니다. (동기화용 변경 피드)
+    
+    클라이언트는 처음에 since 없이 호출해 전체를 받고, 이후에는 응답의 next_cursor를
+    since로 넘겨 그 뒤의 변경만 받습니다. has_more가 true이면 바로 다시 호출합니다.
+    삭제된 질문은 deleted가 true인 항목으로 전달되므로 로컬 사본에서 지우면 됩니다.
+    
+    change_seq 인덱스에서 커서 다음 위치부터 읽으므로 응답 크기와 조회 비용은
+    게시판 전체 크기가 아니라 바뀐 질문 수에 비례합니다.
+    
+    Args:
+        since: 이전 응답의 next_cursor 값 (없으면 처음부터)
+        limit: 최대 조회할 변경 수 (1 이상 BOARD_MAX_PAGE_SIZE 이하)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+        
+    Returns:
+        변경 목록(changes), has_more, next_cursor를 포함한 응답
+        
+    Raises:
+        HTTPException: since 형식이 올바르지 않은 경우 400 에러
+    """
+    with db_context as db:
+        try:
+            # 동작: 한 개 더 조회해 뒤에 변경이 더 있는지(has_more) 판단합니다.
+            rows = get_question_changes(db, since=since, limit=limit + 1)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    return Response(
+        content=question_changes_body(rows, limit, since), media_type='application/json'
+    )
+
+
+# 동작: /questions/{question_id}보다 먼저 등록해야 'search'가 question_id로 해석되지 않습니다.
+@router.get('/questions/search', response_model=ApiResponse)
+@allow_stale_reads
+def search_questions_endpoint(
+    q: str,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    # get_read_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_read_db)
+) -> ApiResponse:
+    """
+    제목과 내용으로 질문을 검색합니다.
+    
+    공백으로 구분한 모든 검색어를 포함하는 질문을 관련도(bm25) 순으로 반환하며,
+    일치한 부분은 <mark> 태그로 강조한 제목과 내용 일부(snippet)를 제공합니다.
+    
+    Args:
+        q: 검색어
+        limit: 최대 조회할 결과 수 (1 이상 BOARD_MAX_PAGE_SIZE 이하)
+        cursor: 이전 응답의 next_cursor 값
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+        
+    Returns:
+        검색 결과를 포함한 응답
+        
+    Raises:
+        HTTPException: 검색어가 비어 있거나 cursor 형식이 올바르지 않은 경우 400 에러
+    """
+    from domain.question.search import search_questions
+    
+    with db_context as db:
+        try:
+            result = search_questions(db, q, limit=limit, cursor=cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        
+        return ApiResponse(
+            status='success',
+            data={
+                'questions': [
+                    {
+                        'id': r['id'],
+                        'subject': r['subject'],
+                        'snippet': r['snippet'],
+                        'create_date': r['create_date'].isoformat(),
+                        'rank': r['rank']
+                    }
+                    for r in result['results']
+                ],
+                'count': len(result['results']),
+                'next_cursor': result['next_cursor']
+            }
+        )
+
+
+# 동작: /questions/{question_id}보다 먼저 등록해야 'export'가 question_id로 해석되지 않습니다.
+@router.get('/questions/export')
+@allow_stale_reads
+def export_questions_endpoint(
+    export_format: Literal['ndjson', 'csv'] = Query('ndjson', alias='format'),
+    since: Optional[datetime] = None,
+    # get_read_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_read_db)
+) -> StreamingResponse:
+    """
+    질문 전체를 NDJSON 또는 CSV 파일로 내보냅니다.
+    
+    행을 DB 커서에서 EXPORT_BATCH_SIZE개씩 읽어 변환하는 즉시 전송하므로,
+    테이블 크기와 관계없이 서버 메모리 사용량이 일정합니다.
+    
+    Args:
+        export_format: 내보내기 형식 ('ndjson' 또는 'csv', 쿼리 파라미터 이름은 format)
+        since: 지정하면 create_date가 이 시각 이후인 질문만 내보냄 (ISO 8601)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+        
+    Returns:
+        질문 데이터를 스트리밍하는 응답
+    """
+    from domain.question.export import MEDIA_TYPES, export_questions
+    
+    def stream():
+        # 동작: 응답 본문은 이 함수가 반환된 뒤에 전송되므로, 세션도 본문을
+        # 만드는 제너레이터 안에서 열고 전송이 끝나면 닫습니다.
+        with db_context as db:
+            yield from export_questions(
+                db, export_format, since=since, batch_size=EXPORT_BATCH_SIZE
+            )
+    
+    return StreamingResponse(
+        stream(),
+        media_type=MEDIA_TYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="questions.{export_format}"'}
+    )
+
+
 @router.get('/questions/{question_id}', response_model=ApiResponse)
 def get_question_endpoint(
     question_id: int,
-    db: Session = Depends(get_db)
+    response: Response,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    # get_read_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_read_db)
 ) -> ApiResponse:
     """
     특정 ID의 질문을 조회합니다.
     
+    응답에는 행 버전으로 만든 ETag가 붙습니다. If-None-Match가 오면 버전 컬럼만
+    조회해 비교하고, 일치하면 행 전체를 읽지 않고 304 Not Modified로 응답합니다.
+    
     Args:
         question_id: 조회할 질문의 ID
-        db: 데이터베이스 세션 (의존성 주입)
+        response: 응답 객체 (ETag 헤더 설정용)
+        fields: 응답에 포함할 필드 (쉼표로 구분). 생략하면 모든 필드
+        if_none_match: 클라이언트가 가진 응답의 ETag (If-None-Match 헤더)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
         
     Returns:
         질문 정보를 포함한 응답
         
     Raises:
-        HTTPException: 질문을 찾을 수 없는 경우 404 에러
+        HTTPException: 질문을 찾을 수 없는 경우 404 에러, fields 형식이 올바르지 않은 경우 400 에러
     """
-    db_question = get_question(db, question_id)
-    if db_question is None:
-        raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
-    
-    return ApiResponse(
-        status='success',
-        data={
-            'id': db_question.id,
-            'subject': db_question.subject,
-            'content': db_question.content,
-            'create_date': db_question.create_date.isoformat()
-        }
-    )
+    try:
+        selected = parse_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+        
+    with db_context as db:
+        if if_none_match is not None:
+            current_version = get_question_version(db, question_id)
+            if current_version is None:
+                raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
+            etag = question_etag(question_id, current_version)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={'ETag': etag})
+        
+        # 동작: 요청한 컬럼과 ETag용 version만 조회합니다.
+        row = get_question_fields(db, question_id, selected)
+        if row is None:
+            raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
+        
+        response.headers['ETag'] = question_etag(question_id, row.version)
+        return ApiResponse(status='success', data=question_dict(row, selected))
 
 
 @router.put('/questions/{question_id}', response_model=ApiResponse)
 def update_question_endpoint(
     question_id: int,
     question_update: QuestionUpdate,
-    db: Session = Depends(get_db)
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    # get_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_db)
 ) -> ApiResponse:
     """
     특정 ID의 질문을 수정합니다.
     
+    If-Match 헤더에 조회 시 받은 ETag를 넣으면, 그 사이에 다른 요청이 질문을
+    수정한 경우 덮어쓰지 않고 412 Precondition Failed로 응답합니다 (낙관적 동시성 제어).
+    
     Args:
         question_id: 수정할 질문의 ID
         question_update: 수정할 내용
-        db: 데이터베이스 세션 (의존성 주입)
+        response: 응답 객체 (ETag 헤더 설정용)
+        if_match: 수정 전 질문의 ETag (If-Match 헤더)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
         
     Returns:
         수정된 질문 정보를 포함한 응답
         
     Raises:
-        HTTPException: 질문을 찾을 수 없는 경우 404 에러
+        HTTPException: 질문을 찾을 수 없는 경우 404 에러,
+            If-Match의 버전이 현재 버전과 다른 경우 412 에러
     """
-    db_question = update_question(db, question_id, question_update)
-    if db_question is None:
-        raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
-    
-    return ApiResponse(
-        status='success',
-        message='질문이 성공적으로 수정되었습니다.',
-        data={
-            'id': db_question.id,
-            'subject': db_question.subject,
-            'content': db_question.content,
-            'create_date': db_question.create_date.isoformat()
-        }
-    )
+    with db_context as db:
+        expected_version = None
+        if if_match is not None:
+            versions = parse_if_match_versions(if_match, question_id)
+            if versions is not None and len(versions) == 1:
+                # 동작: ETag가 하나면 버전 확인을 UPDATE 문의 WHERE 조건으로 처리합니다.
+                expected_version = next(iter(versions))
+            elif versions is not None:
+                current_version = get_question_version(db, question_id)
+                if current_version is None:
+                    raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
+                if current_version not in versions:
+                    raise HTTPException(status_code=412, detail='질문이 이미 다른 요청으로 수정되었습니다.')
+                expected_version = current_version
+        
+        try:
+            db_question = update_question(
+                db, question_id, question_update, expected_version=expected_version
+            )
+        except VersionConflictError as exc:
+            raise HTTPException(status_code=412, detail=str(exc))
+        if db_question is None:
+            raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
+        
+        response.headers['ETag'] = question_etag(db_question.id, db_question.version)
+        return ApiResponse(
+            status='success',
+            message='질문이 성공적으로 수정되었습니다.',
+            data={
+                'id': db_question.id,
+                'subject': db_question.subject,
+                'content': db_question.content,
+                'create_date': db_question.create_date.isoformat()
+            }
+        )
 
 
 @router.delete('/questions/{question_id}', response_model=ApiResponse)
 def delete_question_endpoint(
     question_id: int,
-    db: Session = Depends(get_db)
+    # get_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    db_context = Depends(get_db)
 ) -> ApiResponse:
     """
     특정 ID의 질문을 삭제합니다.
     
     Args:
         question_id: 삭제할 질문의 ID
-        db: 데이터베이스 세션 (의존성 주입)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
         
     Returns:
         삭제 성공 메시지를 포함한 응답
@@ -175,7 +551,8 @@ def delete_question_endpoint(
     Raises:
         HTTPException: 질문을 찾을 수 없는 경우 404 에러
     """
-    success = delete_question(db, question_id)
+    with db_context as db:
+        success = delete_question(db, question_id)
     if not success:
         raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
     
@@ -0,0 +1,249 @@
+"""
+FastAPI 비동기 라우터 정의
+
+api.py의 질문(Question) CRUD 엔드포인트를 async def로 정의합니다.
+BOARD_DB_MODE=async 일 때 main.py가 api.py보다 먼저 등록하므로 같은 경로의
+요청은 이 라우터가 처리하고, 스레드풀 워커를 점유하지 않습니다.
+"""
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Header, Response
+from typing import Optional
+from cache import question_etag, etag_matches, parse_if_match_versions
+from database import allow_stale_reads, get_async_db, is_stale_session
+from schemas import QuestionCreate, QuestionUpdate, ApiResponse, QuestionListApiResponse
+from domain.question.async_service import (
+    create_question,
+    get_question_fields,
+    get_question_version,
+    get_question_rows,
+    get_question_total,
+    update_question,
+    delete_question
+)
+from domain.question.service import VersionConflictError
+from domain.question.group_commit import WriterBusyError, question_writer
+from domain.question.listing import ListPage, ListParams, list_params
+from domain.question.serialization import parse_fields, question_dict
+
+router = APIRouter()
+
+
+@router.post('/questions', response_model=ApiResponse, status_code=201)
+async def create_question_endpoint(
+    question: QuestionCreate,
+    db_context = Depends(get_async_db)
+) -> ApiResponse:
+    """
+    새로운 질문을 생성합니다.
+
+    Args:
+        question: 생성할 질문 정보
+        db_context: 비동기 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+
+    Returns:
+        생성된 질문 정보를 포함한 응답
+
+    Raises:
+        HTTPException: 그룹 커밋 큐가 가득 찬 경우 503 에러
+    """
+    if question_writer is not None:
+        # 동작: 쓰기 스레드의 Future를 이벤트 루프에서 기다립니다.
+        try:
+            db_question = await asyncio.wrap_future(question_writer.submit(question))
+        except WriterBusyError as exc:
+            raise HTTPException(status_code=503, detail=str(exc), headers={'Retry-After': '1'})
+    else:
+        async with db_context as db:
+            db_question = await create_question(db, question)
+    return ApiResponse(
+        status='success',
+        message='질문이 성공적으로 생성되었습니다.',
+        data={
+            'id': db_question.id,
+            'subject': db_question.subject,
+            'content': db_question.content,
+            'create_date': db_question.create_date.isoformat()
+        }
+    )
+
+
+@router.get('/questions', response_model=QuestionListApiResponse)
+@allow_stale_reads
+async def get_questions_endpoint(
+    params: ListParams = Depends(list_params),
+    if_none_match: Optional[str] = Header(None),
+    db_context = Depends(get_async_db)
+) -> ApiResponse:
+    """
+    질문 목록을 조회합니다.
+
+    파라미터, 캐시, ETag와 304 처리 규칙은 api.get_questions_endpoint와 같습니다.
+
+    Args:
+        params: 목록 조회 파라미터 (domain.question.listing.list_params 참고)
+        if_none_match: 클라이언트가 가진 응답의 ETag (If-None-Match 헤더)
+        db_context: 비동기 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+
+    Returns:
+        질문 목록을 포함한 응답
+
+    Raises:
+        HTTPException: cursor 또는 fields 형식이 올바르지 않은 경우 400 에러
+    """
+    page = ListPage(params, if_none_match)
+    response = page.cached_response()
+    if response is not None:
+        return response
+
+    async with db_context as db:
+        try:
+            rows = await get_question_rows(db, **params.query_kwargs())
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        return page.respond(rows, await get_question_total(db), is_stale_session(db))
+
+
+# 동작: {question_id:int} 변환기를 사용해 숫자 경로만 매칭합니다.
+# 이 라우터는 api.py보다 먼저 등록되므로, 그렇지 않으면 /questions/<다른 경로>
+# 요청까지 가로채게 됩니다.
+@router.get('/questions/{question_id:int}', response_model=ApiResponse)
+async def get_question_endpoint(
+    question_id: int,
+    response: Response,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db_context = Depends(get_async_db)
+) -> ApiResponse:
+    """
+    특정 ID의 질문을 조회합니다.
+
+    ETag와 304 처리 규칙은 api.get_question_endpoint와 같습니다.
+
+    Args:
+        question_id: 조회할 질문의 ID
+        response: 응답 객체 (ETag 헤더 설정용)
+        fields: 응답에 포함할 필드 (쉼표로 구분). 생략하면 모든 필드
+        if_none_match: 클라이언트가 가진 응답의 ETag (If-None-Match 헤더)
+        db_context: 비동기 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+
+    Returns:
+        질문 정보를 포함한 응답
+
+    Raises:
+        HTTPException: 질문을 찾을 수 없는 경우 404 에러, fields 형식이 올바르지 않은 경우 400 에러
+    """
+    try:
+        selected = parse_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    async with db_context as db:
+        if if_none_match is not None:
+            current_version = await get_question_version(db, question_id)
+            if current_version is None:
+                raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
+            etag = question_etag(question_id, current_version)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={'ETag': etag})
+
+        # 동작: 요청한 컬럼과 ETag용 version만 조회합니다.
+        row = await get_question_fields(db, question_id, selected)
+        if row is None:
+            raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
+
+        response.headers['ETag'] = question_etag(question_id, row.version)
+        return ApiResponse(status='success', data=question_dict(row, selected))
+
+
+@router.put('/questions/{question_id:int}', response_model=ApiResponse)
+async def update_question_endpoint(
+    question_id: int,
+    question_update: QuestionUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db_context = Depends(get_async_db)
+) -> ApiResponse:
+    """
+    특정 ID의 질문을 수정합니다.
+
+    If-Match 처리 규칙은 api.update_question_endpoint와 같습니다.
+
+    Args:
+        question_id: 수정할 질문의 ID
+        question_update: 수정할 내용
+        response: 응답 객체 (ETag 헤더 설정용)
+        if_match: 수정 전 질문의 ETag (If-Match 헤더)
+        db_context: 비동기 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+
+    Returns:
+        수정된 질문 정보를 포함한 응답
+
+    Raises:
+        HTTPException: 질문을 찾을 수 없는 경우 404 에러,
+            If-Match의 버전이 현재 버전과 다른 경우 412 에러
+    """
+    async with db_context as db:
+        expected_version = None
+        if if_match is not None:
+            versions = parse_if_match_versions(if_match, question_id)
+            if versions is not None and len(versions) == 1:
+                # 동작: ETag가 하나면 버전 확인을 UPDATE 문의 WHERE 조건으로 처리합니다.
+                expected_version = next(iter(versions))
+            elif versions is not None:
+                current_version = await get_question_version(db, question_id)
+                if current_version is None:
+                    raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
+                if current_version not in versions:
+                    raise HTTPException(status_code=412, detail='질문이 이미 다른 요청으로 수정되었습니다.')
+                expected_version = current_version
+
+        try:
+            db_question = await update_question(
+                db, question_id, question_update, expected_version=expected_version
+            )
+        except VersionConflictError as exc:
+            raise HTTPException(status_code=412, detail=str(exc))
+        if db_question is None:
+            raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
+
+        response.headers['ETag'] = question_etag(db_question.id, db_question.version)
+
+        return ApiResponse(
+            status='success',
+            message='질문이 성공적으로 수정되었습니다.',
+            data={
+                'id': db_question.id,
+                'subject': db_question.subject,
+                'content': db_question.content,
+                'create_date': db_question.create_date.isoformat()
+            }
+        )
+
+
+@router.delete('/questions/{question_id:int}', response_model=ApiResponse)
+async def delete_question_endpoint(
+    question_id: int,
+    db_context = Depends(get_async_db)
+) -> ApiResponse:
+    """
+    특정 ID의 질문을 삭제합니다.
+
+    Args:
+        question_id: 삭제할 질문의 ID
+        db_context: 비동기 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+
+    Returns:
+        삭제 성공 메시지를 포함한 응답
+
+    Raises:
+        HTTPException: 질문을 찾을 수 없는 경우 404 에러
+    """
+    async with db_context as db:
+        success = await delete_question(db, question_id)
+    if not success:
+        raise HTTPException(status_code=404, detail='질문을 찾을 수 없습니다.')
+
+    return ApiResponse(
+        status='success',
+        message='질문이 성공적으로 삭제되었습니다.'
+    )
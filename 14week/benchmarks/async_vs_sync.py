@@ -0,0 +1,152 @@
+"""
+동기/비동기 DB 모드 비교 벤치마크
+
+BOARD_DB_MODE=sync 와 BOARD_DB_MODE=async 로 각각 앱을 띄워
+동시 클라이언트 수(기본 100, 500, 1000)별 처리량과 지연 시간을 비교합니다.
+
+각 측정은 별도 프로세스에서 임시 SQLite 파일을 사용해 실행되며,
+httpx의 ASGITransport로 네트워크 없이 앱을 직접 호출합니다.
+동기 라우트는 실제 서버와 마찬가지로 anyio 스레드풀을 통해 실행됩니다.
+
+실행 방법 (14week 디렉터리에서):
+    python benchmarks/async_vs_sync.py
+    python benchmarks/async_vs_sync.py --clients 100,500 --requests 10 --json result.json
+
+필요 패키지: httpx, aiosqlite
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(values, pct):
+    """정렬된 값 목록에서 백분위 값을 계산합니다."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def run_clients(app, clients, requests_per_client, max_id):
+    """동시 클라이언트를 실행하고 요청별 지연 시간(초)을 수집합니다."""
+    import httpx
+
+    latencies = []
+    errors = 0
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+
+        async def one_client():
+            nonlocal errors
+            for _ in range(requests_per_client):
+                if random.random() < 0.5:
+                    url = '/questions?limit=20'
+                else:
+                    url = f'/questions/{random.randint(1, max_id)}'
+                started = time.perf_counter()
+                response = await client.get(url)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_client() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+def worker(args):
+    """환경 변수로 지정된 모드의 앱을 import해 한 번 측정하고 결과를 JSON으로 출력합니다."""
+    sys.path.insert(0, APP_DIR)
+    import contextlib
+    import io
+    from sqlalchemy import insert
+    from database import engine, dispose_async_engines
+    from migrations import upgrade
+    from models import Question
+    from main import app
+
+    upgrade(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Question), [
+            {'subject': f'subject {i}', 'content': f'content {i}'}
+            for i in range(args.rows)
+        ])
+
+    # 동작: get_db의 세션 로그가 결과 JSON과 섞이지 않도록 측정 중 stdout을 버립니다.
+    async def measure():
+        try:
+            return await run_clients(app, args.clients, args.requests, args.rows)
+        finally:
+            # 동작: aiosqlite 연결 스레드가 남아 프로세스가 종료되지 않는 것을 막습니다.
+            await dispose_async_engines()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        latencies, errors, elapsed = asyncio.run(measure())
+    latencies.sort()
+    print(json.dumps({
+        'mode': os.environ['BOARD_DB_MODE'],
+        'clients': args.clients,
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'mean_ms': round(statistics.mean(latencies) * 1000, 2),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='동기/비동기 DB 모드 비교 벤치마크')
+    parser.add_argument('--clients', default='100,500,1000', help='동시 클라이언트 수 목록 (쉼표 구분)')
+    parser.add_argument('--requests', type=int, default=5, help='클라이언트당 요청 수')
+    parser.add_argument('--rows', type=int, default=1000, help='미리 생성할 질문 수')
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        args.clients = int(args.clients)
+        worker(args)
+        return
+
+    results = []
+    for clients in [int(c) for c in args.clients.split(',')]:
+        for mode in ('sync', 'async'):
+            with tempfile.TemporaryDirectory() as tmp:
+                env = dict(
+                    os.environ,
+                    BOARD_DB_MODE=mode,
+                    BOARD_DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                )
+                completed = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), '--worker',
+                     '--clients', str(clients), '--requests', str(args.requests),
+                     '--rows', str(args.rows)],
+                    cwd=tmp, env=env, capture_output=True, text=True, check=True,
+                )
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            results.append(result)
+            print(
+                f"{mode:>5} clients={clients:<5} rps={result['throughput_rps']:<8} "
+                f"p50={result['p50_ms']}ms p95={result['p95_ms']}ms "
+                f"p99={result['p99_ms']}ms errors={result['errors']}"
+            )
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+단건 등록과 대량 등록의 처리량 비교 벤치마크
+
+POST /questions를 한 건씩 호출할 때와 POST /questions/bulk로 한 번에 보낼 때의
+초당 저장 행 수(rows/sec)를 비교합니다. 임시 SQLite 파일을 사용합니다.
+
+실행 방법 (14week 디렉터리에서):
+    python benchmarks/bulk_insert.py
+    python benchmarks/bulk_insert.py --single 500 --bulk 20000 --batch-size 2000
+
+필요 패키지: httpx
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def measure(app, single_rows, bulk_rows, content):
+    """단건/대량 등록의 rows/sec를 측정합니다."""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        started = time.perf_counter()
+        for i in range(single_rows):
+            response = await client.post('/questions', json={'subject': f'single {i}', 'content': content})
+            response.raise_for_status()
+        single_rps = single_rows / (time.perf_counter() - started)
+
+        payload = [{'subject': f'bulk {i}', 'content': content} for i in range(bulk_rows)]
+        started = time.perf_counter()
+        response = await client.post('/questions/bulk', json=payload)
+        response.raise_for_status()
+        bulk_rps = bulk_rows / (time.perf_counter() - started)
+    return single_rps, bulk_rps
+
+
+def main():
+    parser = argparse.ArgumentParser(description='단건/대량 등록 처리량 비교')
+    parser.add_argument('--single', type=int, default=300, help='단건 등록 횟수')
+    parser.add_argument('--bulk', type=int, default=10000, help='대량 등록 항목 수')
+    parser.add_argument('--batch-size', type=int, default=1000, help='BOARD_BULK_BATCH_SIZE 값')
+    parser.add_argument('--content-length', type=int, default=200, help='질문 내용 길이')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ['BOARD_DATABASE_URL'] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+    os.environ['BOARD_BULK_BATCH_SIZE'] = str(args.batch_size)
+    os.environ['BOARD_BULK_MAX_ITEMS'] = str(max(args.bulk, 1))
+    sys.path.insert(0, APP_DIR)
+    from database import engine
+    from migrations import upgrade
+    from main import app
+
+    upgrade(engine)
+    # 동작: get_db의 세션 로그가 결과 출력과 섞이지 않도록 측정 중 stdout을 버립니다.
+    with contextlib.redirect_stdout(io.StringIO()):
+        single_rps, bulk_rps = asyncio.run(
+            measure(app, args.single, args.bulk, 'x' * args.content_length)
+        )
+    print(f'single: {single_rps:,.0f} rows/sec ({args.single} requests)')
+    print(f'bulk:   {bulk_rps:,.0f} rows/sec ({args.bulk} rows, batch {args.batch_size})')
+    print(f'speedup: {bulk_rps / single_rps:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
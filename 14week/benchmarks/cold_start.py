@@ -0,0 +1,174 @@
+"""
+콜드 스타트 측정
+
+python main.py로 서버 프로세스를 새로 띄운 시점부터 다음 시점까지의 시간을 측정합니다.
+
+- first_request: --path(기본 /questions?limit=20)가 처음으로 200을 반환한 시점
+- ready: GET /ready가 200을 반환한 시점 (DB 예열 완료)
+
+각 실행이 끝나면 앱이 기록한 단계별 시간(GET /debug/startup)을 함께 출력합니다.
+같은 DB 파일로 여러 번 실행하므로, 첫 실행은 스키마를 만들고(schema=upgraded)
+이후 실행은 저장된 스키마 지문으로 create_all을 건너뜁니다(schema=current).
+
+--importtime을 주면 python -X importtime으로 main을 import해 최상위 패키지별
+누적 import 시간을 큰 순서로 출력합니다.
+
+실행 방법 (14week 디렉터리에서):
+    python benchmarks/cold_start.py
+    python benchmarks/cold_start.py --runs 10 --database /tmp/seed/14week-100000.db
+    python benchmarks/cold_start.py --importtime
+"""
+import argparse
+import http.client
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(BENCH_DIR)
+# 동작: 서버가 응답할 때까지 요청을 다시 보내는 간격(초)
+POLL_INTERVAL = 0.005
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _get(port, path):
+    """GET 요청을 보내고 (상태 코드, 본문)을 반환합니다. 연결할 수 없으면 (None, None)을 반환합니다."""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    try:
+        conn.request('GET', path)
+        response = conn.getresponse()
+        return response.status, response.read()
+    except OSError:
+        return None, None
+    finally:
+        conn.close()
+
+
+def _wait_for(port, path, server, started, timeout):
+    """path가 200을 반환할 때까지 기다리고 started부터의 경과 시간(초)을 반환합니다."""
+    while time.perf_counter() - started < timeout:
+        if server.poll() is not None:
+            raise RuntimeError(f'서버가 종료되었습니다 (exit code {server.returncode}).')
+        status, _ = _get(port, path)
+        if status == 200:
+            return time.perf_counter() - started
+        time.sleep(POLL_INTERVAL)
+    raise RuntimeError(f'{path}가 {timeout}초 안에 200을 반환하지 않았습니다.')
+
+
+def run_once(database_path, path, timeout):
+    """
+    서버를 한 번 띄워 첫 요청/준비 완료까지의 시간과 앱의 단계별 시간을 측정합니다.
+
+    Returns:
+        first_request_ms, ready_ms, startup(앱이 보고한 단계별 시간)을 담은 딕셔너리
+    """
+    port = _free_port()
+    env = dict(os.environ)
+    env['BOARD_DATABASE_URL'] = f'sqlite:///{database_path}'
+    env['BOARD_HOST'] = '127.0.0.1'
+    env['BOARD_PORT'] = str(port)
+    env['BOARD_WORKERS'] = '1'
+    env.pop('BOARD_ASYNC_DATABASE_URL', None)
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(APP_DIR, 'main.py')],
+        cwd=APP_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        first_request = _wait_for(port, path, server, started, timeout)
+        ready = _wait_for(port, '/ready', server, started, timeout)
+        _, body = _get(port, '/debug/startup')
+        return {
+            'first_request_ms': round(first_request * 1000, 1),
+            'ready_ms': round(ready * 1000, 1),
+            'startup': json.loads(body)['data'],
+        }
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def import_breakdown(top):
+    """
+    python -X importtime으로 main을 import해 최상위 패키지별 누적 import 시간을 반환합니다.
+
+    Returns:
+        (패키지 이름, ms) 목록 (큰 순서로 top개)과 전체 ms
+    """
+    command = [sys.executable, '-X', 'importtime', '-c', 'import main']
+    env = {**os.environ, 'PYTHONPATH': APP_DIR}
+    # 동작: 첫 import는 .pyc 컴파일 시간이 섞이므로 한 번 버리고 다시 측정합니다.
+    subprocess.run(command, cwd=APP_DIR, capture_output=True, check=True, env=env)
+    result = subprocess.run(command, cwd=APP_DIR, capture_output=True, text=True, check=True, env=env)
+    totals = Counter()
+    overall = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, self_us, name = line[len('import time:'):].split('|')
+        # 동작: 자기 자신의 시간(self)만 최상위 패키지별로 더해 중복 집계를 피합니다.
+        package = name.strip().split('.')[0]
+        totals[package] += int(self_us)
+        overall += int(self_us)
+    return [(name, us / 1000) for name, us in totals.most_common(top)], overall / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='서버 콜드 스타트 시간 측정')
+    parser.add_argument('--runs', type=int, default=5, help='서버를 띄울 횟수')
+    parser.add_argument('--database', help='복사해서 사용할 DB 파일 (생략하면 빈 DB)')
+    parser.add_argument('--path', default='/questions?limit=20', help='첫 요청으로 보낼 경로')
+    parser.add_argument('--timeout', type=float, default=60.0, help='실행당 최대 대기 시간(초)')
+    parser.add_argument('--importtime', action='store_true', help='패키지별 import 시간 출력')
+    parser.add_argument('--top', type=int, default=15, help='--importtime에서 출력할 패키지 수')
+    args = parser.parse_args()
+
+    if args.importtime:
+        packages, overall = import_breakdown(args.top)
+        print(f'import main: {overall:.1f}ms (self time 합계)')
+        for name, ms in packages:
+            print(f'  {name:<28}{ms:>8.1f}ms')
+        print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_path = os.path.join(tmp, 'board.db')
+        if args.database:
+            shutil.copyfile(args.database, database_path)
+        results = []
+        for number in range(1, args.runs + 1):
+            result = run_once(database_path, args.path, args.timeout)
+            results.append(result)
+            startup = result['startup']
+            phases = ', '.join(f'{name}={ms}' for name, ms in startup['phases_ms'].items())
+            print(
+                f"run {number}: first_request={result['first_request_ms']}ms "
+                f"ready={result['ready_ms']}ms schema={startup['details'].get('schema')}"
+            )
+            print(f'  phases(ms): {phases}')
+
+    warm = [r for r in results if r['startup']['details'].get('schema') == 'current'] or results
+    print(
+        f"median (schema=current, {len(warm)} runs): "
+        f"first_request={statistics.median(r['first_request_ms'] for r in warm):.1f}ms "
+        f"ready={statistics.median(r['ready_ms'] for r in warm):.1f}ms"
+    )
+
+
+if __name__ == '__main__':
+    main()
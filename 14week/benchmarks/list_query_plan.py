@@ -0,0 +1,174 @@
+"""
+질문 목록 조회의 실행 계획 확인
+
+GET /questions, GET /api/question/list가 실행하는 목록 SELECT 문(build_list_query)을
+작성일시 범위(created_after/created_before), 정렬(order=asc|desc), 커서 조합마다 만들어
+EXPLAIN QUERY PLAN으로 실행 계획을 확인합니다. 다음 중 하나라도 해당하면 실패로 표시하고
+종료 코드 1로 끝나므로 CI나 배포 전 점검에 그대로 쓸 수 있습니다.
+같은 확인(check_plans)을 tests/test_list_query_plan.py가 작은 임시 DB로 실행합니다.
+
+- 인덱스 없는 전체 테이블 스캔 (SCAN question)
+- ix_question_live_create_date_id 인덱스를 쓰지 않음
+- 정렬을 위해 임시 B-tree를 만듦 (USE TEMP B-TREE FOR ORDER BY)
+- 범위나 커서가 있는데 인덱스 범위 탐색(SEARCH)이 아님
+
+--database를 주지 않으면 임시 SQLite 파일에 최신 스키마를 만들고 --rows개의 질문
+(10%는 삭제 표시)을 넣은 뒤 확인합니다. --database를 주면 그 파일의 스키마를 바꾸지 않고
+실행 계획만 확인합니다 (--analyze를 주면 통계 테이블만 갱신).
+
+실행 방법 (14week 디렉터리에서):
+    python benchmarks/list_query_plan.py
+    python benchmarks/list_query_plan.py --rows 100000 --analyze
+    python benchmarks/list_query_plan.py --database board.db
+"""
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIST_INDEX = 'ix_question_live_create_date_id'
+
+
+def seed(engine, rows):
+    """질문 rows개를 1분 간격의 작성일시로 넣고 10개 중 1개는 삭제 표시합니다."""
+    from sqlalchemy import insert
+    from models import Question
+
+    started = datetime(2024, 1, 1)
+    values = [
+        {
+            'subject': f'subject {i}',
+            'content': f'content {i}',
+            'create_date': started + timedelta(minutes=i),
+            'deleted_at': started if i % 10 == 0 else None,
+        }
+        for i in range(rows)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Question), values)
+
+
+def explain(conn, stmt):
+    """
+    SQLAlchemy가 실제로 보내는 SQL과 바인드 값 그대로 EXPLAIN QUERY PLAN을 실행합니다.
+
+    문장을 한 번 실행하면서 before_cursor_execute 이벤트로 SQL과 바인드 값을 가져옵니다.
+
+    Returns:
+        실행 계획의 detail 문자열 목록
+    """
+    from sqlalchemy import event
+
+    captured = {}
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        captured['statement'], captured['parameters'] = statement, parameters
+
+    event.listen(conn, 'before_cursor_execute', capture)
+    try:
+        conn.execute(stmt).fetchall()
+    finally:
+        event.remove(conn, 'before_cursor_execute', capture)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute('EXPLAIN QUERY PLAN ' + captured['statement'], captured['parameters'])
+        return [row[3] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def problems(plan, ranged):
+    """실행 계획에서 문제를 찾아 설명 목록으로 반환합니다. 비어 있으면 통과입니다."""
+    found = []
+    question_steps = [detail for detail in plan if ' question ' in f' {detail} ']
+    for detail in question_steps:
+        if detail.startswith('SCAN question') and 'USING' not in detail:
+            found.append('전체 테이블 스캔')
+        if LIST_INDEX not in detail:
+            found.append(f'{LIST_INDEX} 미사용')
+        elif ranged and not detail.startswith('SEARCH'):
+            found.append('범위 탐색(SEARCH)이 아님')
+    if any('TEMP B-TREE' in detail for detail in plan):
+        found.append('정렬용 임시 B-tree')
+    return found
+
+
+def check_plans(engine):
+    """
+    정렬, 작성일시 범위, 커서, 필드의 모든 조합으로 목록 SELECT 문의 실행 계획을 확인합니다.
+
+    seed()로 넣은 데이터의 작성일시(2024-01-01부터) 안쪽을 범위와 커서로 사용합니다.
+
+    Returns:
+        조합마다 (설명, 실행 계획 detail 목록, problems() 결과) 튜플 리스트
+    """
+    from domain.question.pagination import encode_cursor
+    from domain.question.serialization import LIST_DEFAULT_FIELDS, QUESTION_FIELDS
+    from domain.question.service import build_list_query
+
+    after = datetime(2024, 1, 3)
+    before = datetime(2024, 1, 10)
+    cursor = encode_cursor(datetime(2024, 1, 5, 12), 123)
+    results = []
+    with engine.connect() as conn:
+        for order, created_after, created_before, page_cursor, fields in itertools.product(
+            ('asc', 'desc'), (None, after), (None, before), (None, cursor),
+            (LIST_DEFAULT_FIELDS, QUESTION_FIELDS),
+        ):
+            stmt = build_list_query(
+                fields, limit=20, cursor=page_cursor, created_after=created_after,
+                created_before=created_before, order=order,
+            )
+            plan = explain(conn, stmt)
+            ranged = created_after is not None or created_before is not None or page_cursor is not None
+            label = (
+                f"order={order:<4} after={'Y' if created_after else '-'} "
+                f"before={'Y' if created_before else '-'} cursor={'Y' if page_cursor else '-'} "
+                f"fields={len(fields)}"
+            )
+            results.append((label, plan, problems(plan, ranged)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='질문 목록 조회 실행 계획 확인')
+    parser.add_argument('--database', help='확인할 DB 파일 (생략하면 임시 DB를 만들어 확인)')
+    parser.add_argument('--rows', type=int, default=20000, help='임시 DB에 넣을 질문 수')
+    parser.add_argument('--analyze', action='store_true', help='확인 전에 ANALYZE로 통계를 수집')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_path = args.database or os.path.join(tmp, 'board.db')
+        os.environ['BOARD_DATABASE_URL'] = f'sqlite:///{database_path}'
+        os.environ.pop('BOARD_READ_REPLICA_URLS', None)
+        sys.path.insert(0, APP_DIR)
+        from sqlalchemy import text
+        from database import engine
+        from migrations import upgrade
+
+        if not args.database:
+            upgrade(engine)
+            seed(engine, args.rows)
+        if args.analyze:
+            with engine.begin() as conn:
+                conn.execute(text('ANALYZE'))
+
+        results = check_plans(engine)
+        for label, plan, found in results:
+            status = 'FAIL ' + ', '.join(found) if found else 'ok'
+            print(f'{label}  {status}')
+            print(f"    {' | '.join(plan)}")
+        failures = sum(bool(found) for _, _, found in results)
+        engine.dispose()
+
+    if failures:
+        print(f'{failures}개 조합에서 인덱스를 제대로 쓰지 않습니다.')
+        sys.exit(1)
+    print('모든 조합이 인덱스 탐색으로 실행됩니다.')
+
+
+if __name__ == '__main__':
+    main()
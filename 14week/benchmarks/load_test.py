@@ -0,0 +1,496 @@
+"""
+게시판 API 부하 테스트
+
+SQLite 파일에 가짜 질문을 미리 채운 뒤(기본 1만, 10만, 100만 건), api.py와
+question_router.py의 모든 엔드포인트를 동시 클라이언트로 호출해 엔드포인트별
+처리량과 p50/p95/p99 지연 시간을 JSON으로 보고합니다.
+
+- 대상 앱: --app-dir로 11week ~ 14week 중 하나를 지정합니다 (기본: 이 파일이 있는 14week).
+  엔드포인트 목록은 앱의 /openapi.json에서 확인하므로 해당 주차에 없는 엔드포인트는 건너뜁니다.
+- 실행 방식: --target asgi는 httpx의 ASGITransport로 앱을 같은 프로세스에서 호출하고,
+  --target uvicorn은 로컬 uvicorn 서버를 띄워 실제 HTTP로 호출합니다.
+- 시드 데이터: 행 수별로 한 번만 만들어 --seed-dir에 보관하고, 측정할 때마다 복사해 사용합니다.
+- 비교: --baseline으로 이전 결과 JSON을 지정하면 지표가 --threshold(%)보다 나빠진
+  항목을 출력하고 종료 코드 1로 끝납니다. --current로 이미 저장한 결과끼리만 비교할 수도 있습니다.
+
+읽기 엔드포인트를 먼저 측정하고 쓰기/삭제 엔드포인트를 나중에 측정하므로,
+앞선 쓰기가 읽기 결과(내보내기 행 수 등)에 영향을 주지 않습니다.
+
+실행 방법 (14week 디렉터리에서):
+    python benchmarks/load_test.py --rows 10000 --json result.json
+    python benchmarks/load_test.py --rows 10000,100000 --target uvicorn --concurrency 50
+    python benchmarks/load_test.py --app-dir ../12week --rows 10000
+    python benchmarks/load_test.py --rows 10000 --baseline result.json --threshold 15
+    python benchmarks/load_test.py --current new.json --baseline result.json
+
+필요 패키지: httpx (--target uvicorn은 uvicorn도 필요)
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from async_vs_sync import percentile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_APP_DIR = os.path.dirname(BENCH_DIR)
+DB_FILE = 'board.db'
+SEED_BATCH_SIZE = 10000
+# 동작: 시드 데이터의 create_date는 이 시각부터 1초씩 증가합니다.
+SEED_START = datetime(2024, 1, 1)
+# 동작: 내보내기 엔드포인트가 매 요청마다 내보낼 시드 행 수 (since 파라미터로 제한)
+EXPORT_ROWS = 1000
+# 동작: 지표 이름 -> 값이 커질 때 나빠지는지 여부
+METRIC_DIRECTIONS = {
+    'throughput_rps': False,
+    'mean_ms': True,
+    'p50_ms': True,
+    'p95_ms': True,
+    'p99_ms': True,
+}
+
+
+class Scenario:
+    """
+    엔드포인트 하나의 부하 시나리오
+
+    build(index, rows, rng)는 index번째 요청의 (URL, httpx 요청 인자)를 반환합니다.
+    """
+
+    def __init__(self, method, path, build, expected=(200,)):
+        self.method = method
+        self.path = path
+        self.build = build
+        self.expected = frozenset(expected)
+
+    @property
+    def name(self):
+        return f'{self.method} {self.path}'
+
+
+def _question_payload(index):
+    return {'subject': f'bench subject {index}', 'content': f'bench content {index}'}
+
+
+def _seed_since(rows):
+    """내보내기에서 마지막 EXPORT_ROWS개의 시드 행만 포함되도록 하는 since 값"""
+    offset = max(rows - EXPORT_ROWS, 0)
+    return (SEED_START + timedelta(seconds=offset) - timedelta(microseconds=1)).isoformat()
+
+
+def _ndjson_body(index, count=10):
+    return ''.join(
+        json.dumps(_question_payload(f'{index}-{n}'), ensure_ascii=False) + '\n'
+        for n in range(count)
+    ).encode('utf-8')
+
+
+# 동작: 삭제 시나리오는 시드의 마지막 id부터 거꾸로 한 번씩만 삭제하고,
+# 조회/수정 시나리오는 앞쪽 절반의 id만 사용해 삭제된 행을 건드리지 않습니다.
+SCENARIOS = [
+    Scenario('GET', '/questions', lambda i, rows, rng: ('/questions?limit=20', {})),
+    Scenario('GET', '/questions/search', lambda i, rows, rng: (
+        f'/questions/search?q={rng.randint(100, 999)}&limit=20', {}
+    )),
+    Scenario('GET', '/questions/export', lambda i, rows, rng: (
+        '/questions/export', {'params': {'since': _seed_since(rows)}}
+    )),
+    Scenario('GET', '/questions/{question_id}', lambda i, rows, rng: (
+        f'/questions/{rng.randint(1, max(rows // 2, 1))}', {}
+    )),
+    Scenario('GET', '/api/question/list', lambda i, rows, rng: ('/api/question/list?limit=20', {})),
+    Scenario('POST', '/questions', lambda i, rows, rng: (
+        '/questions', {'json': _question_payload(i)}
+    ), expected=(201,)),
+    Scenario('POST', '/questions/bulk', lambda i, rows, rng: (
+        '/questions/bulk', {'json': [_question_payload(f'{i}-{n}') for n in range(10)]}
+    ), expected=(201,)),
+    Scenario('POST', '/questions/import', lambda i, rows, rng: (
+        '/questions/import?format=ndjson',
+        {'content': _ndjson_body(i), 'headers': {'Content-Type': 'application/x-ndjson'}}
+    )),
+    Scenario('POST', '/api/question/create', lambda i, rows, rng: (
+        '/api/question/create', {'json': _question_payload(i)}
+    ), expected=(204,)),
+    Scenario('PUT', '/questions/{question_id}', lambda i, rows, rng: (
+        f'/questions/{rng.randint(1, max(rows // 2, 1))}', {'json': _question_payload(f'updated {i}')}
+    )),
+    Scenario('DELETE', '/questions/{question_id}', lambda i, rows, rng: (
+        f'/questions/{rows - i}', {}
+    )),
+]
+
+
+def summarize(latencies, statuses, errors, elapsed):
+    """요청별 지연 시간(초)과 상태 코드로 결과 항목을 만듭니다."""
+    latencies = sorted(latencies)
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'status_counts': {str(code): count for code, count in sorted(statuses.items())},
+        'throughput_rps': round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        'mean_ms': round(statistics.mean(latencies) * 1000, 3) if latencies else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+async def run_scenario(client, scenario, rows, requests, concurrency, warmup, seed):
+    """
+    시나리오 하나를 concurrency개의 클라이언트로 requests번 실행합니다.
+
+    워밍업 요청은 결과에 포함하지 않습니다. 요청 번호(index)는 워밍업과 측정을 통틀어
+    한 번씩만 쓰이므로 삭제 시나리오가 같은 행을 두 번 삭제하지 않습니다.
+    """
+    rng = random.Random(seed)
+    indexes = itertools.count()
+    latencies = []
+    statuses = Counter()
+    errors = 0
+
+    async def send(index, record):
+        nonlocal errors
+        url, kwargs = scenario.build(index, rows, rng)
+        started = time.perf_counter()
+        try:
+            response = await client.request(scenario.method, url, **kwargs)
+            status = response.status_code
+        except Exception:
+            status = 0
+        elapsed = time.perf_counter() - started
+        if record:
+            latencies.append(elapsed)
+            statuses[status] += 1
+            if status not in scenario.expected:
+                errors += 1
+
+    for _ in range(warmup):
+        await send(next(indexes), record=False)
+
+    remaining = iter(range(requests))
+
+    async def one_client():
+        for _ in remaining:
+            await send(next(indexes), record=True)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_client() for _ in range(concurrency)))
+    return summarize(latencies, statuses, errors, time.perf_counter() - started)
+
+
+async def run_all(client, rows, args, log):
+    """앱이 제공하는 엔드포인트만 골라 모든 시나리오를 차례로 실행합니다."""
+    response = await client.get('/openapi.json')
+    response.raise_for_status()
+    paths = response.json().get('paths', {})
+    selected = set(args.endpoints.split(',')) if args.endpoints else None
+
+    results = []
+    for number, scenario in enumerate(SCENARIOS):
+        if scenario.method.lower() not in paths.get(scenario.path, {}):
+            continue
+        if selected is not None and scenario.name not in selected:
+            continue
+        result = await run_scenario(
+            client, scenario, rows, args.requests, args.concurrency, args.warmup,
+            seed=args.seed + number
+        )
+        result = {'rows': rows, 'endpoint': scenario.name, **result}
+        results.append(result)
+        log(
+            f"rows={rows:<8} {scenario.name:<32} rps={result['throughput_rps']:<9} "
+            f"p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms "
+            f"errors={result['errors']}"
+        )
+    return results
+
+
+def _app_env(app_dir, run_dir):
+    """대상 앱이 run_dir의 DB 파일을 사용하도록 하는 환경 변수"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [app_dir, env.get('PYTHONPATH')]))
+    # 동작: 14week는 BOARD_DATABASE_URL을 읽고, 11~13week는 현재 디렉터리의 board.db를 사용합니다.
+    env['BOARD_DATABASE_URL'] = f"sqlite:///{os.path.join(run_dir, DB_FILE)}"
+    env.pop('BOARD_ASYNC_DATABASE_URL', None)
+    return env
+
+
+def _run_subprocess(extra, app_dir, run_dir):
+    """이 스크립트를 run_dir에서 대상 앱 환경으로 다시 실행합니다."""
+    subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--app-dir', app_dir] + extra,
+        cwd=run_dir, env=_app_env(app_dir, run_dir), check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def seed_worker(rows):
+    """
+    현재 디렉터리의 DB 파일에 앱의 스키마를 만들고 rows개의 질문을 채웁니다. (하위 프로세스)
+
+    앱의 시작 이벤트로 테이블, 인덱스, 트리거를 만든 뒤, ORM을 거치지 않고
+    sqlite3로 직접 넣어 100만 건도 빠르게 만듭니다.
+    """
+    from main import app
+    import database
+
+    async def start_and_stop():
+        async with app.router.lifespan_context(app):
+            pass
+
+    asyncio.run(start_and_stop())
+    database.engine.dispose()
+
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        conn.execute('PRAGMA synchronous = OFF')
+        for start in range(0, rows, SEED_BATCH_SIZE):
+            batch = range(start, min(start + SEED_BATCH_SIZE, rows))
+            with conn:
+                conn.executemany(
+                    'INSERT INTO question (subject, content, create_date) VALUES (?, ?, ?)',
+                    (
+                        (
+                            f'질문 제목 {i}',
+                            f'질문 내용 {i} ' + 'lorem ipsum ' * 10,
+                            (SEED_START + timedelta(seconds=i)).strftime('%Y-%m-%d %H:%M:%S.%f'),
+                        )
+                        for i in batch
+                    )
+                )
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    finally:
+        conn.close()
+
+
+def seeded_db(app_dir, rows, seed_dir, reseed, log):
+    """행 수별 시드 DB 파일 경로를 반환합니다. 없으면 하위 프로세스로 만듭니다."""
+    os.makedirs(seed_dir, exist_ok=True)
+    path = os.path.join(seed_dir, f'{os.path.basename(os.path.normpath(app_dir))}-{rows}.db')
+    if os.path.exists(path) and not reseed:
+        return path
+    log(f'seeding {rows} questions -> {path}')
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        _run_subprocess(['--seed-worker', '--rows', str(rows)], app_dir, tmp)
+        shutil.copyfile(os.path.join(tmp, DB_FILE), path + '.tmp')
+    os.replace(path + '.tmp', path)
+    log(f'seeded in {time.perf_counter() - started:.1f}s')
+    return path
+
+
+def asgi_worker(args, rows, result_path):
+    """현재 디렉터리의 DB로 앱을 import해 같은 프로세스에서 측정합니다. (하위 프로세스)"""
+    import httpx
+    from main import app
+
+    async def measure():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+                return await run_all(client, rows, args, lambda line: print(line, file=sys.stderr))
+
+    # 동작: 이전 주차 앱의 get_db 세션 로그가 측정 출력과 섞이지 않도록 stdout을 버립니다.
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = asyncio.run(measure())
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_until_ready(client, server, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f'uvicorn이 종료되었습니다 (exit code {server.returncode}).')
+        try:
+            if (await client.get('/openapi.json')).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError('uvicorn이 시간 안에 준비되지 않았습니다.')
+
+
+def run_uvicorn(args, rows, run_dir, log):
+    """run_dir의 DB로 로컬 uvicorn 서버를 띄우고 HTTP로 측정합니다."""
+    import httpx
+
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1',
+         '--port', str(port), '--log-level', 'warning', '--no-access-log'],
+        cwd=run_dir, env=_app_env(args.app_dir, run_dir),
+        stdout=subprocess.DEVNULL,
+    )
+
+    async def measure():
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(
+            base_url=f'http://127.0.0.1:{port}', limits=limits, timeout=60.0
+        ) as client:
+            await _wait_until_ready(client, server)
+            return await run_all(client, rows, args, log)
+
+    try:
+        return asyncio.run(measure())
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def compare(current, baseline, threshold, metrics, min_delta_ms, log):
+    """
+    현재 결과를 기준 결과와 비교해 threshold(%)보다 나빠진 항목 목록을 반환합니다.
+
+    지연 시간 지표는 차이가 min_delta_ms보다 작으면 측정 잡음으로 보고 무시합니다.
+    두 결과 중 한쪽에만 있는 (행 수, 엔드포인트)는 비교하지 않습니다.
+    """
+    baseline_index = {(r['rows'], r['endpoint']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        base = baseline_index.get((result['rows'], result['endpoint']))
+        if base is None:
+            continue
+        for metric in metrics:
+            old, new = base[metric], result[metric]
+            if not old:
+                continue
+            change = (new - old) / old * 100
+            worse = change if METRIC_DIRECTIONS[metric] else -change
+            noise = METRIC_DIRECTIONS[metric] and abs(new - old) < min_delta_ms
+            if worse > threshold and not noise:
+                regressions.append({
+                    'rows': result['rows'],
+                    'endpoint': result['endpoint'],
+                    'metric': metric,
+                    'baseline': old,
+                    'current': new,
+                    'change_pct': round(change, 1),
+                })
+    for item in regressions:
+        log(
+            f"REGRESSION rows={item['rows']} {item['endpoint']} {item['metric']}: "
+            f"{item['baseline']} -> {item['current']} ({item['change_pct']:+}%)"
+        )
+    if not regressions:
+        log(f'no regressions beyond {threshold}% ({", ".join(metrics)})')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='게시판 API 부하 테스트')
+    parser.add_argument('--app-dir', default=DEFAULT_APP_DIR, help='측정할 앱 디렉터리 (11week ~ 14week)')
+    parser.add_argument('--rows', default='10000,100000,1000000', help='시드 질문 수 목록 (쉼표 구분)')
+    parser.add_argument('--target', choices=('asgi', 'uvicorn'), default='asgi', help='앱 호출 방식')
+    parser.add_argument('--concurrency', type=int, default=20, help='동시 클라이언트 수')
+    parser.add_argument('--requests', type=int, default=300, help='엔드포인트별 측정 요청 수')
+    parser.add_argument('--warmup', type=int, default=20, help='엔드포인트별 워밍업 요청 수')
+    parser.add_argument('--endpoints', help="측정할 엔드포인트 (예: 'GET /questions,GET /questions/{question_id}')")
+    parser.add_argument('--seed', type=int, default=1, help='요청 파라미터 난수 시드')
+    parser.add_argument('--seed-dir', default=os.path.join(tempfile.gettempdir(), 'board-bench-seed'),
+                        help='시드 DB 파일을 보관할 디렉터리')
+    parser.add_argument('--reseed', action='store_true', help='보관한 시드 DB를 무시하고 다시 생성')
+    parser.add_argument('--json', default='-', help="결과 JSON 경로 ('-'이면 표준 출력)")
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--current', help='새로 측정하지 않고 이 결과 JSON을 기준과 비교')
+    parser.add_argument('--threshold', type=float, default=10.0, help='허용할 성능 저하 비율(%%)')
+    parser.add_argument('--metrics', default='throughput_rps,p95_ms',
+                        help=f"비교할 지표 (쉼표 구분, 가능한 값: {', '.join(METRIC_DIRECTIONS)})")
+    parser.add_argument('--min-delta-ms', type=float, default=0.5,
+                        help='이보다 작은 지연 시간 차이는 저하로 보지 않음')
+    parser.add_argument('--seed-worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--asgi-worker', metavar='RESULT_PATH', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    args.app_dir = os.path.abspath(args.app_dir)
+
+    def log(line):
+        print(line, file=sys.stderr, flush=True)
+
+    if args.seed_worker:
+        seed_worker(int(args.rows))
+        return
+    if args.asgi_worker:
+        asgi_worker(args, int(args.rows), args.asgi_worker)
+        return
+
+    metrics = args.metrics.split(',')
+    unknown = set(metrics) - set(METRIC_DIRECTIONS)
+    if unknown:
+        parser.error(f"알 수 없는 지표: {', '.join(sorted(unknown))}")
+
+    if args.current:
+        with open(args.current, encoding='utf-8') as f:
+            report = json.load(f)
+    else:
+        report = {
+            'meta': {
+                'app_dir': os.path.basename(args.app_dir),
+                'target': args.target,
+                'db_mode': os.environ.get('BOARD_DB_MODE', 'sync'),
+                'concurrency': args.concurrency,
+                'requests': args.requests,
+                'warmup': args.warmup,
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'started_at': datetime.now().isoformat(timespec='seconds'),
+            },
+            'results': [],
+        }
+        for rows in [int(r) for r in args.rows.split(',')]:
+            seed_path = seeded_db(args.app_dir, rows, args.seed_dir, args.reseed, log)
+            with tempfile.TemporaryDirectory() as run_dir:
+                shutil.copyfile(seed_path, os.path.join(run_dir, DB_FILE))
+                if args.target == 'uvicorn':
+                    report['results'].extend(run_uvicorn(args, rows, run_dir, log))
+                else:
+                    result_path = os.path.join(run_dir, 'result.json')
+                    extra = ['--asgi-worker', result_path, '--rows', str(rows)]
+                    for option in ('concurrency', 'requests', 'warmup', 'seed', 'endpoints'):
+                        value = getattr(args, option)
+                        if value is not None:
+                            extra += [f"--{option}", str(value)]
+                    _run_subprocess(extra, args.app_dir, run_dir)
+                    with open(result_path, encoding='utf-8') as f:
+                        report['results'].extend(json.load(f))
+
+        if args.json == '-':
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold, metrics, args.min_delta_ms, log)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
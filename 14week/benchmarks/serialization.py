@@ -0,0 +1,140 @@
+"""
+질문 목록 응답 직렬화 마이크로벤치마크
+
+한 페이지(limit개)의 목록 응답 본문을 만드는 데 드는 행당 비용을 비교합니다.
+임시 SQLite 파일을 사용하며, 결과는 마이크로초/행(us/row)입니다.
+
+- orm_pydantic: ORM 조회 + Question.model_validate + ApiResponse.model_dump_json
+  (기존 /api/question/list 방식)
+- orm_dict: ORM 조회 + isoformat()으로 만든 dict + ApiResponse.model_dump_json
+  (기존 /questions 방식)
+- rows_fast: 컬럼 행 조회 + question_list_body (현재 방식, orjson 사용)
+- rows_fast_stdlib: rows_fast와 같지만 orjson 없이 표준 json 모듈 사용
+
+각 방식은 조회와 직렬화를 합친 시간(total)과 직렬화만의 시간(serialize)을 함께 보고합니다.
+
+실행 방법 (14week 디렉터리에서):
+    python benchmarks/serialization.py
+    python benchmarks/serialization.py --limit 100 --repeat 500 --content-length 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def best_of(func, repeat):
+    """func를 repeat번 실행한 시간 중 최솟값(초)을 반환합니다."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='질문 목록 직렬화 비용 비교')
+    parser.add_argument('--limit', type=int, default=100, help='한 페이지의 질문 수')
+    parser.add_argument('--repeat', type=int, default=300, help='방식별 반복 횟수 (최솟값 사용)')
+    parser.add_argument('--content-length', type=int, default=200, help='질문 내용 길이')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ['BOARD_DATABASE_URL'] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+    sys.path.insert(0, APP_DIR)
+    from database import engine, ReadSessionLocal, SessionLocal
+    from migrations import upgrade
+    from schemas import ApiResponse, Question, QuestionCreate
+    from domain.question import serialization
+    from domain.question.pagination import next_cursor
+    from domain.question.service import (
+        create_questions_bulk,
+        get_question_rows,
+        get_questions,
+    )
+
+    upgrade(engine)
+    with SessionLocal() as db:
+        create_questions_bulk(db, [
+            QuestionCreate(subject=f'질문 {i}', content='내용' * (args.content_length // 2))
+            for i in range(args.limit)
+        ])
+
+    limit = args.limit
+    db = ReadSessionLocal()
+
+    def orm_pydantic_body(questions):
+        return ApiResponse(status='success', data={
+            'questions': [Question.model_validate(q) for q in questions],
+            'count': len(questions),
+            'total': limit,
+            'next_cursor': next_cursor(questions, limit),
+        }).model_dump_json().encode('utf-8')
+
+    def orm_dict_body(questions):
+        return ApiResponse(status='success', data={
+            'questions': [
+                {
+                    'id': q.id,
+                    'subject': q.subject,
+                    'content': q.content,
+                    'create_date': q.create_date.isoformat()
+                }
+                for q in questions
+            ],
+            'count': len(questions),
+            'total': limit,
+            'next_cursor': next_cursor(questions, limit),
+        }).model_dump_json().encode('utf-8')
+
+    def fast_body(rows):
+        return serialization.question_list_body(rows, limit, limit)
+
+    def fetch_orm():
+        # 동작: 매번 새로 조회한 ORM 객체를 쓰도록 identity map을 비웁니다.
+        db.expunge_all()
+        return get_questions(db, limit=limit)
+
+    def fetch_rows():
+        return get_question_rows(db, limit=limit)
+
+    cases = {
+        'orm_pydantic': (fetch_orm, orm_pydantic_body),
+        'orm_dict': (fetch_orm, orm_dict_body),
+        'rows_fast': (fetch_rows, fast_body),
+    }
+    results = {}
+    for name, (fetch, build) in cases.items():
+        fetched = fetch()
+        total = best_of(lambda: build(fetch()), args.repeat)
+        serialize = best_of(lambda: build(fetched), args.repeat)
+        results[name] = (total, serialize)
+
+    orjson_module = serialization.orjson
+    serialization.orjson = None
+    try:
+        fetched = fetch_rows()
+        results['rows_fast_stdlib'] = (
+            best_of(lambda: fast_body(fetch_rows()), args.repeat),
+            best_of(lambda: fast_body(fetched), args.repeat),
+        )
+    finally:
+        serialization.orjson = orjson_module
+    db.close()
+
+    assert orm_dict_body(fetch_orm()) == fast_body(fetch_rows()), '응답 본문이 서로 다릅니다.'
+
+    print(f'limit={limit}, content_length={args.content_length}, orjson={orjson_module is not None}')
+    print(f"{'case':<18}{'total us/row':>14}{'serialize us/row':>18}")
+    for name, (total, serialize) in results.items():
+        print(f'{name:<18}{total * 1e6 / limit:>14.2f}{serialize * 1e6 / limit:>18.2f}')
+    baseline = results['orm_pydantic'][0]
+    print(f"speedup (total, orm_pydantic -> rows_fast): {baseline / results['rows_fast'][0]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
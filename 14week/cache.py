@@ -0,0 +1,253 @@
+"""
+응답 캐시 모듈
+
+질문 목록처럼 자주 조회되는 응답의 직렬화된 JSON 본문을 프로세스 메모리에 보관합니다.
+
+캐시 키에는 전역 데이터 버전이 포함됩니다. 질문을 생성/수정/삭제하는 서비스 함수가
+bump_data_version()으로 버전을 올리면 이후 요청은 새 키로 조회하므로 이전 응답은
+더 이상 사용되지 않고, 보관 중인 항목도 함께 비워집니다.
+
+같은 버전 정보로 HTTP 조건부 요청(ETag, If-None-Match, If-Match)도 처리합니다.
+compression.py가 압축한 응답의 ETag에는 인코딩 이름이 붙으며(encoded_etag), 조건부 요청을
+비교할 때는 이 접미사를 떼고 비교하므로 압축 여부와 관계없이 같은 버전으로 취급합니다.
+"""
+import multiprocessing
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Hashable, Optional, Set
+from config import (
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_MAX_BYTES,
+)
+
+
+class ResponseCache:
+    """
+    크기 제한이 있는 LRU 응답 캐시
+
+    항목 수와 본문 총 크기 중 하나라도 한도를 넘으면 가장 오래 사용되지 않은
+    항목부터 제거합니다. 스레드풀의 여러 요청이 동시에 접근하므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, enabled: bool = True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._entries: 'OrderedDict[Hashable, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """키에 해당하는 본문을 반환하고 최근 사용으로 표시합니다. 없으면 None."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, key: Hashable, body: bytes) -> None:
+        """본문을 저장하고 한도를 넘는 오래된 항목을 제거합니다."""
+        if not self.enabled or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = body
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """캐시 적중/실패 횟수와 현재 사용량을 반환합니다."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+
+# 동작: 질문 목록 응답(GET /questions, GET /api/question/list)을 보관하는 캐시
+# compression.py가 같은 응답을 압축한 본문도 인코딩별로 함께 보관합니다.
+list_cache = ResponseCache(
+    RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_MAX_BYTES, enabled=RESPONSE_CACHE_ENABLED
+)
+
+class _LocalCounter:
+    """multiprocessing.Value를 만들 수 없는 환경에서 쓰는 프로세스 내부 카운터"""
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def get_lock(self):
+        return self._lock
+
+
+def _create_version_counter():
+    """
+    데이터 버전 카운터를 만듭니다.
+
+    공유 메모리(multiprocessing.Value)에 두므로, server.py가 앱을 미리 import한 뒤
+    fork한 워커 프로세스들은 같은 카운터를 봅니다. 한 워커의 쓰기가 다른 워커의
+    목록 캐시와 ETag도 무효화합니다.
+    """
+    try:
+        return multiprocessing.Value('q', 0)
+    except (OSError, ImportError):
+        # 동작: 공유 메모리를 쓸 수 없으면(일부 샌드박스 등) 단일 프로세스 카운터를 사용합니다.
+        return _LocalCounter()
+
+
+_data_version = _create_version_counter()
+# 동작: 이 프로세스가 마지막으로 본 버전. 다른 워커가 버전을 올린 것을 알아채는 데 사용합니다.
+_seen_version = 0
+
+
+def get_data_version() -> int:
+    """현재 질문 데이터 버전을 반환합니다. 캐시 키를 만들 때 DB 조회보다 먼저 읽어야 합니다."""
+    global _seen_version
+    version = _data_version.value
+    if version != _seen_version:
+        # 동작: 다른 워커가 버전을 올렸으면 이 프로세스에 남은 이전 버전의 응답도 비웁니다.
+        _seen_version = version
+        list_cache.clear()
+    return version
+
+
+def bump_data_version() -> int:
+    """
+    질문 데이터가 바뀌었음을 기록하고 목록 캐시를 비웁니다.
+
+    서비스 계층의 쓰기 함수가 커밋 직후 호출합니다.
+
+    Returns:
+        새 데이터 버전
+    """
+    global _seen_version
+    with _data_version.get_lock():
+        _data_version.value += 1
+        version = _data_version.value
+    _seen_version = version
+    list_cache.clear()
+    return version
+
+
+# 동작: 데이터 버전은 메모리에만 있으므로 재시작하면 0부터 다시 셉니다.
+# 재시작 전에 발급한 목록 ETag가 우연히 일치하지 않도록 기동할 때마다 다른 값을 붙입니다.
+# server.py의 워커들은 fork 전에 만든 같은 값을 물려받으므로 ETag가 워커마다 달라지지 않습니다.
+BOOT_ID = uuid.uuid4().hex[:8]
+
+
+def list_etag(version: int) -> str:
+    """질문 목록 응답의 강한 ETag를 만듭니다. 같은 URL이면 같은 버전에서 본문이 같습니다."""
+    return f'"{BOOT_ID}-{version}"'
+
+
+def question_etag(question_id: int, version: int) -> str:
+    """단일 질문 응답의 강한 ETag를 행 버전으로 만듭니다."""
+    return f'"q{question_id}-v{version}"'
+
+
+# 동작: compression.py가 압축한 응답의 ETag 끝(닫는 따옴표 앞)에 붙이는 인코딩 접미사
+ENCODING_SUFFIXES = ('-gzip', '-br', '-zstd')
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    압축한 응답의 ETag를 만듭니다. 강한 ETag는 content-coding마다 달라야 하기 때문입니다.
+
+    예: "q1-v2" -> "q1-v2-gzip", W/"q1-v2" -> W/"q1-v2-gzip"
+    """
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _strip_encoding(candidate: str) -> str:
+    """encoded_etag가 붙인 인코딩 접미사를 뗀 ETag를 반환합니다."""
+    for suffix in ENCODING_SUFFIXES:
+        if candidate.endswith(suffix + '"'):
+            return candidate[:-len(suffix) - 1] + '"'
+    return candidate
+
+
+def _etag_candidates(header: str):
+    return [
+        _strip_encoding(candidate.strip()) for candidate in header.split(',') if candidate.strip()
+    ]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다 (약한 비교).
+
+    압축한 응답에서 받은 ETag("...-gzip" 등)는 인코딩 접미사를 떼고 비교합니다.
+
+    Args:
+        if_none_match: 요청의 If-None-Match 헤더 값
+        etag: 현재 응답의 ETag
+
+    Returns:
+        일치하면 True (304 Not Modified로 응답 가능)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(
+        candidate.removeprefix('W/') == etag
+        for candidate in _etag_candidates(if_none_match)
+    )
+
+
+def parse_if_match_versions(if_match: str, question_id: int) -> Optional[Set[int]]:
+    """
+    If-Match 헤더에서 해당 질문의 행 버전 목록을 꺼냅니다 (강한 비교).
+
+    압축한 응답에서 받은 ETag("...-gzip" 등)는 인코딩 접미사를 떼고 버전을 꺼냅니다.
+
+    Args:
+        if_match: 요청의 If-Match 헤더 값
+        question_id: 수정하려는 질문의 ID
+
+    Returns:
+        '*'이면 None (존재하기만 하면 됨), 아니면 허용되는 버전 집합.
+        약한 ETag나 다른 질문의 ETag는 무시되므로 빈 집합일 수 있습니다.
+    """
+    if if_match.strip() == '*':
+        return None
+    prefix = f'"q{question_id}-v'
+    versions = set()
+    for candidate in _etag_candidates(if_match):
+        if candidate.startswith(prefix) and candidate.endswith('"'):
+            number = candidate[len(prefix):-1]
+            if number.isdigit():
+                versions.add(int(number))
+    return versions
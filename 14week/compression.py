@@ -0,0 +1,431 @@
+"""
+응답 압축 모듈
+
+limit=100에 content까지 포함한 질문 목록이나 내보내기(export) 응답은 수백 KB가 되므로,
+클라이언트의 Accept-Encoding에 맞춰 zstd, br(brotli), gzip 중 하나로 압축해 보냅니다.
+
+- gzip은 표준 라이브러리(zlib)만 사용하고, br은 brotli(또는 brotlicffi), zstd는
+  zstandard 패키지가 설치되어 있을 때만 사용
+- 본문이 BOARD_COMPRESSION_MIN_SIZE보다 작거나, 이미 Content-Encoding이 있거나,
+  압축해도 줄지 않는 형식(이미지 등)과 SSE(text/event-stream)는 그대로 전달
+- StreamingResponse(내보내기)는 조각마다 스트리밍 압축기로 압축
+
+압축한 응답의 ETag에는 인코딩 이름을 붙여("...-gzip") 압축 전 응답과 다른 강한 검증자가
+되게 하고, 압축 여부가 Accept-Encoding에 따라 달라지는 응답(304와 작아서 압축하지 않은
+응답 포함)에는 Vary: Accept-Encoding을 붙입니다. cache.etag_matches와 If-Match 처리는
+인코딩 접미사를 떼고 비교합니다.
+
+ETag가 붙은 GET 200 응답(질문 목록 등)은 압축한 본문을 목록 캐시(list_cache)에
+(인코딩, 경로, 쿼리, ETag) 키로 함께 보관합니다. 같은 URL과 ETag이면 본문이 같으므로
+자주 조회되는 페이지는 요청마다 다시 압축하지 않고, 데이터가 바뀌어 목록 캐시가
+비워질 때 함께 비워집니다.
+
+인코딩별 원본/압축 크기와 압축에 쓴 CPU 시간은 GET /debug/compression에서,
+응답당 압축 시간 분포는 /metrics의 board_compression_seconds에서 확인할 수 있습니다.
+"""
+import threading
+import time
+import zlib
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from cache import encoded_etag, list_cache
+from config import (
+    COMPRESSION_BR_LEVEL,
+    COMPRESSION_ENABLED,
+    COMPRESSION_ENCODINGS,
+    COMPRESSION_GZIP_LEVEL,
+    COMPRESSION_MIN_SIZE,
+    COMPRESSION_ZSTD_LEVEL,
+)
+from metrics import COMPRESSION_TIME
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 API가 같은 brotlicffi를 시도
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없는 환경에서는 zstd를 협상하지 않음
+    zstandard = None
+
+# 동작: 이보다 큰 본문(byte)은 이벤트 루프를 막지 않도록 스레드풀에서 압축합니다.
+THREAD_OFFLOAD_SIZE = 256 * 1024
+
+# 동작: text/* 외에 압축할 Content-Type
+COMPRESSIBLE_TYPES = frozenset((
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'application/xml',
+))
+
+
+class _Codec:
+    """인코딩 하나의 한 번에 압축하는 함수와 스트리밍 압축기 생성 함수"""
+
+    def __init__(self, name: str, compress: Callable[[bytes], bytes], streaming: Callable[[], Any]):
+        self.name = name
+        self.compress = compress
+        self.streaming = streaming
+
+
+class _GzipStream:
+    """zlib 압축기를 gzip 형식으로 쓰는 스트리밍 압축기"""
+
+    def __init__(self, level: int):
+        # 동작: wbits=31이면 gzip 헤더(mtime=0)와 트레일러를 붙입니다.
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    """brotli.Compressor를 compress/flush 인터페이스로 감싼 스트리밍 압축기"""
+
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _gzip(body: bytes) -> bytes:
+    stream = _GzipStream(COMPRESSION_GZIP_LEVEL)
+    return stream.compress(body) + stream.flush()
+
+
+def _build_codecs() -> Dict[str, _Codec]:
+    """설치된 패키지로 사용할 수 있는 인코딩만 BOARD_COMPRESSION_ENCODINGS 순서대로 만듭니다."""
+    codecs: Dict[str, _Codec] = {}
+    for name in COMPRESSION_ENCODINGS:
+        if name == 'gzip':
+            codecs[name] = _Codec(name, _gzip, lambda: _GzipStream(COMPRESSION_GZIP_LEVEL))
+        elif name == 'br' and brotli is not None:
+            codecs[name] = _Codec(
+                name,
+                lambda body: brotli.compress(body, quality=COMPRESSION_BR_LEVEL),
+                lambda: _BrotliStream(COMPRESSION_BR_LEVEL),
+            )
+        elif name == 'zstd' and zstandard is not None:
+            # 동작: ZstdCompressor는 스레드 간에 공유할 수 없으므로 압축할 때마다 만듭니다.
+            codecs[name] = _Codec(
+                name,
+                lambda body: zstandard.ZstdCompressor(level=COMPRESSION_ZSTD_LEVEL).compress(body),
+                lambda: zstandard.ZstdCompressor(level=COMPRESSION_ZSTD_LEVEL).compressobj(),
+            )
+    return codecs
+
+
+CODECS = _build_codecs()
+
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 인코딩을 고릅니다.
+
+    q 값이 가장 큰 인코딩을 고르고, 같으면 BOARD_COMPRESSION_ENCODINGS 순서를 따릅니다.
+    클라이언트마다 헤더 값이 몇 가지뿐이므로 결과를 캐시합니다.
+
+    Args:
+        accept_encoding: 요청의 Accept-Encoding 헤더 값
+
+    Returns:
+        인코딩 이름 (zstd, br, gzip) 또는 None (압축하지 않음)
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(','):
+        token, _, params = part.partition(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+        weight = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[token] = weight
+    best, best_weight = None, 0.0
+    for name in CODECS:
+        weight = weights.get(name, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    if media_type == 'text/event-stream':
+        # 동작: SSE는 이벤트마다 바로 전달되어야 하므로 압축기에 모아 두지 않습니다.
+        return False
+    return (
+        media_type.startswith('text/')
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith('+json')
+    )
+
+
+def _varies_by_encoding(status: int, headers: MutableHeaders) -> bool:
+    """
+    Accept-Encoding에 따라 압축 여부가 달라질 수 있는 응답인지 확인합니다.
+
+    304에는 Content-Type이 없지만 ETag가 압축 여부에 따라 달라지므로 포함합니다.
+    """
+    if 'content-encoding' in headers:
+        return False
+    return status == 304 or _is_compressible(headers.get('content-type', ''))
+
+
+class CompressionStats:
+    """인코딩별 압축 응답 수, 원본/압축 크기, CPU 시간을 모으는 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 인코딩 -> [응답 수, 원본 byte, 압축 byte, CPU 초, 캐시 적중 수]
+        self._encodings: Dict[str, list] = {}
+        self.skipped_small = 0
+
+    def record(self, encoding: str, raw: int, compressed: int, cpu: float, cached: bool) -> None:
+        """압축한(또는 캐시에서 꺼낸) 응답 하나를 기록합니다."""
+        with self._lock:
+            entry = self._encodings.setdefault(encoding, [0, 0, 0, 0.0, 0])
+            entry[0] += 1
+            entry[1] += raw
+            entry[2] += compressed
+            entry[3] += cpu
+            entry[4] += cached
+
+    def record_small(self) -> None:
+        with self._lock:
+            self.skipped_small += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """인코딩별 절약한 byte 수, 압축률, CPU 시간을 반환합니다."""
+        with self._lock:
+            encodings = {name: list(entry) for name, entry in self._encodings.items()}
+            skipped_small = self.skipped_small
+        return {
+            'enabled': COMPRESSION_ENABLED,
+            'available': list(CODECS),
+            'min_size': COMPRESSION_MIN_SIZE,
+            'skipped_small': skipped_small,
+            'encodings': {
+                name: {
+                    'responses': responses,
+                    'cache_hits': cache_hits,
+                    'bytes_in': raw,
+                    'bytes_out': compressed,
+                    'bytes_saved': raw - compressed,
+                    'ratio': round(compressed / raw, 4) if raw else None,
+                    'cpu_ms': round(cpu * 1000, 3),
+                }
+                for name, (responses, raw, compressed, cpu, cache_hits) in sorted(encodings.items())
+            },
+        }
+
+
+compression_stats = CompressionStats()
+
+
+def _timed(function: Callable[..., bytes], *args: bytes) -> Tuple[bytes, float]:
+    """function(*args)를 실행하고 (결과, 이 스레드가 쓴 CPU 시간(초))를 반환합니다."""
+    started = time.thread_time()
+    result = function(*args)
+    return result, time.thread_time() - started
+
+
+async def _run_timed(function: Callable[[bytes], bytes], data: bytes) -> Tuple[bytes, float]:
+    if len(data) >= THREAD_OFFLOAD_SIZE:
+        return await run_in_threadpool(_timed, function, data)
+    return _timed(function, data)
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding에 맞춰 응답 본문을 압축하는 ASGI 미들웨어
+
+    MetricsMiddleware처럼 순수 ASGI 미들웨어이므로 압축하지 않는 응답에는
+    헤더 확인 몇 번 외의 비용이 없습니다.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get('accept-encoding', ''))
+        if encoding is None:
+            async def send_with_vary(message) -> None:
+                # 동작: 압축하지 않는 응답도 공유 캐시가 압축한 응답과 구분하도록 Vary를 붙입니다.
+                if message['type'] == 'http.response.start':
+                    headers = MutableHeaders(raw=message['headers'])
+                    if _varies_by_encoding(message['status'], headers):
+                        headers.add_vary_header('Accept-Encoding')
+                await send(message)
+
+            await self.app(scope, receive, send_with_vary)
+            return
+        responder = _CompressionResponder(scope, send, CODECS[encoding], self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """응답 하나의 시작 메시지를 붙잡아 두었다가 첫 본문을 보고 압축 여부를 정합니다."""
+
+    def __init__(self, scope, send, codec: _Codec, minimum_size: int):
+        self.scope = scope
+        self._send = send
+        self.codec = codec
+        self.minimum_size = minimum_size
+        self.start_message = None
+        self.mode: Optional[str] = None  # None(미정), 'identity', 'stream'
+        self.stream = None
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.cpu = 0.0
+
+    async def send(self, message) -> None:
+        if message['type'] == 'http.response.start':
+            self.start_message = message
+            return
+        if message['type'] != 'http.response.body':
+            await self._send(message)
+            return
+        if self.mode == 'identity':
+            await self._send(message)
+        elif self.mode == 'stream':
+            await self._send_chunk(message)
+        else:
+            await self._first_body(message)
+
+    async def _first_body(self, message) -> None:
+        headers = MutableHeaders(raw=self.start_message['headers'])
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+        status = self.start_message['status']
+        if status == 304:
+            self._keep_encoded_etag(headers)
+            headers.add_vary_header('Accept-Encoding')
+        if status in (204, 304) or not _varies_by_encoding(status, headers):
+            await self._pass_through(message)
+            return
+        headers.add_vary_header('Accept-Encoding')
+        length = headers.get('content-length')
+        if (not more_body and len(body) < self.minimum_size) or (
+            length is not None and length.isdigit() and int(length) < self.minimum_size
+        ):
+            compression_stats.record_small()
+            await self._pass_through(message)
+            return
+
+        headers['Content-Encoding'] = self.codec.name
+        if more_body:
+            # 동작: 스트리밍 응답은 전체 길이를 미리 알 수 없으므로 Content-Length를 지웁니다.
+            del headers['Content-Length']
+            self._encode_etag(headers)
+            self.mode = 'stream'
+            self.stream = self.codec.streaming()
+            await self._send(self.start_message)
+            await self._send_chunk(message)
+            return
+
+        compressed, cached = await self._compress_body(headers, body)
+        headers['Content-Length'] = str(len(compressed))
+        self._encode_etag(headers)
+        await self._send(self.start_message)
+        await self._send({'type': 'http.response.body', 'body': compressed})
+        if not cached:
+            COMPRESSION_TIME.observe(self.cpu, (self.codec.name,))
+        compression_stats.record(self.codec.name, len(body), len(compressed), self.cpu, cached)
+
+    def _encode_etag(self, headers: MutableHeaders) -> None:
+        """압축한 응답의 ETag에 인코딩 이름을 붙입니다. (강한 ETag는 인코딩마다 달라야 함)"""
+        etag = headers.get('etag')
+        if etag:
+            headers['ETag'] = encoded_etag(etag, self.codec.name)
+
+    def _keep_encoded_etag(self, headers: MutableHeaders) -> None:
+        """
+        304 응답의 ETag를 클라이언트가 가진 압축 응답의 ETag로 바꿉니다.
+
+        라우트는 인코딩 접미사를 뗀 값으로 비교하므로, If-None-Match에 이 인코딩의
+        ETag가 있었으면 클라이언트가 보관한 것과 같은 값을 돌려줍니다.
+        """
+        etag = headers.get('etag')
+        if not etag:
+            return
+        encoded = encoded_etag(etag, self.codec.name)
+        if_none_match = Headers(scope=self.scope).get('if-none-match', '')
+        if any(
+            candidate.strip().removeprefix('W/') == encoded.removeprefix('W/')
+            for candidate in if_none_match.split(',')
+        ):
+            headers['ETag'] = encoded
+
+    async def _compress_body(self, headers: MutableHeaders, body: bytes) -> Tuple[bytes, bool]:
+        """
+        본문 전체를 압축합니다. ETag가 있는 GET 200 응답은 압축 결과를 목록 캐시에서 찾거나 보관합니다.
+
+        Returns:
+            (압축한 본문, 캐시에서 꺼냈는지 여부)
+        """
+        etag = headers.get('etag')
+        cache_key = None
+        if etag and self.scope['method'] == 'GET' and self.start_message['status'] == 200:
+            cache_key = (
+                'compressed', self.codec.name, self.scope['path'], self.scope['query_string'], etag
+            )
+            compressed = list_cache.get(cache_key)
+            if compressed is not None:
+                return compressed, True
+        compressed, self.cpu = await _run_timed(self.codec.compress, body)
+        if cache_key is not None:
+            list_cache.set(cache_key, compressed)
+        return compressed, False
+
+    async def _send_chunk(self, message) -> None:
+        """스트리밍 응답의 조각 하나를 압축해 보냅니다. 마지막 조각이면 압축기를 비웁니다."""
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+        compressed = b''
+        if body:
+            compressed, cpu = await _run_timed(self.stream.compress, body)
+            self.cpu += cpu
+            self.raw_bytes += len(body)
+        if not more_body:
+            tail, cpu = _timed(self.stream.flush)
+            compressed += tail
+            self.cpu += cpu
+        self.compressed_bytes += len(compressed)
+        # 동작: 압축기가 아직 내보낸 것이 없으면 빈 조각은 보내지 않습니다.
+        if compressed or not more_body:
+            await self._send({'type': 'http.response.body', 'body': compressed, 'more_body': more_body})
+        if not more_body:
+            COMPRESSION_TIME.observe(self.cpu, (self.codec.name,))
+            compression_stats.record(
+                self.codec.name, self.raw_bytes, self.compressed_bytes, self.cpu, False
+            )
+
+    async def _pass_through(self, message) -> None:
+        self.mode = 'identity'
+        await self._send(self.start_message)
+        await self._send(message)
@@ -0,0 +1,169 @@
+"""
+애플리케이션 설정 모듈
+
+실행 환경마다 달라지는 값을 환경 변수로 받아 모듈 상수로 제공합니다.
+환경 변수가 없으면 로컬 개발용 기본값을 사용합니다.
+"""
+import os
+
+# SQLite 데이터베이스 설정
+# 동작: 프로젝트 루트에 board.db 파일을 생성하거나 연결합니다
+DATABASE_URL = os.getenv('BOARD_DATABASE_URL', 'sqlite:///board.db')
+
+# 데이터베이스 접근 방식 ('sync' 또는 'async')
+# - sync: 동기 엔진 + def 라우트 (스레드풀 워커에서 실행)
+# - async: aiosqlite 비동기 엔진 + async def 라우트 (이벤트 루프에서 실행)
+DB_MODE = os.getenv('BOARD_DB_MODE', 'sync')
+
+# 비동기 모드에서 사용할 데이터베이스 URL
+# 동작: 지정하지 않으면 DATABASE_URL의 드라이버만 aiosqlite로 바꿔 같은 파일을 사용합니다
+ASYNC_DATABASE_URL = os.getenv(
+    'BOARD_ASYNC_DATABASE_URL',
+    DATABASE_URL.replace('sqlite://', 'sqlite+aiosqlite://', 1)
+)
+
+# SQLite 연결 풀 설정
+# - WRITER_POOL_SIZE: 쓰기용 연결 수. SQLite는 동시에 하나의 쓰기 트랜잭션만 허용하므로
+#   기본값 1로 두면 쓰기 요청이 'database is locked' 대신 풀에서 차례를 기다립니다.
+# - READER_POOL_SIZE: 읽기 전용 연결 수. WAL 모드에서는 읽기가 쓰기를 기다리지 않으므로
+#   동시 읽기 요청 수만큼 늘릴 수 있습니다.
+# - POOL_TIMEOUT: 풀에서 연결을 기다리는 최대 시간(초)
+WRITER_POOL_SIZE = int(os.getenv('BOARD_WRITER_POOL_SIZE', '1'))
+READER_POOL_SIZE = int(os.getenv('BOARD_READER_POOL_SIZE', '8'))
+POOL_TIMEOUT = float(os.getenv('BOARD_POOL_TIMEOUT', '30'))
+
+# 읽기 복제본 데이터베이스 URL 목록 (쉼표로 구분, 기본값 없음)
+# 동작: 지정하면 allow_stale_reads로 표시한 조회 라우트의 세션을 주 DB의 읽기 전용 연결과
+# 복제본들에 번갈아 배정합니다. 복제본은 주 DB보다 늦게 갱신될 수 있으므로, 방금 쓴 내용을
+# 바로 읽어야 하는 라우트(단건 조회 등)는 항상 주 DB의 읽기 전용 연결을 사용합니다.
+READ_REPLICA_URLS = [
+    url.strip() for url in os.getenv('BOARD_READ_REPLICA_URLS', '').split(',') if url.strip()
+]
+
+# 연결마다 적용할 SQLite PRAGMA 값
+# - SQLITE_BUSY_TIMEOUT_MS: 잠금 대기 시간(ms). 초과하면 'database is locked' 에러
+# - SQLITE_MMAP_SIZE: 메모리 맵 I/O 크기(byte). 0이면 사용하지 않음
+# - SQLITE_CACHE_SIZE_KB: 연결별 페이지 캐시 크기(KiB)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('BOARD_SQLITE_BUSY_TIMEOUT_MS', '5000'))
+SQLITE_MMAP_SIZE = int(os.getenv('BOARD_SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv('BOARD_SQLITE_CACHE_SIZE_KB', str(64 * 1024)))
+
+# 페이지 크기 설정 (목록, 변경 피드, 검색의 limit)
+# - MAX_PAGE_SIZE: 한 요청에서 허용하는 최대 limit. 넘거나 1보다 작으면 422 응답
+MAX_PAGE_SIZE = int(os.getenv('BOARD_MAX_PAGE_SIZE', '1000'))
+
+# 대량 등록(POST /questions/bulk) 설정
+# - BULK_BATCH_SIZE: 한 트랜잭션에 넣을 최대 행 수. 요청이 더 크면 여러 트랜잭션으로 나눔
+# - BULK_MAX_ITEMS: 한 요청에 허용하는 최대 항목 수
+BULK_BATCH_SIZE = int(os.getenv('BOARD_BULK_BATCH_SIZE', '1000'))
+BULK_MAX_ITEMS = int(os.getenv('BOARD_BULK_MAX_ITEMS', '10000'))
+
+# 내보내기(GET /questions/export) 설정
+# - EXPORT_BATCH_SIZE: DB 커서에서 한 번에 읽어 변환할 행 수
+EXPORT_BATCH_SIZE = int(os.getenv('BOARD_EXPORT_BATCH_SIZE', '1000'))
+
+# 질문 등록 그룹 커밋 설정 (POST /questions, POST /api/question/create)
+# - GROUP_COMMIT_ENABLED: 1이면 등록 요청을 큐에 모아 전용 쓰기 스레드가 한 트랜잭션으로 커밋 (기본값 0)
+# - GROUP_COMMIT_MAX_BATCH: 한 트랜잭션에 넣을 최대 질문 수
+# - GROUP_COMMIT_MAX_DELAY_MS: 첫 요청이 들어온 뒤 배치를 더 모으며 기다리는 최대 시간(ms)
+# - GROUP_COMMIT_QUEUE_SIZE: 대기할 수 있는 최대 요청 수. 가득 차면 503 응답
+GROUP_COMMIT_ENABLED = os.getenv('BOARD_GROUP_COMMIT', '0') == '1'
+GROUP_COMMIT_MAX_BATCH = int(os.getenv('BOARD_GROUP_COMMIT_MAX_BATCH', '100'))
+GROUP_COMMIT_MAX_DELAY_MS = float(os.getenv('BOARD_GROUP_COMMIT_MAX_DELAY_MS', '2'))
+GROUP_COMMIT_QUEUE_SIZE = int(os.getenv('BOARD_GROUP_COMMIT_QUEUE_SIZE', '10000'))
+
+# 질문 변경 실시간 전송 설정 (GET /api/question/stream, WebSocket /api/question/ws)
+# - STREAM_QUEUE_SIZE: 구독자마다 보내지 못하고 쌓아 둘 수 있는 최대 이벤트 수
+# - STREAM_OVERFLOW: 큐가 가득 찬(느린) 구독자 처리 방식
+#   'disconnect'이면 연결을 끊고, 'resync'이면 쌓인 이벤트를 버리고 resync 이벤트를 보냄
+# - STREAM_HEARTBEAT: 이벤트가 없을 때 연결 유지용 신호를 보내는 간격(초)
+# - STREAM_MAX_SUBSCRIBERS: 프로세스당 최대 동시 구독자 수. 넘으면 503 응답
+STREAM_QUEUE_SIZE = int(os.getenv('BOARD_STREAM_QUEUE_SIZE', '100'))
+STREAM_OVERFLOW = os.getenv('BOARD_STREAM_OVERFLOW', 'disconnect')
+STREAM_HEARTBEAT = float(os.getenv('BOARD_STREAM_HEARTBEAT', '15'))
+STREAM_MAX_SUBSCRIBERS = int(os.getenv('BOARD_STREAM_MAX_SUBSCRIBERS', '10000'))
+
+# 질문 목록 응답 캐시 설정
+# - RESPONSE_CACHE_ENABLED: 0이면 캐시를 사용하지 않음
+# - RESPONSE_CACHE_MAX_ENTRIES: 보관할 최대 응답 수 (초과 시 가장 오래 사용되지 않은 것부터 제거)
+# - RESPONSE_CACHE_MAX_BYTES: 보관할 응답 본문의 최대 총 크기(byte)
+RESPONSE_CACHE_ENABLED = os.getenv('BOARD_RESPONSE_CACHE_ENABLED', '1') == '1'
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('BOARD_RESPONSE_CACHE_MAX_ENTRIES', '256'))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv('BOARD_RESPONSE_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))
+
+# 응답 압축 설정 (Accept-Encoding 협상)
+# - COMPRESSION_ENABLED: 0이면 압축하지 않음
+# - COMPRESSION_MIN_SIZE: 이보다 작은 응답 본문(byte)은 압축하지 않음
+# - COMPRESSION_ENCODINGS: 사용할 인코딩 (쉼표로 구분, 앞에 있을수록 우선)
+#   br은 brotli, zstd는 zstandard 패키지가 설치되어 있을 때만 사용
+# - COMPRESSION_*_LEVEL: 인코딩별 압축 수준 (높을수록 작지만 CPU를 더 씀)
+COMPRESSION_ENABLED = os.getenv('BOARD_COMPRESSION', '1') == '1'
+COMPRESSION_MIN_SIZE = int(os.getenv('BOARD_COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_ENCODINGS = [
+    name.strip() for name in os.getenv('BOARD_COMPRESSION_ENCODINGS', 'zstd,br,gzip').split(',')
+    if name.strip()
+]
+COMPRESSION_GZIP_LEVEL = int(os.getenv('BOARD_COMPRESSION_GZIP_LEVEL', '6'))
+COMPRESSION_BR_LEVEL = int(os.getenv('BOARD_COMPRESSION_BR_LEVEL', '4'))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv('BOARD_COMPRESSION_ZSTD_LEVEL', '3'))
+
+# 입장 제어(부하 차단) 설정 (admission.py)
+# - ADMISSION_ENABLED: 0이면 입장 제어를 하지 않음
+# - ADMISSION_CLIENT_HEADER: 클라이언트를 구분할 요청 헤더 (예: x-forwarded-for, x-api-key).
+#   비우면 접속한 주소를 사용. 프록시 뒤에서만 x-forwarded-for를 사용해야 함
+# - ADMISSION_MAX_CLIENTS: 토큰 버킷을 보관할 최대 클라이언트 수 (넘으면 가장 오래 쓰지 않은 것부터 제거)
+# - RATE_LIMIT_*: 클라이언트별 초당 허용 요청 수(0이면 제한 없음)와 순간 허용량(burst). 넘으면 429 응답
+# - *_CONCURRENCY: 프로세스 안에서 동시에 처리할 최대 요청 수 (0이면 제한 없음)
+# - *_QUEUE_SIZE: 동시 실행 슬롯을 기다릴 수 있는 최대 요청 수. 넘으면 바로 503 응답
+# - *_QUEUE_TIMEOUT_MS: 슬롯을 기다리는 최대 시간(ms). 넘으면 503 응답
+# - IMPORT_*: 가져오기(POST /questions/import)는 업로드가 끝날 때까지 슬롯을 잡으므로
+#   쓰기와 따로 동시 실행 수를 제한 (토큰 버킷은 쓰기와 함께 씀)
+# - ADMISSION_RETRY_AFTER: 503 응답의 Retry-After 값(초)
+ADMISSION_ENABLED = os.getenv('BOARD_ADMISSION', '1') == '1'
+ADMISSION_CLIENT_HEADER = os.getenv('BOARD_ADMISSION_CLIENT_HEADER', '').strip().lower()
+ADMISSION_MAX_CLIENTS = int(os.getenv('BOARD_ADMISSION_MAX_CLIENTS', '10000'))
+RATE_LIMIT_READ = float(os.getenv('BOARD_RATE_LIMIT_READ', '0'))
+RATE_LIMIT_READ_BURST = int(os.getenv('BOARD_RATE_LIMIT_READ_BURST', '100'))
+RATE_LIMIT_WRITE = float(os.getenv('BOARD_RATE_LIMIT_WRITE', '0'))
+RATE_LIMIT_WRITE_BURST = int(os.getenv('BOARD_RATE_LIMIT_WRITE_BURST', '20'))
+READ_CONCURRENCY = int(os.getenv('BOARD_READ_CONCURRENCY', '0'))
+READ_QUEUE_SIZE = int(os.getenv('BOARD_READ_QUEUE_SIZE', '256'))
+READ_QUEUE_TIMEOUT_MS = float(os.getenv('BOARD_READ_QUEUE_TIMEOUT_MS', '2000'))
+WRITE_CONCURRENCY = int(os.getenv('BOARD_WRITE_CONCURRENCY', '4'))
+WRITE_QUEUE_SIZE = int(os.getenv('BOARD_WRITE_QUEUE_SIZE', '64'))
+WRITE_QUEUE_TIMEOUT_MS = float(os.getenv('BOARD_WRITE_QUEUE_TIMEOUT_MS', '1000'))
+IMPORT_CONCURRENCY = int(os.getenv('BOARD_IMPORT_CONCURRENCY', '1'))
+IMPORT_QUEUE_SIZE = int(os.getenv('BOARD_IMPORT_QUEUE_SIZE', '4'))
+IMPORT_QUEUE_TIMEOUT_MS = float(os.getenv('BOARD_IMPORT_QUEUE_TIMEOUT_MS', '1000'))
+ADMISSION_RETRY_AFTER = int(os.getenv('BOARD_ADMISSION_RETRY_AFTER', '1'))
+
+# SQL 프로파일러 설정 (GET /debug/sql)
+# - SQL_PROFILER_ENABLED: 1이면 모든 엔진에 프로파일링 이벤트를 등록 (기본값 0)
+# - SQL_PROFILER_SLOWEST: 보관할 가장 느린 쿼리 수
+# - SQL_PROFILER_EXPLAIN_MS: 이 시간(ms) 이상 걸린 SELECT는 EXPLAIN QUERY PLAN으로 실행 계획 확인
+# - SQL_PROFILER_REPEAT_THRESHOLD: 한 요청에서 같은 문장이 이 횟수 이상 실행되면 N+1 의심으로 기록
+SQL_PROFILER_ENABLED = os.getenv('BOARD_SQL_PROFILER', '0') == '1'
+SQL_PROFILER_SLOWEST = int(os.getenv('BOARD_SQL_PROFILER_SLOWEST', '20'))
+SQL_PROFILER_EXPLAIN_MS = float(os.getenv('BOARD_SQL_PROFILER_EXPLAIN_MS', '20'))
+SQL_PROFILER_REPEAT_THRESHOLD = int(os.getenv('BOARD_SQL_PROFILER_REPEAT_THRESHOLD', '5'))
+
+# 질문 수 카운터(row_counter) 보정 작업 주기(초). 0이면 시작 시 한 번만 실행
+COUNT_RECONCILE_INTERVAL = float(os.getenv('BOARD_COUNT_RECONCILE_INTERVAL', '3600'))
+
+# 서버 실행 설정 (python main.py)
+# - HOST, PORT: 서버가 바인딩할 주소
+# - WORKERS: 워커 프로세스 수. 2 이상이면 server.py가 스키마를 한 번만 준비하고
+#   앱을 미리 import한 뒤 워커를 fork합니다 (POSIX 전용)
+HOST = os.getenv('BOARD_HOST', '0.0.0.0')
+PORT = int(os.getenv('BOARD_PORT', '8000'))
+WORKERS = int(os.getenv('BOARD_WORKERS', '1'))
+
+if DB_MODE not in ('sync', 'async'):
+    raise ValueError(f"BOARD_DB_MODE는 'sync' 또는 'async'여야 합니다: {DB_MODE!r}")
+if STREAM_OVERFLOW not in ('disconnect', 'resync'):
+    raise ValueError(
+        f"BOARD_STREAM_OVERFLOW는 'disconnect' 또는 'resync'여야 합니다: {STREAM_OVERFLOW!r}"
+    )
+for _encoding in COMPRESSION_ENCODINGS:
+    if _encoding not in ('gzip', 'br', 'zstd'):
+        raise ValueError(f"BOARD_COMPRESSION_ENCODINGS는 gzip, br, zstd 중에서 골라야 합니다: {_encoding!r}")
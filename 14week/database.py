@@ -5,41 +5,416 @@
 프로젝트의 데이터베이스 계층 초기화 단계에서 실행됩니다.
 """
 import contextlib
-from sqlalchemy import create_engine
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-
-# SQLite 데이터베이스 설정
-# 동작: 프로젝트 루트에 board.db 파일을 생성하거나 연결합니다
-DATABASE_URL = 'sqlite:///board.db'
-
-# autocommit=False로 설정
-# 동작: SQLAlchemy 엔진을 생성합니다. 이 엔진은 데이터베이스와의 연결을 관리합니다.
-# - connect_args: SQLite의 스레드 안전성 체크 비활성화 (멀티스레드 환경 대비)
-# - poolclass: StaticPool 사용 (SQLite는 파일 기반이므로 연결 풀링 단순화)
-# - echo=False: SQL 쿼리 로깅 비활성화 (디버깅 시 True로 변경 가능)
-engine = create_engine(
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from config import (
     DATABASE_URL,
-    connect_args={'check_same_thread': False},
-    poolclass=StaticPool,
-    echo=False
+    ASYNC_DATABASE_URL,
+    DB_MODE,
+    WRITER_POOL_SIZE,
+    READER_POOL_SIZE,
+    POOL_TIMEOUT,
+    READ_REPLICA_URLS,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE_KB,
+    SQL_PROFILER_ENABLED,
 )
+from metrics import add_session_wait, instrument_engine
+from profiler import sql_profiler
+
+
+class PoolWaitStats:
+    """
+    연결 풀 체크아웃 대기 시간 통계
+
+    풀에 남은 연결이 없어 요청이 기다린 시간을 누적합니다.
+    여러 스레드에서 동시에 기록하므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            if waited > self.wait_max:
+                self.wait_max = waited
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'wait_total_ms': round(self.wait_total * 1000, 3),
+                'wait_avg_ms': round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                'wait_max_ms': round(self.wait_max * 1000, 3),
+            }
+
+
+class _TimedPoolMixin:
+    """
+    체크아웃 대기 시간을 기록하는 풀 믹스인
+
+    대기 시간은 풀별 통계(wait_stats)와 현재 요청의 계측(metrics)에 함께 기록합니다.
+    wait_stats는 엔진 생성 후 지정하며, dispose() 등으로 풀이 다시 만들어져도
+    같은 통계 객체를 이어서 사용합니다.
+    """
+    wait_stats = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            add_session_wait(waited)
+            if self.wait_stats is not None:
+                self.wait_stats.record(waited)
+
+    def recreate(self):
+        new_pool = super().recreate()
+        new_pool.wait_stats = self.wait_stats
+        return new_pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """체크아웃 대기 시간을 기록하는 QueuePool"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 기록하는 AsyncAdaptedQueuePool (비동기 엔진용)"""
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    새 SQLite 연결마다 PRAGMA를 적용합니다.
+
+    - journal_mode=WAL: 읽기가 쓰기를 막지 않고, 쓰기도 읽기를 막지 않음
+    - synchronous=NORMAL: WAL 모드에서 커밋마다 fsync하지 않음 (체크포인트 시 동기화)
+    - busy_timeout: 잠금 충돌 시 즉시 실패하지 않고 지정 시간까지 재시도
+    - mmap_size, cache_size: 읽기 I/O를 줄이기 위한 메모리 설정
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+    cursor.execute(f'PRAGMA mmap_size={SQLITE_MMAP_SIZE}')
+    cursor.execute(f'PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}')
+    cursor.close()
+
+
+def _apply_read_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    읽기 전용 연결마다 PRAGMA를 적용합니다.
+
+    읽기 전용(mode=ro)으로 연 파일은 journal_mode를 바꿀 수 없으므로 설정하지 않고,
+    query_only로 쓰기를 한 번 더 금지합니다.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+    cursor.execute(f'PRAGMA mmap_size={SQLITE_MMAP_SIZE}')
+    cursor.execute(f'PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}')
+    cursor.execute('PRAGMA query_only=ON')
+    cursor.close()
+
+
+def read_only_url(url: str) -> str:
+    """
+    SQLite 파일 URL을 읽기 전용(mode=ro) URI 형식으로 바꿉니다.
+
+    예: sqlite:///board.db -> sqlite:///file:board.db?mode=ro&uri=true
+    메모리 DB이거나 이미 URI 형식이면 그대로 반환합니다.
+    """
+    parsed = make_url(url)
+    database = parsed.database
+    if not parsed.drivername.startswith('sqlite') or not database or database == ':memory:':
+        return url
+    if database.startswith('file:'):
+        return url
+    return parsed.set(
+        database=f'file:{database}', query={**parsed.query, 'mode': 'ro', 'uri': 'true'}
+    ).render_as_string(hide_password=False)
+
+
+def _create_sqlite_engine(
+    name: str,
+    pool_size: int,
+    read_only: bool = False,
+    url: str = DATABASE_URL
+):
+    """
+    PRAGMA와 대기 시간 통계가 설정된 SQLite 엔진을 생성합니다.
+
+    Args:
+        name: 통계에 표시할 풀 이름 (writer, reader, replica1, ...)
+        pool_size: 풀이 유지할 연결 수
+        read_only: True이면 파일을 읽기 전용(mode=ro)으로 열고 query_only PRAGMA 적용
+        url: 연결할 데이터베이스 URL
+
+    Returns:
+        생성된 Engine
+    """
+    # 동작: SQLAlchemy 엔진을 생성합니다. 이 엔진은 데이터베이스와의 연결을 관리합니다.
+    # - connect_args: 풀의 연결은 체크아웃할 때마다 다른 스레드에서 사용될 수 있으므로
+    #   SQLite의 스레드 안전성 체크를 비활성화 (한 연결은 동시에 한 스레드만 사용)
+    # - poolclass: 스레드(요청)마다 자기 연결을 체크아웃하는 QueuePool
+    # - max_overflow=0: pool_size를 넘는 요청은 POOL_TIMEOUT까지 풀에서 대기
+    # - echo=False: SQL 쿼리 로깅 비활성화 (디버깅 시 True로 변경 가능)
+    new_engine = create_engine(
+        read_only_url(url) if read_only else url,
+        connect_args={'check_same_thread': False},
+        poolclass=TimedQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=POOL_TIMEOUT,
+        echo=False
+    )
+    new_engine.pool.wait_stats = PoolWaitStats(name)
+    event.listen(new_engine, 'connect', _apply_read_pragmas if read_only else _apply_sqlite_pragmas)
+    instrument_engine(new_engine)
+    if SQL_PROFILER_ENABLED:
+        sql_profiler.install(new_engine)
+    return new_engine
+
+
+# 동작: 쓰기(및 쓰기 요청 안의 조회)용 엔진과 읽기 전용 엔진을 따로 만듭니다.
+# SQLite는 쓰기 트랜잭션을 하나만 허용하므로 쓰기 풀은 작게, 읽기 풀은 크게 둡니다.
+# 읽기 엔진은 같은 파일을 mode=ro로 열어 WAL 모드에서 쓰기와 경합하지 않습니다.
+engine = _create_sqlite_engine('writer', WRITER_POOL_SIZE)
+read_engine = _create_sqlite_engine('reader', READER_POOL_SIZE, read_only=True)
+# 동작: BOARD_READ_REPLICA_URLS로 지정한 복제본마다 읽기 전용 엔진을 만듭니다.
+replica_engines = [
+    _create_sqlite_engine(f'replica{number}', READER_POOL_SIZE, read_only=True, url=url)
+    for number, url in enumerate(READ_REPLICA_URLS, start=1)
+]
 
 # 동작: 세션 팩토리를 생성합니다. 이 팩토리는 데이터베이스 세션을 생성하는데 사용됩니다.
 # - autocommit=False: 자동 커밋 비활성화 (명시적 트랜잭션 제어 필요)
 # - autoflush=False: 자동 플러시 비활성화 (명시적 플러시 필요)
 # - bind=engine: 위에서 생성한 엔진과 연결
+# - info: 복제본 세션이면 stale=True (is_stale_session으로 확인)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+_stale_read_factories = itertools.cycle([ReadSessionLocal] + [
+    sessionmaker(autocommit=False, autoflush=False, bind=replica, info={'stale': True})
+    for replica in replica_engines
+])
+
+# 동작: 본문 없이 조회만 하는 HTTP 메서드. 이 메서드의 요청은 읽기 엔진으로 보냅니다.
+READ_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+def allow_stale_reads(endpoint: Callable) -> Callable:
+    """
+    라우트가 복제본의 늦게 반영된 데이터를 읽어도 된다고 표시하는 데코레이터
+
+    @router.get(...) 아래에 붙이면 get_db/get_read_db가 이 라우트의 세션을
+    주 DB의 읽기 엔진과 복제본 엔진에 번갈아 배정합니다. 복제본이 없으면 표시만 남고
+    동작은 바뀌지 않습니다.
+    """
+    endpoint.allow_stale_reads = True
+    return endpoint
+
+
+def _stale_reads_allowed(request: Optional[Request]) -> bool:
+    """요청이 매칭된 라우트에 allow_stale_reads가 표시되어 있는지 확인합니다."""
+    if request is None:
+        return False
+    return getattr(request.scope.get('endpoint'), 'allow_stale_reads', False)
+
+
+def _read_session_factory(request: Optional[Request]) -> sessionmaker:
+    """조회 요청에 사용할 세션 팩토리를 고릅니다."""
+    if _stale_reads_allowed(request):
+        return next(_stale_read_factories)
+    return ReadSessionLocal
+
+
+def is_stale_session(db) -> bool:
+    """
+    세션이 복제본에 연결되어 최신 쓰기가 반영되지 않았을 수 있는지 확인합니다.
+
+    데이터 버전을 키로 쓰는 응답 캐시와 ETag는 주 DB 기준이므로, 이 값이 True이면
+    조회 결과를 캐시하거나 ETag를 붙이면 안 됩니다.
+    """
+    return bool(db.info.get('stale'))
+
+
+def get_pool_stats() -> dict:
+    """
+    읽기/쓰기 풀의 현재 상태와 체크아웃 대기 시간 통계를 반환합니다.
+
+    Returns:
+        풀 이름을 키로 하는 통계 딕셔너리
+    """
+    stats = {}
+    engines = [engine, read_engine] + replica_engines + async_engines
+    for pool_engine in engines:
+        pool_engine = getattr(pool_engine, 'sync_engine', pool_engine)
+        pool = pool_engine.pool
+        stats[pool.wait_stats.name] = {
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            **pool.wait_stats.snapshot(),
+        }
+    return stats
 
 @contextlib.contextmanager
-def get_db():
-    db = SessionLocal()
-    print("--- DB 세션 연결됨 ---")  # 테스트용 로그 추가
+def get_db(request: Request = None):
+    """
+    요청 메서드에 맞는 데이터베이스 세션을 제공하는 컨텍스트 매니저
+
+    - GET/HEAD/OPTIONS: 읽기 엔진 (allow_stale_reads 라우트는 복제본 포함)
+    - 그 외 (POST/PUT/DELETE 등): 쓰기 엔진
+
+    라우트 밖에서 request 없이 호출하면 쓰기 엔진의 세션을 제공합니다.
+    연결 대기 시간과 쿼리 시간은 metrics 모듈이 요청별로 기록합니다. (GET /metrics)
+    """
+    if request is not None and request.method in READ_METHODS:
+        db = _read_session_factory(request)()
+    else:
+        db = SessionLocal()
     try:
         yield db
     except Exception:
         db.rollback()
         raise
     finally:
-        print("--- DB 세션 종료됨 ---")  # 테스트용 로그 추가
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+@contextlib.contextmanager
+def get_read_db(request: Request = None):
+    """
+    읽기 전용 풀의 데이터베이스 세션을 제공하는 컨텍스트 매니저
+
+    요청 메서드와 관계없이 항상 읽기 엔진을 사용합니다. 쓰기 풀을 점유하지 않으므로
+    조회 요청이 진행 중인 쓰기 요청 뒤에서 기다리지 않습니다.
+    allow_stale_reads 라우트이면 복제본 세션을 받을 수 있습니다.
+    """
+    db = _read_session_factory(request)()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+# 동작: 비동기 모드(BOARD_DB_MODE=async)일 때만 aiosqlite 엔진과 세션 팩토리를 생성합니다.
+# 동기 모드에서는 aiosqlite가 설치되어 있지 않아도 앱이 동작하도록 import를 미룹니다.
+# 동기 모드와 같이 쓰기 엔진, 주 DB의 읽기 전용 엔진, 복제본 엔진을 따로 만듭니다.
+# - expire_on_commit=False: 커밋 후 속성 접근 시 암묵적인 지연 로딩(await 불가)을 막음
+if DB_MODE == 'async':
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    def _create_async_sqlite_engine(name: str, url: str, read_only: bool = False):
+        """PRAGMA와 대기 시간 통계가 설정된 aiosqlite 엔진을 생성합니다."""
+        new_engine = create_async_engine(
+            read_only_url(url) if read_only else url,
+            poolclass=TimedAsyncAdaptedQueuePool,
+            echo=False
+        )
+        new_engine.sync_engine.pool.wait_stats = PoolWaitStats(name)
+        event.listen(
+            new_engine.sync_engine, 'connect',
+            _apply_read_pragmas if read_only else _apply_sqlite_pragmas
+        )
+        instrument_engine(new_engine.sync_engine)
+        if SQL_PROFILER_ENABLED:
+            sql_profiler.install(new_engine.sync_engine)
+        return new_engine
+
+    async_engine = _create_async_sqlite_engine('async', ASYNC_DATABASE_URL)
+    async_read_engine = _create_async_sqlite_engine(
+        'async_reader', ASYNC_DATABASE_URL, read_only=True
+    )
+    async_replica_engines = [
+        _create_async_sqlite_engine(
+            f'async_replica{number}',
+            url.replace('sqlite://', 'sqlite+aiosqlite://', 1),
+            read_only=True
+        )
+        for number, url in enumerate(READ_REPLICA_URLS, start=1)
+    ]
+    async_engines = [async_engine, async_read_engine] + async_replica_engines
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+    AsyncReadSessionLocal = async_sessionmaker(
+        async_read_engine, autoflush=False, expire_on_commit=False
+    )
+    _async_stale_read_factories = itertools.cycle([AsyncReadSessionLocal] + [
+        async_sessionmaker(replica, autoflush=False, expire_on_commit=False, info={'stale': True})
+        for replica in async_replica_engines
+    ])
+else:
+    async_engine = None
+    async_engines: List = []
+    AsyncSessionLocal = None
+    AsyncReadSessionLocal = None
+
+
+def reset_connection_pools(close: bool = False) -> None:
+    """
+    모든 엔진의 연결 풀을 새로 만듭니다.
+
+    SQLite 연결을 여러 프로세스가 함께 쓰면 잠금 상태가 깨지므로 server.py가 fork 전후에 호출합니다.
+    - 부모 프로세스(fork 전, close=True): 스키마 준비에 쓴 연결을 닫아 워커에 넘기지 않음
+    - 워커 프로세스(fork 직후, close=False): 부모의 연결은 건드리지 않고 풀만 버린 뒤
+      요청을 처리하면서 자기 연결을 새로 엶
+
+    Args:
+        close: True이면 풀에 있던 연결을 닫음
+    """
+    for pool_engine in [engine, read_engine] + replica_engines + async_engines:
+        getattr(pool_engine, 'sync_engine', pool_engine).dispose(close=close)
+
+
+def _async_session_factory(request: Optional[Request], read: bool):
+    """get_async_db가 사용할 세션 팩토리를 고릅니다. (get_db와 같은 규칙)"""
+    if not read:
+        return AsyncSessionLocal
+    if _stale_reads_allowed(request):
+        return next(_async_stale_read_factories)
+    return AsyncReadSessionLocal
+
+
+async def dispose_async_engines() -> None:
+    """비동기 엔진의 aiosqlite 연결(각각 전용 스레드를 가짐)을 모두 닫습니다."""
+    for async_pool_engine in async_engines:
+        await async_pool_engine.dispose()
+
+
+@contextlib.asynccontextmanager
+async def get_async_db(request: Request = None):
+    """
+    비동기 데이터베이스 세션을 제공하는 컨텍스트 매니저
+
+    get_db와 같은 방식으로 의존성 주입 후 async with 구문으로 사용하며,
+    get_db와 같이 요청 메서드에 따라 읽기/쓰기 엔진을 고릅니다.
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError('비동기 세션은 BOARD_DB_MODE=async 에서만 사용할 수 있습니다.')
+    read = request is not None and request.method in READ_METHODS
+    db = _async_session_factory(request, read)()
+    try:
+        yield db
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        await db.close()
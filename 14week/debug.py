@@ -0,0 +1,164 @@
+"""
+운영 진단용 라우터 정의
+
+연결 풀, 응답 캐시 등 서버 내부 상태를 확인하는 엔드포인트를 정의합니다.
+"""
+from fastapi import APIRouter
+from admission import admission_stats
+from cache import get_data_version, list_cache
+from compression import compression_stats
+from database import get_pool_stats
+from domain.question.events import question_events
+from domain.question.group_commit import question_writer
+from jobs import reconcile_counts
+from profiler import sql_profiler
+from schemas import ApiResponse
+from startup import startup_timer
+
+router = APIRouter(prefix='/debug')
+
+
+@router.get('/pool', response_model=ApiResponse)
+def pool_stats() -> ApiResponse:
+    """
+    읽기/쓰기 연결 풀의 상태와 체크아웃 대기 시간을 조회합니다.
+
+    wait_avg_ms, wait_max_ms가 커지면 해당 풀의 연결 수가 부족하다는 뜻입니다.
+
+    Returns:
+        풀별 통계를 포함한 응답
+    """
+    return ApiResponse(status='success', data=get_pool_stats())
+
+
+@router.get('/cache', response_model=ApiResponse)
+def cache_stats() -> ApiResponse:
+    """
+    질문 목록 응답 캐시의 적중/실패 횟수와 사용량을 조회합니다.
+
+    Returns:
+        캐시 통계와 현재 데이터 버전을 포함한 응답
+    """
+    return ApiResponse(
+        status='success',
+        data={'data_version': get_data_version(), **list_cache.stats()}
+    )
+
+
+@router.post('/reconcile-count', response_model=ApiResponse)
+def reconcile_count() -> ApiResponse:
+    """
+    질문 수 카운터 보정 작업을 즉시 실행합니다.
+
+    Returns:
+        보정 전후의 차이(drift)를 포함한 응답
+    """
+    return ApiResponse(status='success', data={'drift': reconcile_counts()})
+
+
+@router.get('/imports', response_model=ApiResponse)
+def active_imports() -> ApiResponse:
+    """
+    진행 중인 질문 가져오기(POST /questions/import) 작업의 진행 상황을 조회합니다.
+
+    Returns:
+        작업별 처리 레코드 수, 저장/거부 건수, 처리 속도를 포함한 응답
+    """
+    # 동작: 가져오기 모듈은 처음 사용할 때 import하므로 여기서도 미룹니다.
+    from domain.question.importer import get_active_imports
+    return ApiResponse(status='success', data={'imports': get_active_imports()})
+
+
+@router.get('/startup', response_model=ApiResponse)
+def startup_stats() -> ApiResponse:
+    """
+    이 프로세스의 시작 단계별 소요 시간을 조회합니다.
+
+    Returns:
+        단계별 시간(ms), 준비 완료/첫 요청까지의 시간, 스키마 확인 결과를 포함한 응답
+    """
+    return ApiResponse(status='success', data=startup_timer.report())
+
+
+@router.get('/group-commit', response_model=ApiResponse)
+def group_commit_stats() -> ApiResponse:
+    """
+    질문 등록 그룹 커밋(BOARD_GROUP_COMMIT=1)의 배치 통계를 조회합니다.
+
+    avg_batch_size가 1에 가까우면 동시 등록 요청이 적어 묶이지 않는다는 뜻이고,
+    max_batch에 자주 닿으면 BOARD_GROUP_COMMIT_MAX_BATCH를 늘릴 수 있습니다.
+
+    Returns:
+        커밋한 배치 수, 평균/최대 배치 크기, 배치 크기 분포를 포함한 응답
+    """
+    if question_writer is None:
+        return ApiResponse(status='success', data={'enabled': False})
+    return ApiResponse(status='success', data=question_writer.stats())
+
+
+@router.get('/stream', response_model=ApiResponse)
+def stream_stats() -> ApiResponse:
+    """
+    실시간 질문 이벤트 허브(SSE/WebSocket)의 통계를 조회합니다. (워커별 값)
+
+    dropped나 disconnected가 계속 늘면 느린 구독자가 많다는 뜻이므로
+    BOARD_STREAM_QUEUE_SIZE를 늘리거나 클라이언트 처리 속도를 확인합니다.
+
+    Returns:
+        현재 구독자 수와 발행/전달/폐기한 이벤트 수를 포함한 응답
+    """
+    return ApiResponse(status='success', data=question_events.stats())
+
+
+@router.get('/admission', response_model=ApiResponse)
+def admission_stats_view() -> ApiResponse:
+    """
+    입장 제어(토큰 버킷, 동시 실행 제한)의 조회/쓰기/가져오기 예산별 통계를 조회합니다. (워커별 값)
+
+    shed의 rate_limited는 429, queue_full과 queue_timeout은 503으로 거절한 요청 수입니다.
+
+    Returns:
+        예산별 한도, 현재 동시 실행/대기 수, 허용/거절 수를 포함한 응답
+    """
+    return ApiResponse(status='success', data=admission_stats())
+
+
+@router.get('/compression', response_model=ApiResponse)
+def compression_stats_view() -> ApiResponse:
+    """
+    응답 압축 통계를 인코딩별로 조회합니다. (워커별 값)
+
+    cache_hits는 목록 캐시에 보관한 압축 본문을 그대로 보낸 횟수이며, cpu_ms에는
+    포함되지 않습니다. ratio가 1에 가까우면 BOARD_COMPRESSION_MIN_SIZE를 올려
+    작은 응답은 압축하지 않는 편이 낫습니다.
+
+    Returns:
+        사용 가능한 인코딩과 인코딩별 원본/압축 크기, 절약한 byte 수, CPU 시간을 포함한 응답
+    """
+    return ApiResponse(status='success', data=compression_stats.snapshot())
+
+
+@router.get('/sql', response_model=ApiResponse)
+def sql_stats(limit: int = 50) -> ApiResponse:
+    """
+    SQL 프로파일러가 수집한 통계를 조회합니다. (BOARD_SQL_PROFILER=1 일 때만 수집)
+
+    Args:
+        limit: 반환할 문장별 통계의 최대 개수 (합계 시간 순)
+
+    Returns:
+        문장별 통계, 가장 느린 쿼리, 전체 테이블 스캔, N+1 의심 목록을 포함한 응답
+    """
+    return ApiResponse(status='success', data=sql_profiler.snapshot(limit=limit))
+
+
+@router.post('/sql/reset', response_model=ApiResponse)
+def sql_stats_reset() -> ApiResponse:
+    """
+    SQL 프로파일러 통계를 초기화합니다.
+
+    Returns:
+        초기화 완료 메시지를 포함한 응답
+    """
+    sql_profiler.reset()
+    return ApiResponse(status='success', message='SQL 프로파일러 통계를 초기화했습니다.')
@@ -0,0 +1,75 @@
+"""
+질문(Question) 비동기 라우터 정의
+
+question_router.py의 목록 조회 및 등록 API를 async def로 정의합니다.
+BOARD_DB_MODE=async 일 때 main.py가 question_router.py보다 먼저 등록합니다.
+"""
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from database import allow_stale_reads, get_async_db, is_stale_session
+from schemas import ApiResponse, QuestionCreate, QuestionListApiResponse
+from domain.question.async_service import get_question_rows, get_question_total, create_question
+from domain.question.group_commit import WriterBusyError, question_writer
+from domain.question.listing import ListPage, ListParams, list_params
+
+router = APIRouter(prefix='/api/question')
+
+
+@router.get('/list', response_model=QuestionListApiResponse)
+@allow_stale_reads
+async def question_list(
+    params: ListParams = Depends(list_params),
+    if_none_match: Optional[str] = Header(None),
+    db_context = Depends(get_async_db)
+) -> ApiResponse:
+    """
+    질문 목록을 조회합니다.
+
+    Args:
+        params: 목록 조회 파라미터 (listing.list_params 참고)
+        if_none_match: 클라이언트가 가진 응답의 ETag (If-None-Match 헤더)
+        db_context: 비동기 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+
+    Returns:
+        질문 목록을 포함한 응답
+
+    Raises:
+        HTTPException: cursor 또는 fields 형식이 올바르지 않은 경우 400 에러
+    """
+    page = ListPage(params, if_none_match)
+    response = page.cached_response()
+    if response is not None:
+        return response
+
+    async with db_context as db:
+        try:
+            rows = await get_question_rows(db, **params.query_kwargs())
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        return page.respond(rows, await get_question_total(db), is_stale_session(db))
+
+
+@router.post('/create', status_code=status.HTTP_204_NO_CONTENT)
+async def question_create(_question: QuestionCreate, db_context = Depends(get_async_db)):
+    """
+    질문을 등록합니다.
+
+    Args:
+        _question: 등록할 질문의 제목과 내용 (QuestionCreate 스키마)
+        db_context: 비동기 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+
+    Returns:
+        None (204 No Content)
+
+    Raises:
+        HTTPException: 그룹 커밋 큐가 가득 찬 경우 503 에러
+    """
+    if question_writer is not None:
+        try:
+            await asyncio.wrap_future(question_writer.submit(_question))
+        except WriterBusyError as exc:
+            raise HTTPException(status_code=503, detail=str(exc), headers={'Retry-After': '1'})
+        return
+    async with db_context as db:
+        await create_question(db, _question)
@@ -0,0 +1,270 @@
+"""
+질문(Question) 도메인 비동기 서비스 로직
+
+service.py와 같은 CRUD 작업을 AsyncSession으로 수행하는 서비스 레이어입니다.
+BOARD_DB_MODE=async 일 때 비동기 라우터에서 사용합니다.
+"""
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Sequence
+from cache import bump_data_version
+from models import Question, RowCounter
+from schemas import QuestionCreate, QuestionUpdate
+from domain.question.events import publish_created, publish_deleted, publish_updated
+from domain.question.serialization import QUESTION_FIELDS
+from domain.question.service import (
+    LIVE_QUESTION,
+    VersionConflictError,
+    apply_list_filters,
+    apply_pagination,
+    build_delete_statement,
+    build_fields_query,
+    build_list_query,
+    build_update_statement
+)
+
+
+async def create_question(db: AsyncSession, question: QuestionCreate) -> Question:
+    """
+    새로운 질문을 생성합니다.
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        question: 생성할 질문 정보
+
+    Returns:
+        생성된 Question 객체
+
+    Raises:
+        Exception: 데이터베이스 작업 실패 시 롤백 후 예외 발생
+    """
+    try:
+        db_question = Question(
+            subject=question.subject,
+            content=question.content
+        )
+        db.add(db_question)
+        await db.commit()  # 트랜잭션 커밋 (Durability 보장)
+        bump_data_version()  # 목록 캐시 무효화
+        await db.refresh(db_question)  # DB에서 최신 데이터 조회
+        publish_created(db_question)  # 실시간 구독자에게 알림
+        return db_question
+    except Exception:
+        # 에러 발생 시 롤백하여 트랜잭션 원자성 보장 (Atomicity)
+        await db.rollback()
+        raise
+
+
+async def get_question(db: AsyncSession, question_id: int) -> Optional[Question]:
+    """
+    ID로 질문을 조회합니다.
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        question_id: 조회할 질문의 ID
+
+    Returns:
+        Question 객체 또는 None (질문이 없거나 삭제된 경우)
+    """
+    result = await db.execute(select(Question).where(Question.id == question_id, LIVE_QUESTION))
+    return result.scalars().first()
+
+
+async def get_question_fields(
+    db: AsyncSession,
+    question_id: int,
+    fields: Sequence[str] = QUESTION_FIELDS
+) -> Optional[Row]:
+    """
+    질문의 지정한 컬럼과 버전만 조회합니다. (service.get_question_fields 참고)
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        question_id: 조회할 질문의 ID
+        fields: 조회할 필드 이름 (QUESTION_FIELDS 중 일부)
+
+    Returns:
+        fields 컬럼과 version을 가진 Row 또는 None (질문이 없거나 삭제된 경우)
+    """
+    result = await db.execute(build_fields_query(question_id, fields))
+    return result.first()
+
+
+async def get_question_version(db: AsyncSession, question_id: int) -> Optional[int]:
+    """
+    질문 행 전체를 읽지 않고 버전 값만 조회합니다.
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        question_id: 조회할 질문의 ID
+
+    Returns:
+        행 버전 또는 None (질문이 없거나 삭제된 경우)
+    """
+    result = await db.execute(
+        select(Question.version).where(Question.id == question_id, LIVE_QUESTION)
+    )
+    return result.scalar()
+
+
+async def get_question_total(db: AsyncSession) -> int:
+    """
+    row_counter에서 전체 질문 수를 조회합니다. (service.get_question_total 참고)
+
+    Args:
+        db: 비동기 데이터베이스 세션
+
+    Returns:
+        전체 질문 수
+    """
+    result = await db.execute(select(RowCounter.value).where(RowCounter.name == 'question'))
+    return result.scalar() or 0
+
+
+async def get_questions(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    order: str = 'asc'
+) -> List[Question]:
+    """
+    질문 목록을 (create_date, id) 순서로 조회합니다.
+
+    페이지네이션, 작성일시 범위, 정렬 규칙은 service.get_questions와 같습니다.
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        skip: 건너뛸 레코드 수 (cursor가 없을 때만 사용)
+        limit: 최대 조회할 레코드 수
+        cursor: 이전 응답의 next_cursor 값 (같은 order로 받은 값)
+        created_after: 지정하면 작성일시가 이 시각 이상인 질문만 조회
+        created_before: 지정하면 작성일시가 이 시각 미만인 질문만 조회
+        order: 'asc'(오래된 순, 기본값) 또는 'desc'(최신 순)
+
+    Returns:
+        Question 객체 리스트
+
+    Raises:
+        ValueError: cursor 또는 order 형식이 올바르지 않은 경우
+    """
+    stmt = apply_list_filters(
+        select(Question).where(LIVE_QUESTION), created_after, created_before, order
+    )
+    result = await db.execute(apply_pagination(stmt, skip, limit, cursor, order))
+    return list(result.scalars().all())
+
+
+async def get_question_rows(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Sequence[str] = QUESTION_FIELDS,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    order: str = 'asc'
+) -> List[Row]:
+    """
+    질문 목록을 ORM 객체 없이 지정한 컬럼만 행으로 조회합니다. (service.get_question_rows 참고)
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        skip: 건너뛸 레코드 수 (cursor가 없을 때만 사용)
+        limit: 최대 조회할 레코드 수
+        cursor: 이전 응답의 next_cursor 값 (같은 order로 받은 값)
+        fields: 조회할 필드 이름 (QUESTION_FIELDS 중 일부)
+        created_after: 지정하면 작성일시가 이 시각 이상인 질문만 조회
+        created_before: 지정하면 작성일시가 이 시각 미만인 질문만 조회
+        order: 'asc'(오래된 순, 기본값) 또는 'desc'(최신 순)
+
+    Returns:
+        fields 컬럼(과 커서용 id, create_date)을 가진 Row 리스트
+
+    Raises:
+        ValueError: cursor 또는 order 형식이 올바르지 않은 경우
+    """
+    stmt = build_list_query(fields, skip, limit, cursor, created_after, created_before, order)
+    result = await db.execute(stmt)
+    return list(result.all())
+
+
+async def update_question(
+    db: AsyncSession,
+    question_id: int,
+    question_update: QuestionUpdate,
+    expected_version: Optional[int] = None
+) -> Optional[Row]:
+    """
+    질문을 수정합니다.
+
+    service.update_question과 같이 UPDATE ... RETURNING 한 문장으로 처리합니다.
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        question_id: 수정할 질문의 ID
+        question_update: 수정할 내용
+        expected_version: 지정하면 현재 행 버전이 이 값일 때만 수정 (If-Match)
+
+    Returns:
+        수정된 질문의 Row (RETURNING_COLUMNS) 또는 None (질문이 없는 경우)
+
+    Raises:
+        VersionConflictError: 행 버전이 expected_version과 다른 경우
+        Exception: 데이터베이스 작업 실패 시 롤백 후 예외 발생
+    """
+    stmt = build_update_statement(question_id, question_update, expected_version)
+    if stmt is None:
+        row = await get_question_fields(db, question_id)
+        if row is not None and expected_version is not None and row.version != expected_version:
+            raise VersionConflictError('질문이 이미 다른 요청으로 수정되었습니다.')
+        return row
+    try:
+        row = (await db.execute(stmt)).first()
+        await db.commit()  # 트랜잭션 커밋 (Durability 보장)
+    except Exception:
+        # 에러 발생 시 롤백하여 트랜잭션 원자성 보장 (Atomicity)
+        await db.rollback()
+        raise
+    if row is not None:
+        bump_data_version()  # 목록 캐시 무효화
+        publish_updated(row, question_update.model_dump(exclude_none=True))  # 실시간 구독자에게 알림
+        return row
+    # 동작: 수정된 행이 없으면 질문이 없는 경우와 버전이 달라진 경우를 구분합니다.
+    if expected_version is not None and await get_question_version(db, question_id) is not None:
+        raise VersionConflictError('질문이 이미 다른 요청으로 수정되었습니다.')
+    return None
+
+
+async def delete_question(db: AsyncSession, question_id: int) -> bool:
+    """
+    질문을 삭제합니다.
+
+    service.delete_question과 같이 UPDATE ... RETURNING 한 문장으로 삭제 표시합니다.
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        question_id: 삭제할 질문의 ID
+
+    Returns:
+        삭제 성공 여부
+
+    Raises:
+        Exception: 데이터베이스 작업 실패 시 롤백 후 예외 발생
+    """
+    try:
+        deleted_id = (await db.execute(build_delete_statement(question_id))).scalar()
+        await db.commit()  # 트랜잭션 커밋 (Durability 보장)
+    except Exception:
+        # 에러 발생 시 롤백하여 트랜잭션 원자성 보장 (Atomicity)
+        await db.rollback()
+        raise
+    if deleted_id is None:
+        return False
+    bump_data_version()  # 목록 캐시 무효화
+    publish_deleted(question_id)  # 실시간 구독자에게 알림
+    return True
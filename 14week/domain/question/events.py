@@ -0,0 +1,253 @@
+"""
+질문 변경 이벤트 브로드캐스트
+
+질문이 생성/수정/삭제되면 서비스 계층이 이 모듈의 publish_* 함수로 이벤트를 발행하고,
+GET /api/question/stream(SSE)과 WebSocket /api/question/ws에 연결된 구독자에게
+바뀐 필드만 담은 작은 이벤트를 전달합니다. 대시보드가 목록을 몇 초마다 다시 받는 대신
+처음에 한 번 받고 이후에는 이벤트로 갱신하면 됩니다.
+
+- created: id, subject, create_date (목록 기본 필드)
+- updated: id, 바뀐 필드, version
+- deleted: id
+- resync: 대량 등록 등으로 개별 이벤트를 보내지 않았거나 이벤트를 버린 경우.
+  클라이언트는 목록을 다시 조회해야 함
+- close: 서버가 연결을 끊기 직전에 보내는 이벤트 (reason: slow_consumer, shutdown)
+
+구독자는 연결마다 asyncio.Queue 하나로 표현되며 이벤트 루프 위에서 기다리므로,
+쉬고 있는 구독자가 수천 개여도 스레드나 DB 연결을 쓰지 않습니다. 이벤트는 발행할 때
+한 번만 JSON/SSE bytes로 직렬화해 모든 구독자가 같은 객체를 공유합니다.
+
+구독자 큐는 STREAM_QUEUE_SIZE개로 제한되며, 가득 찬 느린 구독자는 STREAM_OVERFLOW에 따라
+연결을 끊거나(disconnect) 쌓인 이벤트를 버리고 resync 이벤트를 받습니다(resync).
+다른 구독자와 발행하는 요청은 느린 구독자 때문에 기다리지 않습니다.
+
+허브는 프로세스 안에만 있으므로 여러 워커(BOARD_WORKERS)로 실행하면 각 구독자는 자기가
+연결된 워커에서 일어난 변경만 받습니다. 놓친 변경은 GET /questions/changes로 확인합니다.
+"""
+import asyncio
+import itertools
+import threading
+from typing import Any, AsyncIterator, Dict, NamedTuple, Optional, Sequence, Set
+from config import STREAM_HEARTBEAT, STREAM_MAX_SUBSCRIBERS, STREAM_OVERFLOW, STREAM_QUEUE_SIZE
+from domain.question.serialization import LIST_DEFAULT_FIELDS, dumps
+
+
+class StreamEvent(NamedTuple):
+    """한 번 직렬화해 모든 구독자에게 그대로 보내는 이벤트"""
+    id: int
+    type: str
+    json: bytes
+    sse: bytes
+    final: bool = False
+
+
+class TooManySubscribersError(Exception):
+    """동시 구독자 수가 STREAM_MAX_SUBSCRIBERS에 도달했을 때 발생하는 예외"""
+
+
+class Subscriber:
+    """구독자 하나의 이벤트 큐"""
+
+    __slots__ = ('queue',)
+
+    def __init__(self, queue_size: int):
+        self.queue: 'asyncio.Queue[StreamEvent]' = asyncio.Queue(maxsize=queue_size)
+
+
+class EventHub:
+    """
+    프로세스 안의 구독자들에게 이벤트를 전달하는 브로드캐스트 허브
+
+    subscribe/unsubscribe/listen은 이벤트 루프에서 호출하고, publish는 어느 스레드에서
+    호출해도 됩니다 (스레드풀의 동기 라우트, 그룹 커밋 쓰기 스레드 등).
+    """
+
+    def __init__(
+        self,
+        queue_size: int = STREAM_QUEUE_SIZE,
+        overflow: str = STREAM_OVERFLOW,
+        max_subscribers: int = STREAM_MAX_SUBSCRIBERS
+    ):
+        self.queue_size = max(1, queue_size)
+        self.overflow = overflow
+        self.max_subscribers = max_subscribers
+        self._subscribers: Set[Subscriber] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._disconnected = 0
+        self._resyncs = 0
+
+    def subscribe(self) -> Subscriber:
+        """
+        새 구독자를 등록합니다.
+
+        Returns:
+            listen()에 넘길 구독자
+
+        Raises:
+            TooManySubscribersError: 동시 구독자 수가 max_subscribers에 도달한 경우
+        """
+        if len(self._subscribers) >= self.max_subscribers:
+            raise TooManySubscribersError('실시간 구독자가 너무 많습니다. 잠시 후 다시 시도해 주세요.')
+        self._loop = asyncio.get_running_loop()
+        subscriber = Subscriber(self.queue_size)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """구독자를 제거합니다. 이미 제거된 구독자여도 괜찮습니다."""
+        self._subscribers.discard(subscriber)
+
+    async def listen(
+        self,
+        subscriber: Subscriber,
+        heartbeat: float = STREAM_HEARTBEAT
+    ) -> AsyncIterator[Optional[StreamEvent]]:
+        """
+        구독자에게 온 이벤트를 차례로 반환합니다.
+
+        heartbeat초 동안 이벤트가 없으면 None을 반환하므로 호출한 쪽이 연결 유지 신호를
+        보낼 수 있습니다. final 이벤트(close)를 반환한 뒤에는 종료합니다.
+
+        Args:
+            subscriber: subscribe()로 등록한 구독자
+            heartbeat: 연결 유지 신호 간격(초)
+        """
+        while True:
+            try:
+                event = await asyncio.wait_for(subscriber.queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            yield event
+            if event.final:
+                return
+
+    def publish(self, event_type: str, data: Dict[str, Any], final: bool = False) -> None:
+        """
+        모든 구독자에게 이벤트를 보냅니다. 구독자가 없으면 직렬화도 하지 않습니다.
+
+        Args:
+            event_type: 이벤트 종류 (created, updated, deleted, resync, close)
+            data: 이벤트 본문 (JSON으로 직렬화 가능한 값)
+            final: True이면 이 이벤트를 받은 구독자의 listen()이 끝남
+        """
+        if not self._subscribers or self._loop is None:
+            return
+        event = self._build(event_type, data, final)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._dispatch(event)
+        else:
+            self._schedule(event)
+
+    def close(self, reason: str = 'shutdown') -> None:
+        """
+        모든 구독자에게 close 이벤트를 보내 연결을 끝냅니다. (서버 종료 시)
+
+        uvicorn은 열린 연결이 모두 닫힐 때까지 종료를 기다리므로 종료 시그널을 받자마자
+        호출해야 합니다. 시그널 처리기에서도 호출할 수 있도록 항상 이벤트 루프에 예약합니다.
+        """
+        if not self._subscribers or self._loop is None:
+            return
+        self._schedule(self._build('close', {'reason': reason}, True))
+
+    def _schedule(self, event: StreamEvent) -> None:
+        """다른 스레드(또는 시그널 처리기)에서 이벤트 루프에 _dispatch를 예약합니다."""
+        try:
+            self._loop.call_soon_threadsafe(self._dispatch, event)
+        except RuntimeError:
+            pass  # 이벤트 루프가 이미 종료됨
+
+    def _build(self, event_type: str, data: Dict[str, Any], final: bool) -> StreamEvent:
+        event_id = next(self._ids)
+        payload = dumps({'type': event_type, **data})
+        sse = b''.join((
+            b'id: ', str(event_id).encode('ascii'),
+            b'\nevent: ', event_type.encode('ascii'),
+            b'\ndata: ', payload, b'\n\n',
+        ))
+        return StreamEvent(event_id, event_type, payload, sse, final)
+
+    def _dispatch(self, event: StreamEvent) -> None:
+        """이벤트 루프에서 각 구독자의 큐에 이벤트를 넣습니다."""
+        delivered = 0
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(event)
+                delivered += 1
+            except asyncio.QueueFull:
+                self._handle_overflow(subscriber, event)
+        with self._lock:
+            self._published += 1
+            self._delivered += delivered
+
+    def _handle_overflow(self, subscriber: Subscriber, event: StreamEvent) -> None:
+        """큐가 가득 찬 구독자의 쌓인 이벤트를 버리고 close 또는 resync 이벤트를 넣습니다."""
+        dropped = subscriber.queue.qsize()
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        if event.final:
+            # 동작: 종료 이벤트는 쌓인 이벤트를 버리고라도 반드시 전달합니다.
+            subscriber.queue.put_nowait(event)
+        elif self.overflow == 'disconnect':
+            self._subscribers.discard(subscriber)
+            subscriber.queue.put_nowait(self._build('close', {'reason': 'slow_consumer'}, True))
+            dropped += 1
+            with self._lock:
+                self._disconnected += 1
+        else:
+            subscriber.queue.put_nowait(self._build('resync', {'reason': 'slow_consumer'}, False))
+            dropped += 1
+            with self._lock:
+                self._resyncs += 1
+        with self._lock:
+            self._dropped += dropped
+
+    def stats(self) -> Dict[str, Any]:
+        """구독자 수와 발행/전달/폐기한 이벤트 수를 반환합니다."""
+        with self._lock:
+            return {
+                'subscribers': len(self._subscribers),
+                'max_subscribers': self.max_subscribers,
+                'queue_size': self.queue_size,
+                'overflow': self.overflow,
+                'published': self._published,
+                'delivered': self._delivered,
+                'dropped': self._dropped,
+                'disconnected': self._disconnected,
+                'resyncs': self._resyncs,
+            }
+
+
+question_events = EventHub()
+
+
+def publish_created(question: Any) -> None:
+    """생성된 질문(ORM 객체, Row, CreatedQuestion)의 목록 기본 필드를 created 이벤트로 보냅니다."""
+    question_events.publish('created', {name: getattr(question, name) for name in LIST_DEFAULT_FIELDS})
+
+
+def publish_updated(row: Any, fields: Sequence[str]) -> None:
+    """수정된 질문의 바뀐 필드와 새 버전을 updated 이벤트로 보냅니다."""
+    data = {name: getattr(row, name) for name in fields}
+    data['id'] = row.id
+    data['version'] = row.version
+    question_events.publish('updated', data)
+
+
+def publish_deleted(question_id: int) -> None:
+    """삭제된 질문의 id를 deleted 이벤트로 보냅니다."""
+    question_events.publish('deleted', {'id': question_id})
+
+
+def publish_resync(reason: str) -> None:
+    """개별 이벤트 없이 여러 질문이 바뀌었음을 resync 이벤트로 알립니다."""
+    question_events.publish('resync', {'reason': reason})
@@ -0,0 +1,124 @@
+"""
+질문(Question) 내보내기 서비스
+
+질문 테이블 전체를 NDJSON 또는 CSV 텍스트로 변환해 조금씩 내보냅니다.
+
+ORM 객체나 Pydantic 모델을 만들지 않고 컬럼 값 튜플만 yield_per 단위로 읽어
+바로 문자열로 바꾸므로, 테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator, Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from models import Question
+from domain.question.service import as_local_naive
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+EXPORT_COLUMNS = ('id', 'subject', 'content', 'create_date')
+MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def iter_question_rows(
+    db: Session,
+    since: Optional[datetime] = None,
+    batch_size: int = 1000
+) -> Iterator[Sequence[Sequence]]:
+    """
+    질문을 (create_date, id) 순서로 batch_size개씩 묶어 반환합니다.
+
+    yield_per를 지정하면 결과를 한 번에 가져오지 않고 DB 커서에서 batch_size개씩
+    읽습니다. ORM 엔티티 대신 컬럼만 조회하므로 세션의 identity map도 커지지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        since: 지정하면 create_date가 이 시각 이후인 질문만 내보냄
+            (시간대가 있으면 목록의 created_after와 같이 서버 로컬 시각으로 바꿔 비교)
+        batch_size: 한 번에 읽을 행 수
+
+    Returns:
+        (id, subject, content, create_date) 튜플 리스트의 이터레이터
+    """
+    stmt = (
+        select(Question.id, Question.subject, Question.content, Question.create_date)
+        .where(Question.deleted_at.is_(None))
+        .order_by(Question.create_date, Question.id)
+        .execution_options(yield_per=batch_size)
+    )
+    if since is not None:
+        stmt = stmt.where(Question.create_date >= as_local_naive(since))
+    result = db.execute(stmt)
+    try:
+        for partition in result.partitions():
+            yield partition
+    finally:
+        result.close()
+
+
+def _ndjson_chunk(rows: Sequence[Sequence]) -> str:
+    """행 묶음을 NDJSON(한 줄에 JSON 객체 하나) 텍스트로 변환합니다."""
+    return ''.join(
+        json.dumps(
+            {
+                'id': row[0],
+                'subject': row[1],
+                'content': row[2],
+                'create_date': row[3].isoformat()
+            },
+            ensure_ascii=False
+        ) + '\n'
+        for row in rows
+    )
+
+
+def _csv_chunk(rows: Sequence[Sequence], header: bool = False) -> str:
+    """행 묶음을 CSV 텍스트로 변환합니다. header가 True면 머리글 행을 앞에 붙입니다."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows((row[0], row[1], row[2], row[3].isoformat()) for row in rows)
+    return buffer.getvalue()
+
+
+def export_questions(
+    db: Session,
+    fmt: str,
+    since: Optional[datetime] = None,
+    batch_size: int = 1000
+) -> Iterator[str]:
+    """
+    질문을 NDJSON 또는 CSV 텍스트 조각으로 내보냅니다.
+
+    행 묶음(batch_size개)마다 조각 하나를 만들어 반환하므로 StreamingResponse의
+    본문으로 바로 사용할 수 있습니다. CSV는 데이터가 없어도 머리글 행을 반환합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        fmt: 'ndjson' 또는 'csv'
+        since: 지정하면 create_date가 이 시각 이후인 질문만 내보냄
+        batch_size: 한 번에 읽고 변환할 행 수
+
+    Returns:
+        텍스트 조각 이터레이터
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f'지원하지 않는 내보내기 형식입니다: {fmt}')
+    if fmt == 'csv':
+        header_sent = False
+        for rows in iter_question_rows(db, since=since, batch_size=batch_size):
+            yield _csv_chunk(rows, header=not header_sent)
+            header_sent = True
+        if not header_sent:
+            yield _csv_chunk([], header=True)
+    else:
+        for rows in iter_question_rows(db, since=since, batch_size=batch_size):
+            yield _ndjson_chunk(rows)
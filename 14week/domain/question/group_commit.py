@@ -0,0 +1,265 @@
+"""
+질문 등록 그룹 커밋
+
+SQLite는 쓰기 트랜잭션을 한 번에 하나만 허용하므로, 등록 요청마다 따로 커밋하면
+동시 요청이 쓰기 잠금을 기다리며 줄을 서고 커밋(fsync) 횟수만큼 처리량이 떨어집니다.
+
+BOARD_GROUP_COMMIT=1 이면 등록 요청을 프로세스 안의 큐에 넣고, 전용 쓰기 스레드 하나가
+GROUP_COMMIT_MAX_BATCH개가 모이거나 첫 요청 뒤 GROUP_COMMIT_MAX_DELAY_MS가 지날 때마다
+모인 요청을 한 트랜잭션으로 커밋합니다. 각 요청은 Future로 생성된 질문을 돌려받습니다.
+
+- 동기 라우트: submit(question).result()
+- 비동기 라우트: await asyncio.wrap_future(submit(question))
+
+배치 저장이 실패하면 같은 배치의 다른 요청까지 실패하지 않도록 한 건씩 다시 저장합니다.
+달성한 배치 크기는 GET /debug/group-commit과 /metrics의
+board_group_commit_batch_size로 확인할 수 있습니다.
+"""
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy.orm import Session
+from config import (
+    GROUP_COMMIT_ENABLED,
+    GROUP_COMMIT_MAX_BATCH,
+    GROUP_COMMIT_MAX_DELAY_MS,
+    GROUP_COMMIT_QUEUE_SIZE,
+)
+from cache import bump_data_version
+from database import SessionLocal
+from domain.question.events import publish_created
+from metrics import GROUP_COMMIT_BATCH_SIZE
+from schemas import QuestionCreate
+from domain.question.service import insert_questions
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class CreatedQuestion(NamedTuple):
+    """그룹 커밋으로 생성된 질문 (create_question이 반환하는 Question과 같은 속성)"""
+    id: int
+    subject: str
+    content: str
+    create_date: datetime
+
+
+class WriterBusyError(Exception):
+    """쓰기 큐가 가득 찼거나 쓰기 스레드가 실행 중이 아닐 때 발생하는 예외"""
+
+
+class GroupCommitWriter:
+    """
+    등록 요청을 모아 한 트랜잭션으로 커밋하는 전용 쓰기 스레드
+
+    submit()은 어느 스레드나 이벤트 루프에서 호출해도 되며, 큐에 넣기만 하고 바로 반환합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_batch: int = GROUP_COMMIT_MAX_BATCH,
+        max_delay_ms: float = GROUP_COMMIT_MAX_DELAY_MS,
+        queue_size: int = GROUP_COMMIT_QUEUE_SIZE,
+        name: str = 'question'
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max_delay_ms / 1000
+        self.name = name
+        self._queue: 'queue.Queue[Any]' = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._failed = 0
+        self._retried_batches = 0
+        self._max_batch_seen = 0
+        self._commit_seconds = 0.0
+        self._size_counts: Counter = Counter()
+
+    def start(self) -> None:
+        """쓰기 스레드를 시작합니다. 이미 실행 중이면 아무 작업도 하지 않습니다."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f'group-commit-{self.name}', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """큐에 남은 요청을 모두 커밋한 뒤 쓰기 스레드를 종료합니다."""
+        if self._thread is None:
+            return
+        # 동작: 큐가 가득 차 있어도 종료 신호는 반드시 넣습니다.
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        # 동작: 종료 신호 뒤에 들어온 요청은 저장하지 않고 실패로 완료합니다.
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(WriterBusyError('질문 쓰기 스레드가 종료되었습니다.'))
+
+    def submit(self, question: QuestionCreate) -> 'Future[CreatedQuestion]':
+        """
+        질문 등록 요청을 큐에 넣습니다.
+
+        Args:
+            question: 생성할 질문 정보
+
+        Returns:
+            커밋되면 CreatedQuestion으로, 실패하면 예외로 완료되는 Future
+
+        Raises:
+            WriterBusyError: 큐가 가득 찼거나 쓰기 스레드가 실행 중이 아닌 경우
+        """
+        if self._thread is None:
+            raise WriterBusyError('질문 쓰기 스레드가 실행 중이 아닙니다.')
+        future: 'Future[CreatedQuestion]' = Future()
+        try:
+            self._queue.put_nowait((question, future))
+        except queue.Full:
+            raise WriterBusyError('질문 등록 요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.') from None
+        return future
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    # 동작: 큐에 이미 쌓인 요청은 기다리지 않고 가져오고,
+                    # 비어 있으면 첫 요청 기준 max_delay까지만 기다립니다.
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit(batch)
+
+    def _commit(self, batch: List[Tuple[QuestionCreate, 'Future[CreatedQuestion]']]) -> None:
+        """배치 하나를 한 트랜잭션으로 저장하고 각 Future를 완료합니다."""
+        # 동작: 기다리는 동안 취소된 요청(예: 클라이언트 연결 종료)은 저장하지 않습니다.
+        batch = [(question, future) for question, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        started = time.perf_counter()
+        try:
+            created = self._insert([question for question, _ in batch])
+        except Exception as exc:
+            if len(batch) == 1:
+                self._record(0, len(batch), started)
+                batch[0][1].set_exception(exc)
+                return
+            logger.warning('그룹 커밋 배치(%d건) 저장 실패, 한 건씩 다시 저장합니다.', len(batch), exc_info=True)
+            with self._lock:
+                self._retried_batches += 1
+            for item in batch:
+                self._commit_single(item)
+            return
+        self._record(len(batch), 0, started)
+        self._announce(created)
+        for (_, future), question in zip(batch, created):
+            future.set_result(question)
+
+    def _commit_single(self, item: Tuple[QuestionCreate, 'Future[CreatedQuestion]']) -> None:
+        """실패한 배치의 요청 하나를 별도 트랜잭션으로 다시 저장합니다."""
+        question, future = item
+        started = time.perf_counter()
+        try:
+            created = self._insert([question])
+        except Exception as exc:
+            self._record(0, 1, started)
+            future.set_exception(exc)
+            return
+        self._record(1, 0, started)
+        self._announce(created)
+        future.set_result(created[0])
+
+    def _insert(self, questions: List[QuestionCreate]) -> List[CreatedQuestion]:
+        """
+        질문들을 한 트랜잭션으로 저장하고 생성된 질문 목록을 반환합니다.
+
+        커밋까지만 담당합니다. 여기서 예외가 나면 저장되지 않은 것이므로 한 건씩 다시 저장해도
+        중복되지 않습니다. 커밋 뒤의 캐시 무효화와 알림은 _announce가 따로 처리합니다.
+        """
+        now = datetime.now()
+        with self.session_factory() as db:
+            try:
+                ids = insert_questions(db, questions, now)
+                db.commit()  # 배치 단위 커밋 (배치 안에서는 원자성 보장)
+            except Exception:
+                db.rollback()
+                raise
+        return [
+            CreatedQuestion(question_id, q.subject, q.content, now)
+            for question_id, q in zip(ids, questions)
+        ]
+
+    def _announce(self, created: List[CreatedQuestion]) -> None:
+        """
+        커밋된 질문들의 목록 캐시를 무효화하고 실시간 구독자에게 알립니다.
+
+        이미 커밋된 뒤이므로 실패해도 로그만 남기고 요청에는 생성 결과를 그대로 돌려줍니다.
+        """
+        try:
+            bump_data_version()  # 목록 캐시 무효화
+        except Exception:
+            logger.exception('그룹 커밋 후 목록 캐시 무효화에 실패했습니다.')
+        for question in created:
+            try:
+                publish_created(question)  # 실시간 구독자에게 알림
+            except Exception:
+                logger.exception('질문 %d 생성 알림 발행에 실패했습니다.', question.id)
+
+    def _record(self, committed: int, failed: int, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._commit_seconds += elapsed
+            self._failed += failed
+            if committed:
+                self._batches += 1
+                self._items += committed
+                self._max_batch_seen = max(self._max_batch_seen, committed)
+                self._size_counts[committed] += 1
+        if committed:
+            GROUP_COMMIT_BATCH_SIZE.observe(committed, (self.name,))
+
+    def stats(self) -> Dict[str, Any]:
+        """커밋한 배치 수와 달성한 배치 크기 분포를 반환합니다."""
+        with self._lock:
+            batches, items = self._batches, self._items
+            return {
+                'enabled': self._thread is not None,
+                'max_batch': self.max_batch,
+                'max_delay_ms': self.max_delay * 1000,
+                'queue_depth': self._queue.qsize(),
+                'batches': batches,
+                'committed': items,
+                'failed': self._failed,
+                'retried_batches': self._retried_batches,
+                'avg_batch_size': round(items / batches, 2) if batches else None,
+                'max_batch_size': self._max_batch_seen,
+                'avg_commit_ms': round(self._commit_seconds * 1000 / batches, 3) if batches else None,
+                'batch_sizes': {str(size): count for size, count in sorted(self._size_counts.items())},
+            }
+
+
+# 동작: BOARD_GROUP_COMMIT=1 일 때만 만들고, main.py의 startup/shutdown 이벤트에서 시작/종료합니다.
+question_writer: Optional[GroupCommitWriter] = GroupCommitWriter() if GROUP_COMMIT_ENABLED else None
@@ -0,0 +1,214 @@
+"""
+질문(Question) 가져오기 서비스
+
+NDJSON 또는 CSV 형식의 업로드 본문을 받은 조각(bytes) 단위로 읽어 한 줄씩 해석하고,
+QuestionCreate로 검증한 레코드를 배치 트랜잭션으로 저장합니다.
+
+업로드 전체를 메모리에 올리지 않으며, 한 번에 보관하는 것은 수신 중인 줄 하나와
+저장 대기 중인 배치 하나(batch_size개) 뿐입니다.
+"""
+import codecs
+import csv
+import json
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from config import BULK_BATCH_SIZE
+from schemas import QuestionCreate
+from domain.question.service import create_questions_bulk
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ('ndjson', 'csv')
+MAX_LINE_CHARS = 1024 * 1024
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportProgress:
+    """
+    진행 중인 가져오기 작업의 진행 상황
+
+    가져오기를 실행하는 스레드만 값을 바꾸고, 진단 엔드포인트는 snapshot()으로 읽습니다.
+    에러 상세는 메모리를 제한하기 위해 처음 MAX_REPORTED_ERRORS개까지만 보관합니다.
+    """
+
+    def __init__(self, fmt: str):
+        self.import_id = uuid.uuid4().hex[:12]
+        self.format = fmt
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.records = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.batches = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    def reject(self, line: int, errors: List[Dict[str, Any]]) -> None:
+        """레코드 하나를 거부로 기록합니다."""
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'errors': errors})
+
+    def snapshot(self) -> Dict[str, Any]:
+        """진행 상황을 딕셔너리로 반환합니다. (에러 상세 제외)"""
+        end = self.finished_at if self.finished_at is not None else time.time()
+        elapsed = end - self.started_at
+        return {
+            'import_id': self.import_id,
+            'format': self.format,
+            'finished': self.finished_at is not None,
+            'records': self.records,
+            'accepted': self.accepted,
+            'rejected': self.rejected,
+            'batches': self.batches,
+            'elapsed_s': round(elapsed, 3),
+            'records_per_s': round(self.records / elapsed, 1) if elapsed > 0 else None,
+        }
+
+
+# 동작: 진행 중인 가져오기 작업 (import_id -> ImportProgress). 완료되면 제거합니다.
+_active_imports: Dict[str, ImportProgress] = {}
+_active_lock = threading.Lock()
+
+
+def get_active_imports() -> List[Dict[str, Any]]:
+    """진행 중인 가져오기 작업의 진행 상황 목록을 반환합니다."""
+    with _active_lock:
+        return [progress.snapshot() for progress in _active_imports.values()]
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    bytes 조각을 UTF-8로 디코딩해 줄 단위(줄바꿈 포함)로 반환합니다.
+
+    조각 경계에서 잘린 멀티바이트 문자와 줄은 다음 조각과 이어 붙입니다.
+    맨 앞의 BOM은 제거합니다.
+
+    Raises:
+        ValueError: 올바른 UTF-8이 아니거나 한 줄이 MAX_LINE_CHARS보다 긴 경우
+    """
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    pending = ''
+    try:
+        for chunk in chunks:
+            pending += decoder.decode(chunk)
+            lines = pending.split('\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line + '\n'
+            if len(pending) > MAX_LINE_CHARS:
+                raise ValueError(f'한 줄의 길이가 {MAX_LINE_CHARS}자를 넘습니다.')
+        pending += decoder.decode(b'', final=True)
+    except UnicodeDecodeError as exc:
+        raise ValueError('본문이 올바른 UTF-8 텍스트가 아닙니다.') from exc
+    if pending:
+        yield pending
+
+
+def _iter_ndjson_records(lines: Iterable[str]) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """NDJSON 줄을 (줄 번호, 해석한 값, 해석 에러 메시지)로 반환합니다. 빈 줄은 건너뜁니다."""
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line), None
+        except json.JSONDecodeError as exc:
+            yield line_no, None, f'JSON 형식이 올바르지 않습니다: {exc.msg}'
+
+
+def _iter_csv_records(lines: Iterable[str]) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """
+    CSV 줄을 (줄 번호, 레코드 딕셔너리, None)으로 반환합니다.
+
+    첫 줄은 머리글이어야 하며 subject, content 외의 컬럼(내보내기의 id, create_date 등)은
+    무시하므로 GET /questions/export?format=csv 결과를 그대로 가져올 수 있습니다.
+
+    Raises:
+        ValueError: 머리글에 subject 또는 content 컬럼이 없는 경우
+    """
+    reader = csv.DictReader(lines)
+    missing = {'subject', 'content'} - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"CSV 머리글에 {', '.join(sorted(missing))} 컬럼이 없습니다.")
+    for row in reader:
+        yield reader.line_num, {'subject': row['subject'], 'content': row['content']}, None
+
+
+def import_questions(
+    db: Session,
+    fmt: str,
+    chunks: Iterable[bytes],
+    batch_size: int = BULK_BATCH_SIZE
+) -> ImportProgress:
+    """
+    NDJSON 또는 CSV 본문 조각을 읽어 질문을 배치 단위로 저장합니다.
+
+    레코드를 QuestionCreate로 검증하고, 통과한 레코드가 batch_size개 모이면
+    create_questions_bulk로 한 트랜잭션에 저장합니다. 검증이나 저장에 실패한
+    레코드는 거부로 집계하고 나머지 레코드는 계속 처리합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        fmt: 'ndjson' 또는 'csv'
+        chunks: 요청 본문 bytes 조각 이터레이터
+        batch_size: 한 트랜잭션에 저장할 최대 질문 수
+
+    Returns:
+        처리 결과 (ImportProgress)
+
+    Raises:
+        ValueError: 지원하지 않는 형식이거나 본문을 해석할 수 없는 경우.
+            이때도 이미 커밋된 배치는 유지됩니다.
+    """
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f'지원하지 않는 가져오기 형식입니다: {fmt}')
+    progress = ImportProgress(fmt)
+    with _active_lock:
+        _active_imports[progress.import_id] = progress
+
+    batch: List[QuestionCreate] = []
+    batch_lines: List[int] = []
+
+    def flush() -> None:
+        created_ids = create_questions_bulk(db, batch, batch_size=batch_size)
+        for line_no, question_id in zip(batch_lines, created_ids):
+            if question_id is None:
+                progress.reject(line_no, [{'loc': [], 'msg': '데이터베이스 저장에 실패했습니다.'}])
+            else:
+                progress.accepted += 1
+        progress.batches += 1
+        logger.info('질문 가져오기 %s: %d건 처리 (저장 %d, 거부 %d)',
+                    progress.import_id, progress.records, progress.accepted, progress.rejected)
+        batch.clear()
+        batch_lines.clear()
+
+    try:
+        lines = iter_lines(chunks)
+        records = _iter_csv_records(lines) if fmt == 'csv' else _iter_ndjson_records(lines)
+        for line_no, record, parse_error in records:
+            progress.records += 1
+            if parse_error is not None:
+                progress.reject(line_no, [{'loc': [], 'msg': parse_error}])
+                continue
+            try:
+                batch.append(QuestionCreate.model_validate(record))
+                batch_lines.append(line_no)
+            except ValidationError as exc:
+                progress.reject(line_no, [
+                    {'loc': list(e['loc']), 'msg': e['msg']} for e in exc.errors()
+                ])
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    except csv.Error as exc:
+        raise ValueError(f'CSV 형식이 올바르지 않습니다: {exc}') from exc
+    finally:
+        progress.finished_at = time.time()
+        with _active_lock:
+            _active_imports.pop(progress.import_id, None)
+    return progress
@@ -0,0 +1,146 @@
+"""
+질문(Question) 목록 조회 공용 모듈
+
+GET /questions와 GET /api/question/list는 동기/비동기 라우트가 모두 같은 규칙으로
+목록을 응답합니다. 이 모듈은 DB 조회를 뺀 나머지를 한 곳에 모아 네 라우트가 함께 씁니다.
+
+- list_params: 쿼리 파라미터 선언과 fields 해석 (FastAPI 의존성)
+- ListPage: 캐시 키, ETag/304 판단, 캐시된 본문 반환, 조회 결과로 응답 본문 만들기
+
+라우트는 ListPage.cached_response()가 None일 때만 세션을 열어 get_question_rows와
+get_question_total을 (동기 또는 await로) 호출하고, 결과를 ListPage.respond()에 넘깁니다.
+"""
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional, Sequence, Tuple
+from fastapi import HTTPException, Query, Response
+from cache import get_data_version, list_cache, list_etag, etag_matches
+from config import MAX_PAGE_SIZE
+from domain.question.serialization import LIST_DEFAULT_FIELDS, parse_fields, question_list_body
+
+
+class ListParams:
+    """질문 목록 조회 파라미터 (fields는 해석된 필드 튜플)"""
+
+    def __init__(
+        self,
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+        fields: Tuple[str, ...],
+        created_after: Optional[datetime],
+        created_before: Optional[datetime],
+        order: str
+    ):
+        self.skip = skip
+        self.limit = limit
+        self.cursor = cursor
+        self.fields = fields
+        self.created_after = created_after
+        self.created_before = created_before
+        self.order = order
+
+    def cache_key(self, version: int) -> tuple:
+        """데이터 버전과 모든 파라미터로 목록 캐시 키를 만듭니다."""
+        return (
+            'question_list', version, self.skip, self.cursor, self.limit, self.fields,
+            self.created_after, self.created_before, self.order
+        )
+
+    def query_kwargs(self) -> Dict[str, Any]:
+        """service/async_service의 get_question_rows에 넘길 키워드 인자를 반환합니다."""
+        return {
+            'skip': self.skip,
+            'limit': self.limit,
+            'cursor': self.cursor,
+            'fields': self.fields,
+            'created_after': self.created_after,
+            'created_before': self.created_before,
+            'order': self.order,
+        }
+
+
+def list_params(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    order: Literal['asc', 'desc'] = 'asc'
+) -> ListParams:
+    """
+    질문 목록 조회의 쿼리 파라미터를 받아 ListParams로 만드는 의존성
+
+    Args:
+        skip: 건너뛸 레코드 수 (cursor가 없을 때만 사용)
+        limit: 최대 조회할 레코드 수 (1 이상 BOARD_MAX_PAGE_SIZE 이하)
+        cursor: 이전 응답의 next_cursor 값 (키셋 페이지네이션)
+        fields: 응답에 포함할 필드 (쉼표로 구분). 생략하면 id, subject, create_date만 조회하고
+            크기가 큰 content는 요청할 때만 조회
+        created_after: 지정하면 작성일시가 이 시각 이상인 질문만 조회 (ISO 8601)
+        created_before: 지정하면 작성일시가 이 시각 미만인 질문만 조회 (ISO 8601)
+        order: 'asc'(오래된 순, 기본값) 또는 'desc'(최신 순). cursor는 같은 order로 받은 값을 넘김
+
+    Returns:
+        ListParams
+
+    Raises:
+        HTTPException: fields 형식이 올바르지 않은 경우 400 에러
+    """
+    try:
+        selected = parse_fields(fields, default=LIST_DEFAULT_FIELDS)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return ListParams(skip, limit, cursor, selected, created_after, created_before, order)
+
+
+class ListPage:
+    """
+    목록 요청 하나의 캐시 키, ETag, 응답을 다루는 객체
+
+    데이터 버전은 생성할 때(DB 조회보다 먼저) 읽으므로, 조회 도중 들어온 쓰기가
+    이전 버전 키로 저장된 응답에 섞이지 않습니다.
+    """
+
+    def __init__(self, params: ListParams, if_none_match: Optional[str]):
+        self.params = params
+        self.if_none_match = if_none_match
+        self.version = get_data_version()
+        self.etag = list_etag(self.version)
+        self.cache_key = params.cache_key(self.version)
+
+    def cached_response(self) -> Optional[Response]:
+        """
+        DB를 조회하지 않고 보낼 수 있는 응답을 반환합니다.
+
+        Returns:
+            If-None-Match가 일치하면 304, 캐시에 본문이 있으면 200 응답, 둘 다 아니면 None
+        """
+        if etag_matches(self.if_none_match, self.etag):
+            return Response(status_code=304, headers={'ETag': self.etag})
+        body = list_cache.get(self.cache_key)
+        if body is not None:
+            return Response(content=body, media_type='application/json', headers={'ETag': self.etag})
+        return None
+
+    def respond(self, rows: Sequence[Sequence[Any]], total: int, stale: bool) -> Response:
+        """
+        조회 결과 행으로 응답을 만들고 목록 캐시에 보관합니다.
+
+        ORM 객체와 Pydantic 모델을 만들지 않고 행을 바로 JSON bytes로 직렬화합니다.
+
+        Args:
+            rows: get_question_rows(**params.query_kwargs())의 결과
+            total: 전체 질문 수 (get_question_total)
+            stale: 복제본 세션에서 조회했는지 여부 (database.is_stale_session)
+
+        Returns:
+            질문 목록 응답
+        """
+        body = question_list_body(rows, self.params.limit, total, self.params.fields)
+        if stale:
+            # 동작: 복제본의 조회 결과는 주 DB 기준인 데이터 버전과 맞지 않을 수 있으므로
+            # 캐시하지 않고 ETag도 붙이지 않습니다.
+            return Response(content=body, media_type='application/json')
+        list_cache.set(self.cache_key, body)
+        return Response(content=body, media_type='application/json', headers={'ETag': self.etag})
@@ -0,0 +1,130 @@
+"""
+질문(Question) 커서 페이지네이션 유틸리티
+
+(create_date, id) 키셋을 불투명한(opaque) 커서 문자열로 변환합니다.
+검색 결과용 (rank, id) 커서와 변경 피드용 change_seq 커서도 같은 형식을 사용합니다.
+OFFSET 방식과 달리 앞 페이지의 행을 건너뛰며 읽지 않으므로
+몇 번째 페이지든 인덱스 탐색 한 번으로 조회됩니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+def _encode(values: List[Any]) -> str:
+    """JSON 직렬화 가능한 값 목록을 URL-safe base64 문자열로 인코딩합니다."""
+    raw = json.dumps(values, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode(cursor: str) -> Any:
+    """_encode로 만든 문자열을 값 목록으로 되돌립니다."""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def encode_cursor(create_date: datetime, question_id: int) -> str:
+    """
+    키셋 값을 커서 문자열로 인코딩합니다.
+
+    Args:
+        create_date: 마지막으로 반환된 질문의 작성일시
+        question_id: 마지막으로 반환된 질문의 ID
+
+    Returns:
+        URL에 그대로 넣을 수 있는 base64 커서 문자열
+    """
+    return _encode([create_date.isoformat(), question_id])
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 키셋 값으로 디코딩합니다.
+
+    Args:
+        cursor: encode_cursor로 만든 커서 문자열
+
+    Returns:
+        (create_date, id) 튜플
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        create_date, question_id = _decode(cursor)
+        return datetime.fromisoformat(create_date), int(question_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError('잘못된 커서입니다.') from exc
+
+
+def encode_rank_cursor(rank: float, question_id: int) -> str:
+    """
+    검색 결과용 (rank, id) 키셋 값을 커서 문자열로 인코딩합니다.
+
+    Args:
+        rank: 마지막으로 반환된 결과의 bm25 점수
+        question_id: 마지막으로 반환된 결과의 질문 ID
+
+    Returns:
+        URL에 그대로 넣을 수 있는 base64 커서 문자열
+    """
+    return _encode([rank, question_id])
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    검색 결과용 커서 문자열을 (rank, id)로 디코딩합니다.
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        rank, question_id = _decode(cursor)
+        return float(rank), int(question_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError('잘못된 커서입니다.') from exc
+
+
+def encode_change_cursor(change_seq: int) -> str:
+    """
+    변경 피드용 커서 문자열을 만듭니다.
+
+    Args:
+        change_seq: 마지막으로 반환된 변경의 순번
+
+    Returns:
+        URL에 그대로 넣을 수 있는 base64 커서 문자열
+    """
+    return _encode([change_seq])
+
+
+def decode_change_cursor(cursor: str) -> int:
+    """
+    변경 피드용 커서 문자열을 change_seq로 디코딩합니다.
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        (change_seq,) = _decode(cursor)
+        return int(change_seq)
+    except (TypeError, ValueError) as exc:
+        raise ValueError('잘못된 커서입니다.') from exc
+
+
+def next_cursor(questions: Sequence, limit: int) -> Optional[str]:
+    """
+    다음 페이지 커서를 계산합니다.
+
+    Args:
+        questions: 현재 페이지의 질문 목록 (create_date, id 순으로 정렬됨)
+        limit: 요청한 최대 조회 개수
+
+    Returns:
+        다음 페이지가 있을 수 있으면 커서 문자열, 마지막 페이지면 None
+    """
+    if limit <= 0 or len(questions) < limit:
+        return None
+    last = questions[-1]
+    return encode_cursor(last.create_date, last.id)
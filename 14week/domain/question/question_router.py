@@ -1,66 +1,172 @@
 """
 질문(Question) 라우터 정의
 
-질문 목록 조회 및 등록 API 엔드포인트를 정의합니다.
+질문 목록 조회 및 등록 API 엔드포인트와 질문 변경 이벤트 스트림(SSE, WebSocket)을 정의합니다.
 """
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from database import get_db
-from schemas import ApiResponse, Question, QuestionCreate
-from domain.question.service import get_questions, create_question
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, WebSocket, status
+from fastapi.responses import StreamingResponse
+from starlette.websockets import WebSocketDisconnect
+from database import allow_stale_reads, get_db, get_read_db, is_stale_session
+from schemas import ApiResponse, QuestionCreate, QuestionListApiResponse
+from domain.question.service import get_question_rows, get_question_total, create_question
+from domain.question.events import TooManySubscribersError, question_events
+from domain.question.group_commit import WriterBusyError, question_writer
+from domain.question.listing import ListPage, ListParams, list_params
 
 router = APIRouter(prefix='/api/question')
 
 
-@router.get('/list', response_model=ApiResponse)
+@router.get('/list', response_model=QuestionListApiResponse)
+@allow_stale_reads
 def question_list(
-    skip: int = 0,
-    limit: int = 100,
-    # get_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
-    db_context = Depends(get_db)
+    params: ListParams = Depends(list_params),
+    if_none_match: Optional[str] = Header(None),
+    # get_read_db는 contextmanager로 정의되었으므로 의존성 주입 시 컨텍스트 관리자 객체가 주입됨
+    # 조회 전용이므로 쓰기 풀 대신 읽기 전용 풀의 세션을 사용
+    db_context = Depends(get_read_db)
 ) -> ApiResponse:
     """
     질문 목록을 조회합니다.
     
     Args:
-        skip: 건너뛸 레코드 수
-        limit: 최대 조회할 레코드 수
+        params: 목록 조회 파라미터 (skip, limit, cursor, fields, created_after,
+            created_before, order. listing.list_params 참고)
+        if_none_match: 클라이언트가 가진 응답의 ETag (If-None-Match 헤더)
         db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
         
     Returns:
         질문 목록을 포함한 응답
+        
+    Raises:
+        HTTPException: cursor 또는 fields 형식이 올바르지 않은 경우 400 에러
     """
+    # 클라이언트가 가진 응답이 최신이면 304, 캐시에 직렬화된 응답이 있으면
+    # DB 세션을 열지 않고 그대로 반환
+    page = ListPage(params, if_none_match)
+    response = page.cached_response()
+    if response is not None:
+        return response
+    
     # with 구문을 사용하여 DB 세션 연결 및 자동 종료 보장
     with db_context as db:
-        questions = get_questions(db, skip=skip, limit=limit)
-        
-        # Pydantic 모델(Question)을 사용하여 ORM 객체를 스키마 데이터로 변환
-        # from_attributes=True 설정 덕분에 model_validate 사용 가능
-        question_data_list = [
-            Question.model_validate(q) for q in questions
-        ]
-        
-        return ApiResponse(
-            status='success',
-            data={
-                # 변환된 Pydantic 모델 리스트를 사용
-                'questions': question_data_list,
-                'count': len(questions)
-            }
-        )
+        try:
+            rows = get_question_rows(db, **params.query_kwargs())
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        return page.respond(rows, get_question_total(db), is_stale_session(db))
 
 
 # [추가됨] 질문 등록 라우터
 @router.post('/create', status_code=status.HTTP_204_NO_CONTENT)
-def question_create(_question: QuestionCreate, db: Session = Depends(get_db)):
+def question_create(_question: QuestionCreate, db_context = Depends(get_db)):
     """
     질문을 등록합니다.
 
     Args:
         _question: 등록할 질문의 제목과 내용 (QuestionCreate 스키마)
-        db: 데이터베이스 세션 (의존성 주입)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
     
     Returns:
         None (204 No Content)
+
+    Raises:
+        HTTPException: 그룹 커밋 큐가 가득 찬 경우 503 에러
     """
-    create_question(db, _question)
\ No newline at end of file
+    if question_writer is not None:
+        try:
+            question_writer.submit(_question).result()
+        except WriterBusyError as exc:
+            raise HTTPException(status_code=503, detail=str(exc), headers={'Retry-After': '1'})
+        return
+    with db_context as db:
+        create_question(db, _question)
+
+
+# 동작: 이벤트가 없을 때 보내는 SSE 주석 줄. 프록시가 유휴 연결을 끊지 않게 합니다.
+SSE_PING = b': ping\n\n'
+
+
+@router.get('/stream')
+async def question_stream():
+    """
+    질문 생성/수정/삭제 이벤트를 Server-Sent Events로 전달합니다.
+
+    DB 세션을 쓰지 않고 이벤트 루프 위에서 기다리므로 쉬고 있는 연결은 스레드를 차지하지 않습니다.
+    이벤트 형식은 domain/question/events.py를 참고하세요.
+
+    Returns:
+        text/event-stream 스트리밍 응답
+
+    Raises:
+        HTTPException: 동시 구독자 수가 BOARD_STREAM_MAX_SUBSCRIBERS에 도달한 경우 503 에러
+    """
+    try:
+        subscriber = question_events.subscribe()
+    except TooManySubscribersError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={'Retry-After': '5'})
+
+    async def event_stream():
+        try:
+            # 동작: 헤더가 바로 전달되도록 연결 직후 ping을 한 번 보냅니다.
+            yield SSE_PING
+            async for event in question_events.listen(subscriber):
+                yield SSE_PING if event is None else event.sse
+        finally:
+            # 동작: 클라이언트가 연결을 끊으면 제너레이터가 취소되며 여기서 구독을 해제합니다.
+            question_events.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@router.websocket('/ws')
+async def question_ws(websocket: WebSocket):
+    """
+    질문 생성/수정/삭제 이벤트를 WebSocket 텍스트 메시지(JSON)로 전달합니다.
+
+    GET /api/question/stream과 같은 이벤트를 보내며, 클라이언트가 보내는 메시지는 무시합니다.
+    uvicorn으로 실행할 때는 선택 패키지 websockets(또는 wsproto)가 설치되어 있어야 합니다.
+
+    Args:
+        websocket: WebSocket 연결
+    """
+    try:
+        subscriber = question_events.subscribe()
+    except TooManySubscribersError:
+        # 동작: 1013(Try Again Later)으로 연결을 거절합니다.
+        await websocket.close(code=1013)
+        return
+    await websocket.accept()
+
+    async def pump():
+        async for event in question_events.listen(subscriber):
+            if event is None:
+                continue  # WebSocket은 서버가 ping 프레임으로 연결을 유지함
+            await websocket.send_text(event.json.decode())
+            if event.final:
+                await websocket.close(code=1001 if event.type == 'close' else 1000)
+
+    async def drain():
+        # 동작: 클라이언트 메시지를 읽어 버리며 연결 종료를 감지합니다.
+        while True:
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                return
+
+    tasks = [asyncio.ensure_future(pump()), asyncio.ensure_future(drain())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        question_events.unsubscribe(subscriber)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, WebSocketDisconnect, RuntimeError):
+                pass
@@ -0,0 +1,140 @@
+"""
+질문(Question) 전문 검색 서비스
+
+question_fts(FTS5, trigram 토크나이저) 테이블로 제목과 내용을 검색합니다.
+인덱스는 migrations.py에서 만든 트리거가 question 테이블과 동기화합니다.
+
+trigram 토크나이저는 3글자 미만의 검색어를 인덱스로 찾지 못하므로,
+'질문'처럼 짧은 검색어는 LIKE 조건으로 걸러냅니다.
+"""
+from typing import Any, Dict, List, Optional
+from sqlalchemy import DateTime, text
+from sqlalchemy.orm import Session
+from domain.question.pagination import decode_rank_cursor, encode_rank_cursor
+
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_END = '</mark>'
+SNIPPET_TOKENS = 32
+MIN_TRIGRAM_LENGTH = 3
+
+
+def _match_expression(terms: List[str]) -> str:
+    """검색어 목록을 FTS5 MATCH 식으로 만듭니다. 각 검색어는 구문(phrase)으로 취급합니다."""
+    return ' AND '.join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _like_pattern(term: str) -> str:
+    """LIKE 특수문자를 이스케이프한 부분 일치 패턴을 만듭니다."""
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def _highlight(value: str, terms: List[str], limit: Optional[int] = None) -> str:
+    """
+    LIKE 검색 결과에 FTS5 snippet과 같은 형식의 강조 표시를 붙입니다.
+
+    Args:
+        value: 원문
+        terms: 강조할 검색어 목록
+        limit: 지정하면 첫 일치 위치 주변의 limit 글자만 남김
+    """
+    if limit is not None and len(value) > limit:
+        positions = [value.find(term) for term in terms if term in value]
+        start = max(0, min(positions) - limit // 4) if positions else 0
+        clipped = value[start:start + limit]
+        value = ('…' if start > 0 else '') + clipped + ('…' if start + limit < len(value) else '')
+    for term in sorted(set(terms), key=len, reverse=True):
+        value = value.replace(term, f'{HIGHLIGHT_START}{term}{HIGHLIGHT_END}')
+    return value
+
+
+def search_questions(
+    db: Session,
+    q: str,
+    limit: int = 20,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    제목과 내용에서 질문을 검색합니다.
+
+    결과는 bm25 점수(낮을수록 관련도가 높음)와 id 순으로 정렬되며,
+    (rank, id) 키셋 커서로 다음 페이지를 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        q: 공백으로 구분된 검색어 (모든 검색어를 포함하는 질문을 찾음)
+        limit: 최대 조회할 결과 수
+        cursor: 이전 응답의 next_cursor 값
+
+    Returns:
+        results(검색 결과 딕셔너리 리스트)와 next_cursor를 담은 딕셔너리
+
+    Raises:
+        ValueError: 검색어가 비어 있거나 cursor 형식이 올바르지 않은 경우
+    """
+    terms = q.split()
+    if not terms:
+        raise ValueError('검색어를 입력해 주세요.')
+    long_terms = [t for t in terms if len(t) >= MIN_TRIGRAM_LENGTH]
+    short_terms = [t for t in terms if len(t) < MIN_TRIGRAM_LENGTH]
+
+    params: Dict[str, Any] = {'limit': limit}
+    # 동작: 삭제 표시된 질문은 제목/내용을 비워 두므로 일치하지 않지만, 조건으로도 제외합니다.
+    conditions = ['q.deleted_at IS NULL']
+    for i, term in enumerate(short_terms):
+        params[f'like_{i}'] = _like_pattern(term)
+        conditions.append(
+            f"(q.subject LIKE :like_{i} ESCAPE '\\' OR q.content LIKE :like_{i} ESCAPE '\\')"
+        )
+
+    if long_terms:
+        # 동작: FTS5 인덱스로 후보를 찾고 bm25로 정렬합니다.
+        # rank 숨은 컬럼은 기본적으로 bm25(question_fts) 값과 같습니다.
+        params['match'] = _match_expression(long_terms)
+        conditions.insert(0, 'question_fts MATCH :match')
+        rank_expr = 'question_fts.rank'
+        select_sql = (
+            'SELECT q.id, q.create_date, question_fts.rank AS rank, '
+            f"highlight(question_fts, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}') AS subject, "
+            f"snippet(question_fts, 1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', {SNIPPET_TOKENS}) AS snippet "
+            'FROM question_fts JOIN question q ON q.id = question_fts.rowid'
+        )
+    else:
+        # 동작: 모든 검색어가 trigram보다 짧으면 인덱스를 쓸 수 없으므로 LIKE로 찾습니다.
+        rank_expr = '0.0'
+        select_sql = (
+            'SELECT q.id, q.create_date, 0.0 AS rank, q.subject AS subject, q.content AS snippet '
+            'FROM question q'
+        )
+
+    if cursor is not None:
+        params['cursor_rank'], params['cursor_id'] = decode_rank_cursor(cursor)
+        conditions.append(
+            f'({rank_expr} > :cursor_rank OR ({rank_expr} = :cursor_rank AND q.id > :cursor_id))'
+        )
+
+    sql = (
+        f"{select_sql} WHERE {' AND '.join(conditions)} "
+        f'ORDER BY {rank_expr}, q.id LIMIT :limit'
+    )
+    rows = db.execute(text(sql).columns(create_date=DateTime), params).mappings().all()
+
+    results = []
+    for row in rows:
+        subject, snippet = row['subject'], row['snippet']
+        if not long_terms:
+            subject = _highlight(subject, short_terms)
+            snippet = _highlight(snippet, short_terms, limit=SNIPPET_TOKENS * 3)
+        results.append({
+            'id': row['id'],
+            'subject': subject,
+            'snippet': snippet,
+            'create_date': row['create_date'],
+            'rank': row['rank'],
+        })
+
+    next_cursor = None
+    if limit > 0 and len(results) == limit:
+        last = results[-1]
+        next_cursor = encode_rank_cursor(last['rank'], last['id'])
+    return {'results': results, 'next_cursor': next_cursor}
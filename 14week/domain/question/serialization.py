@@ -0,0 +1,170 @@
+"""
+질문(Question) 응답 직렬화 모듈
+
+목록 응답을 ORM 객체, Pydantic 모델, ApiResponse를 거치지 않고 조회 결과 행에서
+바로 JSON bytes로 만듭니다. 결과는 ApiResponse(...).model_dump_json()과 같은 형태입니다.
+
+orjson이 설치되어 있으면 사용하고(datetime도 직접 직렬화), 없으면 표준 json 모듈로
+같은 결과를 만듭니다.
+"""
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
+from metrics import add_serialization_time
+from domain.question.pagination import encode_change_cursor, next_cursor
+
+try:
+    import orjson
+except ImportError:  # orjson이 없는 환경에서는 표준 json 사용
+    orjson = None
+
+# 동작: 응답에 포함할 수 있는 질문 필드 (응답의 키 순서도 이 순서를 따름)
+QUESTION_FIELDS = ('id', 'subject', 'content', 'create_date')
+# 동작: 목록 조회의 기본 필드. 크기가 큰 content는 fields로 요청할 때만 조회합니다.
+LIST_DEFAULT_FIELDS = ('id', 'subject', 'create_date')
+
+
+def parse_fields(
+    fields: Optional[str],
+    default: Tuple[str, ...] = QUESTION_FIELDS
+) -> Tuple[str, ...]:
+    """
+    fields 쿼리 파라미터(예: 'subject,create_date')를 응답 필드 튜플로 바꿉니다.
+
+    id는 요청하지 않아도 항상 포함하며, 순서는 QUESTION_FIELDS 순서로 맞춥니다.
+
+    Args:
+        fields: 쉼표로 구분한 필드 이름. None이거나 비어 있으면 default 사용
+        default: fields가 없을 때 사용할 필드 튜플
+
+    Returns:
+        응답에 포함할 필드 이름 튜플
+
+    Raises:
+        ValueError: 알 수 없는 필드 이름이 있는 경우
+    """
+    if fields is None or not fields.strip():
+        return default
+    requested = {name.strip() for name in fields.split(',') if name.strip()}
+    unknown = requested - set(QUESTION_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"알 수 없는 필드입니다: {', '.join(sorted(unknown))} "
+            f"(사용 가능: {', '.join(QUESTION_FIELDS)})"
+        )
+    requested.add('id')
+    return tuple(name for name in QUESTION_FIELDS if name in requested)
+
+
+def question_dict(row: Any, fields: Sequence[str]) -> Dict[str, Any]:
+    """행(Row 또는 ORM 객체)에서 fields에 해당하는 값만 골라 딕셔너리로 만듭니다."""
+    data = {name: getattr(row, name) for name in fields}
+    if 'create_date' in data:
+        data['create_date'] = data['create_date'].isoformat()
+    return data
+
+
+def _default(value: Any) -> Any:
+    """표준 json 모듈이 처리하지 못하는 값을 변환합니다."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'JSON으로 직렬화할 수 없는 값입니다: {type(value).__name__}')
+
+
+def dumps(value: Any) -> bytes:
+    """값을 UTF-8 JSON bytes로 직렬화합니다. (공백 없이, 한글은 이스케이프하지 않음)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(
+        value, ensure_ascii=False, separators=(',', ':'), default=_default
+    ).encode('utf-8')
+
+
+def question_list_body(
+    rows: Sequence[Sequence[Any]],
+    limit: int,
+    total: int,
+    fields: Sequence[str] = QUESTION_FIELDS,
+    message: Optional[str] = None
+) -> bytes:
+    """
+    조회 결과 행 목록으로 질문 목록 응답 본문을 만듭니다.
+
+    Args:
+        rows: 같은 fields로 조회한 service.get_question_rows의 결과
+            (앞쪽 컬럼이 fields 순서와 같음)
+        limit: 요청한 최대 개수 (next_cursor 계산용)
+        total: 전체 질문 수
+        fields: 응답에 포함할 필드
+        message: 응답 메시지
+
+    Returns:
+        {"status", "message", "data": {"questions", "count", "total", "next_cursor"}} JSON bytes
+    """
+    started = time.perf_counter()
+    body = dumps({
+        'status': 'success',
+        'message': message,
+        'data': {
+            # 동작: zip은 짧은 쪽에서 멈추므로 커서 계산용으로 덧붙인 뒤쪽 컬럼은 제외됩니다.
+            'questions': [dict(zip(fields, row)) for row in rows],
+            'count': len(rows),
+            'total': total,
+            'next_cursor': next_cursor(rows, limit),
+        },
+    })
+    add_serialization_time(time.perf_counter() - started)
+    return body
+
+
+def question_changes_body(
+    rows: Sequence[Any],
+    limit: int,
+    since: Optional[str] = None
+) -> bytes:
+    """
+    변경 피드(GET /questions/changes) 응답 본문을 만듭니다.
+
+    삭제된 질문은 deleted가 true이고 subject, content가 null인 항목으로 나갑니다.
+
+    Args:
+        rows: limit + 1개를 요청한 service.get_question_changes의 결과
+            (limit개보다 많으면 뒤에 변경이 더 있다는 뜻)
+        limit: 요청한 최대 개수
+        since: 요청의 since 값 (변경이 없으면 next_cursor로 그대로 돌려줌)
+
+    Returns:
+        {"status", "message", "data": {"changes", "count", "has_more", "next_cursor"}} JSON bytes
+    """
+    started = time.perf_counter()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    changes = []
+    for row in rows:
+        deleted = row.deleted_at is not None
+        changes.append({
+            'id': row.id,
+            'deleted': deleted,
+            'subject': None if deleted else row.subject,
+            'content': None if deleted else row.content,
+            'create_date': row.create_date,
+            'updated_at': row.updated_at,
+            'version': row.version,
+        })
+    if rows:
+        cursor = encode_change_cursor(rows[-1].change_seq)
+    else:
+        cursor = since if since is not None else encode_change_cursor(0)
+    body = dumps({
+        'status': 'success',
+        'message': None,
+        'data': {
+            'changes': changes,
+            'count': len(changes),
+            'has_more': has_more,
+            'next_cursor': cursor,
+        },
+    })
+    add_serialization_time(time.perf_counter() - started)
+    return body
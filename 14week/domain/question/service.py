@@ -3,10 +3,50 @@
 
 데이터베이스와의 CRUD 작업을 담당하는 서비스 레이어입니다.
 """
+import logging
+from datetime import datetime
+from sqlalchemy import Select, Update, func, insert, select, tuple_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from models import Question
+from typing import List, Optional, Sequence
+from config import BULK_BATCH_SIZE
+from cache import bump_data_version
+from models import Question, RowCounter
 from schemas import QuestionCreate, QuestionUpdate
+from domain.question.events import (
+    publish_created,
+    publish_deleted,
+    publish_resync,
+    publish_updated
+)
+from domain.question.pagination import decode_change_cursor, decode_cursor
+from domain.question.serialization import QUESTION_FIELDS
+
+logger = logging.getLogger(__name__)
+
+
+# 동작: 수정 응답을 만드는 데 필요한 컬럼 (UPDATE ... RETURNING 대상)
+RETURNING_COLUMNS = (
+    Question.id, Question.subject, Question.content, Question.create_date, Question.version
+)
+
+
+# 동작: 삭제 표시(tombstone)되지 않은 질문만 고르는 조건. 조회와 수정 경로에 모두 붙입니다.
+LIVE_QUESTION = Question.deleted_at.is_(None)
+
+# 동작: 목록 조회에서 허용하는 정렬 방향 (create_date, id 기준)
+LIST_ORDERS = ('asc', 'desc')
+
+# 동작: 변경 피드(GET /questions/changes) 항목을 만드는 데 필요한 컬럼
+CHANGE_COLUMNS = (
+    Question.change_seq, Question.id, Question.subject, Question.content,
+    Question.create_date, Question.updated_at, Question.deleted_at, Question.version
+)
+
+
+class VersionConflictError(Exception):
+    """수정하려는 질문의 버전이 요청에서 기대한 버전(If-Match)과 다를 때 발생하는 예외"""
 
 
 def create_question(db: Session, question: QuestionCreate) -> Question:
@@ -30,7 +70,9 @@ def create_question(db: Session, question: QuestionCreate) -> Question:
         )
         db.add(db_question)
         db.commit()  # 트랜잭션 커밋 (Durability 보장)
+        bump_data_version()  # 목록 캐시 무효화
         db.refresh(db_question)  # DB에서 최신 데이터 조회
+        publish_created(db_question)  # 실시간 구독자에게 알림
         return db_question
     except Exception:
         # 에러 발생 시 롤백하여 트랜잭션 원자성 보장 (Atomicity)
@@ -38,6 +80,73 @@ def create_question(db: Session, question: QuestionCreate) -> Question:
         raise
 
 
+def insert_questions(
+    db: Session,
+    questions: Sequence[QuestionCreate],
+    create_date: datetime
+) -> List[int]:
+    """
+    질문들을 executemany INSERT 한 번으로 추가하고 생성된 ID를 반환합니다. (커밋하지 않음)
+    
+    생성된 ID는 RETURNING 대신 INSERT 직후의 MAX(id)로 계산합니다. 트랜잭션이
+    쓰기 잠금을 쥐고 있는 동안 다른 쓰기는 끼어들 수 없고, SQLite는 새 행에
+    MAX(id) + 1을 부여하므로 한 번에 넣은 행의 ID는 항상 연속입니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        questions: 생성할 질문 정보 (검증 완료된 QuestionCreate)
+        create_date: 모든 질문에 사용할 작성일시
+        
+    Returns:
+        입력 순서와 같은 순서의 생성된 질문 ID 리스트
+    """
+    db.execute(insert(Question), [
+        {'subject': q.subject, 'content': q.content, 'create_date': create_date}
+        for q in questions
+    ])
+    last_id = db.execute(select(func.max(Question.id))).scalar_one()
+    return list(range(last_id - len(questions) + 1, last_id + 1))
+
+
+def create_questions_bulk(
+    db: Session,
+    questions: List[QuestionCreate],
+    batch_size: int = BULK_BATCH_SIZE
+) -> List[Optional[int]]:
+    """
+    여러 질문을 batch_size 단위의 트랜잭션으로 나누어 한 번에 생성합니다.
+    
+    배치마다 executemany INSERT 한 번과 커밋 한 번만 실행하므로, 질문마다
+    add + commit + refresh를 반복하는 create_question보다 왕복 횟수와
+    fsync 횟수가 배치 크기만큼 줄어듭니다. (ID 계산 방식은 insert_questions 참고)
+    
+    Args:
+        db: 데이터베이스 세션
+        questions: 생성할 질문 정보 리스트 (검증 완료된 QuestionCreate)
+        batch_size: 한 트랜잭션에 넣을 최대 질문 수
+        
+    Returns:
+        입력 순서와 같은 순서의 생성된 질문 ID 리스트.
+        저장에 실패한 배치의 항목은 None (해당 배치만 롤백되고 나머지 배치는 계속 진행)
+    """
+    ids: List[Optional[int]] = []
+    for start in range(0, len(questions), batch_size):
+        chunk = questions[start:start + batch_size]
+        try:
+            chunk_ids = insert_questions(db, chunk, datetime.now())
+            db.commit()  # 배치 단위 커밋 (배치 안에서는 원자성 보장)
+        except SQLAlchemyError:
+            # 에러 발생 시 해당 배치만 롤백하고 나머지 배치는 계속 처리
+            db.rollback()
+            logger.exception('질문 대량 등록 실패 (항목 %d~%d)', start, start + len(chunk) - 1)
+            chunk_ids = [None] * len(chunk)
+        ids.extend(chunk_ids)
+    if any(question_id is not None for question_id in ids):
+        bump_data_version()  # 목록 캐시 무효화
+        publish_resync('bulk')  # 질문마다 이벤트를 보내지 않고 목록을 다시 조회하도록 알림
+    return ids
+
+
 def get_question(db: Session, question_id: int) -> Optional[Question]:
     """
     ID로 질문을 조회합니다.
@@ -47,88 +156,459 @@ def get_question(db: Session, question_id: int) -> Optional[Question]:
         question_id: 조회할 질문의 ID
         
     Returns:
-        Question 객체 또는 None
+        Question 객체 또는 None (질문이 없거나 삭제된 경우)
     """
-    return db.query(Question).filter(Question.id == question_id).first()
+    return db.query(Question).filter(Question.id == question_id, LIVE_QUESTION).first()
 
 
-def get_questions(db: Session, skip: int = 0, limit: int = 100) -> List[Question]:
+def get_question_fields(
+    db: Session,
+    question_id: int,
+    fields: Sequence[str] = QUESTION_FIELDS
+) -> Optional[Row]:
     """
-    질문 목록을 조회합니다.
+    질문의 지정한 컬럼과 버전만 조회합니다.
     
     Args:
         db: 데이터베이스 세션
-        skip: 건너뛸 레코드 수
+        question_id: 조회할 질문의 ID
+        fields: 조회할 필드 이름 (QUESTION_FIELDS 중 일부)
+        
+    Returns:
+        fields 컬럼과 version을 가진 Row 또는 None (질문이 없거나 삭제된 경우)
+    """
+    return db.execute(build_fields_query(question_id, fields)).first()
+
+
+def build_fields_query(question_id: int, fields: Sequence[str] = QUESTION_FIELDS) -> Select:
+    """살아 있는 질문 하나의 fields 컬럼과 version을 조회하는 SELECT 문을 만듭니다."""
+    columns = [getattr(Question, name) for name in fields] + [Question.version]
+    return select(*columns).where(Question.id == question_id, LIVE_QUESTION)
+
+
+def get_question_version(db: Session, question_id: int) -> Optional[int]:
+    """
+    질문 행 전체를 읽지 않고 버전 값만 조회합니다.
+    
+    조건부 요청(If-None-Match, If-Match)을 판단할 때 사용합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        question_id: 조회할 질문의 ID
+        
+    Returns:
+        행 버전 또는 None (질문이 없거나 삭제된 경우)
+    """
+    return db.query(Question.version).filter(Question.id == question_id, LIVE_QUESTION).scalar()
+
+
+def get_question_total(db: Session) -> int:
+    """
+    전체 질문 수를 조회합니다.
+    
+    COUNT(*)로 테이블을 스캔하지 않고 트리거가 유지하는 row_counter의
+    행 하나를 기본 키로 읽으므로, 질문 수와 관계없이 비용이 같습니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        
+    Returns:
+        전체 질문 수
+    """
+    return db.query(RowCounter.value).filter(RowCounter.name == 'question').scalar() or 0
+
+
+def count_question_drift(db: Session) -> int:
+    """
+    질문 수 카운터가 실제 행 수(삭제 표시되지 않은 행의 COUNT(*))와 얼마나 다른지 확인합니다.
+    
+    두 값을 한 읽기 트랜잭션(같은 스냅샷)에서 읽으므로 그사이에 커밋된 쓰기 때문에
+    어긋나 보이지 않습니다. 읽기 세션에서 호출하면 쓰기 풀의 연결을 점유하지 않고
+    전체 행을 셀 수 있어, reconcile_question_total 전에 보정이 필요한지 확인하는 데 씁니다.
+    
+    Args:
+        db: 데이터베이스 세션 (읽기 세션 권장)
+        
+    Returns:
+        실제 행 수 - 카운터 값 (0이면 어긋나지 않음)
+    """
+    # 동작: pysqlite는 SELECT 앞에서 트랜잭션을 시작하지 않으므로 BEGIN을 직접 실행합니다.
+    db.connection().exec_driver_sql('BEGIN')
+    try:
+        counter = get_question_total(db)
+        actual = db.query(func.count(Question.id)).filter(LIVE_QUESTION).scalar()
+    finally:
+        db.rollback()
+    return actual - counter
+
+
+def reconcile_question_total(db: Session) -> int:
+    """
+    질문 수 카운터를 실제 행 수(삭제 표시되지 않은 행의 COUNT(*))로 보정합니다.
+    
+    트리거를 거치지 않은 쓰기(외부 도구로 직접 수정한 경우 등)로 카운터가
+    실제 값과 어긋났을 때 바로잡는 주기 작업용 함수입니다. 카운터 행이 없으면 새로 만듭니다.
+    
+    BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡고 COUNT(*)를 카운터 UPDATE 문 안에서 계산하므로,
+    다른 워커나 비동기 엔진의 쓰기가 세는 도중에 끼어들어 트리거가 올린 값을
+    오래된 COUNT(*)로 덮어쓰지 않습니다.
+    
+    Args:
+        db: 데이터베이스 세션 (쓰기 가능한 세션)
+        
+    Returns:
+        보정 전후의 차이 (실제 행 수 - 보정 전 카운터 값, 0이면 어긋나지 않음)
+        
+    Raises:
+        Exception: 데이터베이스 작업 실패 시 롤백 후 예외 발생
+    """
+    live_count = select(func.count(Question.id)).where(LIVE_QUESTION).scalar_subquery()
+    try:
+        # 동작: pysqlite는 SELECT 앞에서 트랜잭션을 시작하지 않으므로 쓰기 잠금을 잡으며 직접 시작합니다.
+        db.connection().exec_driver_sql('BEGIN IMMEDIATE')
+        previous = get_question_total(db)
+        actual = db.execute(
+            update(RowCounter)
+            .where(RowCounter.name == 'question')
+            .values(value=live_count)
+            .returning(RowCounter.value)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        if actual is None:
+            actual = db.execute(
+                insert(RowCounter)
+                .values(name='question', value=live_count)
+                .returning(RowCounter.value)
+            ).scalar_one()
+        elif actual == previous:
+            db.rollback()
+            return 0
+        db.commit()
+        bump_data_version()  # total이 바뀌었으므로 목록 캐시 무효화
+        return actual - previous
+    except Exception:
+        db.rollback()
+        raise
+
+
+def get_questions(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    order: str = 'asc'
+) -> List[Question]:
+    """
+    질문 목록을 (create_date, id) 순서로 조회합니다.
+    
+    cursor가 주어지면 키셋 페이지네이션으로 커서 다음 행부터 조회하고
+    skip은 무시합니다. ix_question_live_create_date_id 인덱스를 바로 탐색하므로
+    페이지 깊이와 관계없이 조회 비용이 같습니다.
+    cursor가 없으면 기존 클라이언트를 위해 offset(skip) 방식으로 조회합니다.
+    작성일시 범위와 내림차순 정렬도 같은 인덱스를 범위 탐색하거나 거꾸로 읽어 처리합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        skip: 건너뛸 레코드 수 (cursor가 없을 때만 사용)
         limit: 최대 조회할 레코드 수
+        cursor: 이전 응답의 next_cursor 값 (같은 order로 받은 값)
+        created_after: 지정하면 작성일시가 이 시각 이상인 질문만 조회
+        created_before: 지정하면 작성일시가 이 시각 미만인 질문만 조회
+        order: 'asc'(오래된 순, 기본값) 또는 'desc'(최신 순)
         
     Returns:
         Question 객체 리스트
+        
+    Raises:
+        ValueError: cursor 또는 order 형식이 올바르지 않은 경우
+    """
+    query = apply_list_filters(
+        db.query(Question).filter(LIVE_QUESTION), created_after, created_before, order
+    )
+    return apply_pagination(query, skip, limit, cursor, order).all()
+
+
+def get_question_rows(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Sequence[str] = QUESTION_FIELDS,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    order: str = 'asc'
+) -> List[Row]:
+    """
+    질문 목록을 ORM 객체 없이 지정한 컬럼만 행으로 조회합니다.
+    
+    페이지네이션, 작성일시 범위, 정렬 규칙은 get_questions와 같습니다. 행을 바로 JSON으로
+    직렬화하는 목록 응답용이며, identity map 등록과 속성 계측 비용이 들지 않고
+    요청하지 않은 컬럼(content 등)은 읽지도 않습니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        skip: 건너뛸 레코드 수 (cursor가 없을 때만 사용)
+        limit: 최대 조회할 레코드 수
+        cursor: 이전 응답의 next_cursor 값 (같은 order로 받은 값)
+        fields: 조회할 필드 이름 (QUESTION_FIELDS 중 일부)
+        created_after: 지정하면 작성일시가 이 시각 이상인 질문만 조회
+        created_before: 지정하면 작성일시가 이 시각 미만인 질문만 조회
+        order: 'asc'(오래된 순, 기본값) 또는 'desc'(최신 순)
+        
+    Returns:
+        Row 리스트. 앞쪽 컬럼은 fields 순서와 같고, next_cursor 계산에 필요한
+        id, create_date가 fields에 없으면 뒤에 덧붙습니다.
+        
+    Raises:
+        ValueError: cursor 또는 order 형식이 올바르지 않은 경우
+    """
+    stmt = build_list_query(
+        fields, skip, limit, cursor, created_after, created_before, order
+    )
+    return list(db.execute(stmt).all())
+
+
+def build_list_query(
+    fields: Sequence[str] = QUESTION_FIELDS,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    order: str = 'asc'
+) -> Select:
+    """get_question_rows가 실행하는 목록 SELECT 문을 만듭니다. (동기/비동기 공용)"""
+    stmt = apply_list_filters(
+        select(*projection_columns(fields)).where(LIVE_QUESTION),
+        created_after, created_before, order
+    )
+    return apply_pagination(stmt, skip, limit, cursor, order)
+
+
+def projection_columns(fields: Sequence[str]) -> list:
+    """fields 컬럼 뒤에 커서 계산용 id, create_date 컬럼(없는 경우만)을 붙여 반환합니다."""
+    columns = [getattr(Question, name) for name in fields]
+    for name in ('id', 'create_date'):
+        if name not in fields:
+            columns.append(getattr(Question, name))
+    return columns
+
+
+def as_local_naive(value: datetime) -> datetime:
+    """시간대가 있는 시각을 create_date와 같은 서버 로컬 시각(시간대 없음)으로 바꿉니다."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def apply_list_filters(
+    query,
+    created_after: Optional[datetime],
+    created_before: Optional[datetime],
+    order: str
+):
+    """
+    Query 또는 Select에 작성일시 범위 조건과 (create_date, id) 정렬을 붙입니다.
+
+    Raises:
+        ValueError: order가 'asc' 또는 'desc'가 아닌 경우
+    """
+    if order not in LIST_ORDERS:
+        raise ValueError("order는 'asc' 또는 'desc'여야 합니다.")
+    if created_after is not None:
+        query = query.filter(Question.create_date >= as_local_naive(created_after))
+    if created_before is not None:
+        query = query.filter(Question.create_date < as_local_naive(created_before))
+    if order == 'desc':
+        return query.order_by(Question.create_date.desc(), Question.id.desc())
+    return query.order_by(Question.create_date, Question.id)
+
+
+def apply_pagination(query, skip: int, limit: int, cursor: Optional[str], order: str = 'asc'):
+    """Query 또는 Select에 커서(키셋) 또는 offset 페이지네이션 조건을 붙입니다."""
+    if cursor is not None:
+        create_date, last_id = decode_cursor(cursor)
+        keyset = tuple_(Question.create_date, Question.id)
+        # 동작: 내림차순이면 커서보다 앞(작은 값)의 행을 이어서 조회합니다.
+        if order == 'desc':
+            query = query.filter(keyset < tuple_(create_date, last_id))
+        else:
+            query = query.filter(keyset > tuple_(create_date, last_id))
+    else:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def build_update_statement(
+    question_id: int,
+    question_update: QuestionUpdate,
+    expected_version: Optional[int] = None
+) -> Optional[Update]:
+    """
+    질문 하나를 수정하고 수정된 행을 돌려받는 UPDATE ... RETURNING 문을 만듭니다.
+    
+    version은 ORM이 아니라 이 문장이 직접 1 증가시키고, expected_version이 있으면
+    WHERE 조건에 넣어 버전 확인과 수정을 한 문장으로 처리합니다. (SQLite 3.35 이상)
+    삭제된 질문은 수정하지 않으며, updated_at은 현재 시각으로 바뀝니다.
+    
+    Args:
+        question_id: 수정할 질문의 ID
+        question_update: 수정할 내용
+        expected_version: 지정하면 현재 행 버전이 이 값일 때만 수정
+        
+    Returns:
+        UPDATE 문 또는 None (바꿀 필드가 없는 경우)
     """
-    return db.query(Question).offset(skip).limit(limit).all()
+    values = question_update.model_dump(exclude_none=True)
+    if not values:
+        return None
+    stmt = (
+        update(Question)
+        .where(Question.id == question_id, LIVE_QUESTION)
+        .values(**values, version=Question.version + 1, updated_at=datetime.now())
+        .returning(*RETURNING_COLUMNS)
+        # 동작: 세션의 객체를 갱신하지 않고 반환된 행만 사용합니다.
+        .execution_options(synchronize_session=False)
+    )
+    if expected_version is not None:
+        stmt = stmt.where(Question.version == expected_version)
+    return stmt
 
 
 def update_question(
     db: Session, 
     question_id: int, 
-    question_update: QuestionUpdate
-) -> Optional[Question]:
+    question_update: QuestionUpdate,
+    expected_version: Optional[int] = None
+) -> Optional[Row]:
     """
     질문을 수정합니다.
     
+    UPDATE ... RETURNING 한 문장으로 수정과 결과 조회를 함께 처리하므로
+    SQLite 쓰기 잠금을 잡는 시간이 짧습니다. 바꿀 필드가 없으면 조회만 합니다.
+    
     Args:
         db: 데이터베이스 세션
         question_id: 수정할 질문의 ID
         question_update: 수정할 내용
+        expected_version: 지정하면 현재 행 버전이 이 값일 때만 수정 (If-Match)
         
     Returns:
-        수정된 Question 객체 또는 None
+        수정된 질문의 Row (RETURNING_COLUMNS) 또는 None (질문이 없는 경우)
         
     Raises:
+        VersionConflictError: 행 버전이 expected_version과 다른 경우
         Exception: 데이터베이스 작업 실패 시 롤백 후 예외 발생
     """
+    stmt = build_update_statement(question_id, question_update, expected_version)
+    if stmt is None:
+        row = get_question_fields(db, question_id)
+        if row is not None and expected_version is not None and row.version != expected_version:
+            raise VersionConflictError('질문이 이미 다른 요청으로 수정되었습니다.')
+        return row
     try:
-        db_question = get_question(db, question_id)
-        if db_question is None:
-            return None
-        
-        if question_update.subject is not None:
-            db_question.subject = question_update.subject
-        if question_update.content is not None:
-            db_question.content = question_update.content
-        
+        row = db.execute(stmt).first()
         db.commit()  # 트랜잭션 커밋 (Durability 보장)
-        db.refresh(db_question)  # DB에서 최신 데이터 조회
-        return db_question
     except Exception:
         # 에러 발생 시 롤백하여 트랜잭션 원자성 보장 (Atomicity)
         db.rollback()
         raise
+    if row is not None:
+        bump_data_version()  # 목록 캐시 무효화
+        publish_updated(row, question_update.model_dump(exclude_none=True))  # 실시간 구독자에게 알림
+        return row
+    # 동작: 수정된 행이 없으면 질문이 없는 경우와 버전이 달라진 경우를 구분합니다.
+    if expected_version is not None and get_question_version(db, question_id) is not None:
+        raise VersionConflictError('질문이 이미 다른 요청으로 수정되었습니다.')
+    return None
+
+
+def build_delete_statement(question_id: int) -> Update:
+    """
+    질문 하나를 삭제 표시(tombstone)하고 id를 돌려받는 UPDATE ... RETURNING 문을 만듭니다.
+    
+    행은 변경 피드가 삭제를 알릴 수 있도록 남겨 두고, 제목과 내용은 비워서
+    전문 검색 인덱스에서도 빠지게 합니다. (question_fts_au 트리거)
+    """
+    now = datetime.now()
+    return (
+        update(Question)
+        .where(Question.id == question_id, LIVE_QUESTION)
+        .values(
+            subject='',
+            content='',
+            deleted_at=now,
+            updated_at=now,
+            version=Question.version + 1
+        )
+        .returning(Question.id)
+        .execution_options(synchronize_session=False)
+    )
 
 
 def delete_question(db: Session, question_id: int) -> bool:
     """
     질문을 삭제합니다.
     
+    조회 없이 UPDATE ... RETURNING 한 문장으로 삭제 표시하고, 반환된 행이 있는지로
+    삭제 여부를 판단합니다. (build_delete_statement 참고)
+    
     Args:
         db: 데이터베이스 세션
         question_id: 삭제할 질문의 ID
         
     Returns:
-        삭제 성공 여부
+        삭제 성공 여부 (질문이 없거나 이미 삭제된 경우 False)
         
     Raises:
         Exception: 데이터베이스 작업 실패 시 롤백 후 예외 발생
     """
     try:
-        db_question = get_question(db, question_id)
-        if db_question is None:
-            return False
-        
-        db.delete(db_question)
+        deleted_id = db.execute(build_delete_statement(question_id)).scalar()
         db.commit()  # 트랜잭션 커밋 (Durability 보장)
-        return True
     except Exception:
         # 에러 발생 시 롤백하여 트랜잭션 원자성 보장 (Atomicity)
         db.rollback()
         raise
+    if deleted_id is None:
+        return False
+    bump_data_version()  # 목록 캐시 무효화
+    publish_deleted(question_id)  # 실시간 구독자에게 알림
+    return True
+
+
+def build_changes_query(since: Optional[str], limit: int) -> Select:
+    """
+    커서 이후의 변경을 change_seq 순서로 조회하는 SELECT 문을 만듭니다.
+    
+    Raises:
+        ValueError: since 형식이 올바르지 않은 경우
+    """
+    stmt = select(*CHANGE_COLUMNS).order_by(Question.change_seq).limit(limit)
+    if since is not None:
+        stmt = stmt.where(Question.change_seq > decode_change_cursor(since))
+    return stmt
+
 
+def get_question_changes(db: Session, since: Optional[str] = None, limit: int = 100) -> List[Row]:
+    """
+    커서 이후에 생성, 수정, 삭제된 질문을 커밋 순서(change_seq)로 조회합니다.
+    
+    ix_question_change_seq 인덱스에서 커서 다음 위치부터 limit개만 읽으므로
+    전체 질문 수와 관계없이 바뀐 행 수만큼만 비용이 듭니다. 한 질문이 여러 번
+    바뀌었으면 마지막 변경만 한 번 반환됩니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        since: 이전 응답의 next_cursor 값 (없으면 처음부터)
+        limit: 최대 조회할 변경 수
+        
+    Returns:
+        CHANGE_COLUMNS 컬럼을 가진 Row 리스트 (deleted_at이 있으면 삭제된 질문)
+        
+    Raises:
+        ValueError: since 형식이 올바르지 않은 경우
+    """
+    return list(db.execute(build_changes_query(since, limit)).all())
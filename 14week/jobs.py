@@ -0,0 +1,103 @@
+"""
+주기 작업 모듈
+
+요청 처리와 별개로 서버 프로세스 안에서 일정 주기마다 실행하는 유지보수 작업을 정의합니다.
+main.py의 startup 이벤트가 시작하고 shutdown 이벤트가 취소합니다.
+시작 직후 한 번 실행하는 예열(warm-up) 작업도 여기에 둡니다.
+"""
+import asyncio
+import logging
+from typing import Callable
+from starlette.concurrency import run_in_threadpool
+from database import (
+    ReadSessionLocal,
+    SessionLocal,
+    async_engines,
+    engine,
+    read_engine,
+    replica_engines,
+)
+from domain.question.service import (
+    count_question_drift,
+    get_question_rows,
+    get_question_total,
+    reconcile_question_total,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_counts() -> int:
+    """
+    row_counter의 질문 수를 실제 행 수로 보정합니다.
+
+    전체 행을 세는 확인은 읽기 엔진에서 하고, 어긋난 경우에만 쓰기 풀의 연결을 잡아
+    보정하므로 평소에는 이 작업이 쓰기 요청을 막지 않습니다.
+
+    Returns:
+        보정 전후의 차이 (0이면 어긋나지 않음)
+    """
+    with ReadSessionLocal() as db:
+        if count_question_drift(db) == 0:
+            return 0
+    with SessionLocal() as db:
+        drift = reconcile_question_total(db)
+    if drift:
+        logger.warning('질문 수 카운터를 보정했습니다 (차이: %+d)', drift)
+    return drift
+
+
+async def run_periodically(interval: float, job: Callable[[], object]) -> None:
+    """
+    interval초마다 동기 함수 job을 스레드풀에서 실행합니다.
+
+    작업이 실패해도 로그만 남기고 다음 주기에 다시 실행합니다.
+
+    Args:
+        interval: 실행 주기(초)
+        job: 실행할 동기 함수
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(job)
+        except Exception:
+            logger.exception('주기 작업 %s 실행 중 오류가 발생했습니다.', job.__name__)
+
+
+def warm_up() -> None:
+    """
+    첫 요청이 연결 생성과 SQL 컴파일 비용을 떠안지 않도록 동기 엔진을 예열합니다.
+
+    - 엔진마다 풀 크기만큼 연결을 열어 PRAGMA 설정까지 마친 연결을 풀에 채움
+    - 첫 목록 페이지와 전체 질문 수를 조회해 SQL 컴파일 캐시와 SQLite 페이지 캐시를 채움
+    """
+    for pool_engine in [engine, read_engine] + replica_engines:
+        connections = [pool_engine.connect() for _ in range(pool_engine.pool.size())]
+        for connection in connections:
+            connection.close()
+    with ReadSessionLocal() as db:
+        get_question_rows(db)
+        get_question_total(db)
+
+
+async def warm_up_async() -> None:
+    """
+    비동기 모드(BOARD_DB_MODE=async)의 aiosqlite 엔진을 예열합니다.
+
+    동기 모드에서는 async_engines가 비어 있으므로 아무 작업도 하지 않습니다.
+    """
+    if not async_engines:
+        return
+    from database import AsyncReadSessionLocal
+    from domain.question import async_service
+
+    for pool_engine in async_engines:
+        connections = [pool_engine.connect() for _ in range(pool_engine.sync_engine.pool.size())]
+        for connection in connections:
+            await connection.start()
+        for connection in connections:
+            await connection.close()
+    async with AsyncReadSessionLocal() as db:
+        await async_service.get_question_rows(db)
+        await async_service.get_question_total(db)
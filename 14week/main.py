@@ -11,12 +11,41 @@ API 문서 (자동 생성):
   - ReDoc: http://localhost:8000/redoc
   - OpenAPI 스키마: http://localhost:8000/openapi.json
 """
-from fastapi import FastAPI
-import uvicorn
-from database import engine
-from models import Base
+# 동작: 시작 시간 계측 타이머를 가장 먼저 import하고, import 묶음이 끝날 때마다 단계를 기록합니다.
+# 단계별 시간은 GET /debug/startup에서 확인할 수 있습니다.
+from startup import startup_timer
+import asyncio
+import logging
+from fastapi import FastAPI, Response
+startup_timer.mark('import.fastapi')
+from config import (
+    DB_MODE,
+    COUNT_RECONCILE_INTERVAL,
+    COMPRESSION_ENABLED,
+    ADMISSION_ENABLED,
+    SQL_PROFILER_ENABLED,
+    HOST,
+    PORT,
+    WORKERS
+)
+from database import engine, dispose_async_engines
+startup_timer.mark('import.database')
+from starlette.concurrency import run_in_threadpool
+from jobs import reconcile_counts, run_periodically, warm_up, warm_up_async
+from metrics import MetricsMiddleware, router as metrics_router
+from compression import CompressionMiddleware
+from admission import AdmissionMiddleware
+from migrations import schema_is_current, upgrade
+from profiler import ProfilerMiddleware
+from schemas import ApiResponse
 from api import router
 from domain.question.question_router import router as question_router
+from debug import router as debug_router
+from domain.question.group_commit import question_writer
+from domain.question.events import question_events
+startup_timer.mark('import.app')
+
+logger = logging.getLogger(__name__)
 
 # 동작: FastAPI 애플리케이션 인스턴스를 생성합니다.
 # FastAPI는 자동으로 Swagger UI와 ReDoc을 제공합니다:
@@ -30,12 +59,117 @@ app = FastAPI(
     version='1.0.0'
 )
 
+# 동작: Accept-Encoding에 맞춰 큰 응답을 압축하는 미들웨어를 등록합니다 (BOARD_COMPRESSION=0이면 제외).
+# 나중에 추가한 미들웨어가 바깥쪽에서 실행되므로 계측 미들웨어의 전체 처리 시간에 압축 시간도 포함됩니다.
+if COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+# 동작: 클라이언트별 토큰 버킷과 조회/쓰기 동시 실행 제한으로 과부하 요청을 라우트에 들어가기 전에
+# 429/503으로 거절합니다 (BOARD_ADMISSION=0이면 제외). 계측 미들웨어 안쪽에 두어 거절한 응답과
+# 슬롯을 기다린 시간도 요청 처리 시간에 기록됩니다.
+if ADMISSION_ENABLED:
+    app.add_middleware(AdmissionMiddleware)
+# 동작: 요청마다 연결 대기/쿼리/직렬화/전체 처리 시간을 기록하는 계측 미들웨어를 등록합니다.
+# 기록된 히스토그램은 GET /metrics에서 Prometheus 형식으로 조회할 수 있습니다.
+app.add_middleware(MetricsMiddleware)
+# 동작: SQL 프로파일러를 켠 경우(BOARD_SQL_PROFILER=1) 요청별 쿼리 반복(N+1)을 찾는
+# 미들웨어를 추가합니다. 결과는 GET /debug/sql에서 조회할 수 있습니다.
+if SQL_PROFILER_ENABLED:
+    app.add_middleware(ProfilerMiddleware)
+
+# 동작: 비동기 모드(BOARD_DB_MODE=async)에서는 async def 라우터를 먼저 등록합니다.
+# FastAPI는 먼저 등록된 경로부터 매칭하므로 CRUD 요청은 비동기 라우터가 처리하고,
+# 비동기 버전이 없는 엔드포인트는 아래의 동기 라우터가 그대로 처리합니다.
+if DB_MODE == 'async':
+    from async_api import router as async_router
+    from domain.question.async_question_router import router as async_question_router
+
+    app.include_router(async_router)
+    app.include_router(async_question_router)
+
 # 동작: API 라우터를 애플리케이션에 등록합니다.
 # 이렇게 하면 /questions로 시작하는 모든 엔드포인트가 활성화됩니다.
 app.include_router(router)
 # 동작: 질문 라우터를 애플리케이션에 등록합니다.
 # 이렇게 하면 /api/question으로 시작하는 모든 엔드포인트가 활성화됩니다.
 app.include_router(question_router)
+# 동작: 연결 풀 통계 등 진단용 라우터를 등록합니다. (/debug로 시작)
+app.include_router(debug_router)
+# 동작: 계측 결과를 제공하는 /metrics 엔드포인트를 등록합니다.
+app.include_router(metrics_router)
+startup_timer.mark('app.build')
+
+
+@app.get('/ready', response_model=ApiResponse)
+def readiness(response: Response) -> ApiResponse:
+    """
+    요청을 받을 준비가 되었는지 확인합니다. (로드 밸런서/오토스케일러 준비 상태 확인용)
+    
+    서버는 스키마 확인이 끝나면 바로 요청을 받기 시작하지만, 연결 풀과 쿼리 예열이
+    끝나기 전까지는 503을 반환해 트래픽을 보내지 않도록 합니다.
+    
+    Args:
+        response: 응답 객체 (준비 전 상태 코드 변경용)
+        
+    Returns:
+        준비 여부와 시작 단계별 소요 시간을 포함한 응답
+    """
+    if not startup_timer.ready:
+        response.status_code = 503
+        return ApiResponse(status='starting', data=startup_timer.report())
+    return ApiResponse(status='success', data=startup_timer.report())
+
+
+def prepare_database() -> None:
+    """
+    스키마를 준비하고 질문 수 카운터를 보정합니다.
+    
+    여러 워커로 실행하면 server.py가 워커를 fork하기 전에 한 번만 호출하고,
+    단일 프로세스로 실행하면 startup 이벤트가 호출합니다.
+    
+    동작 흐름:
+    1. 저장된 스키마 지문이 현재 코드와 같으면 바로 종료 (create_all 생략)
+    2. 다르면 테이블이 없을 때 생성하고 (Alembic 마이그레이션이 이미 실행되었다면 스킵됨)
+    3. 기존 데이터베이스에 아직 적용되지 않은 마이그레이션(인덱스 등)을 적용한 뒤 지문 저장
+    """
+    # 동작: models.py에 정의된 모든 모델의 테이블을 데이터베이스에 생성하고,
+    # migrations.py에 정의된 마이그레이션 중 적용되지 않은 것만 실행합니다.
+    # 지문이 같으면 바뀔 것이 없으므로 테이블별 존재 확인도 하지 않습니다.
+    if schema_is_current(engine):
+        startup_timer.details['schema'] = 'current'
+        print('데이터베이스 스키마가 최신 상태입니다.')
+    else:
+        upgrade(engine)
+        startup_timer.details['schema'] = 'upgraded'
+        print('데이터베이스 테이블이 준비되었습니다.')
+    startup_timer.mark('startup.schema')
+    app.state.database_prepared = True
+
+
+async def warm_up_database() -> None:
+    """
+    서버가 요청을 받기 시작한 뒤 백그라운드에서 DB를 예열하고 준비 상태로 전환합니다.
+    
+    동작 흐름:
+    1. 질문 수 카운터 보정 (여러 워커이면 0번 워커만, 전체 행을 세므로 예열을 겸함)
+    2. 연결 풀을 채우고 첫 목록 페이지와 전체 질문 수 조회 (동기/비동기 엔진)
+    3. GET /ready가 200을 반환하도록 준비 완료 기록
+    
+    실패하면 로그를 남기고 1초 뒤 다시 시도하며, 그동안 GET /ready는 503을 반환합니다.
+    """
+    while True:
+        try:
+            if getattr(app.state, 'worker_id', 0) == 0:
+                await run_in_threadpool(reconcile_counts)
+                startup_timer.mark('warmup.counts')
+            await run_in_threadpool(warm_up)
+            await warm_up_async()
+            startup_timer.mark('warmup.database')
+            break
+        except Exception:
+            logger.exception('DB 예열에 실패했습니다. 1초 뒤 다시 시도합니다.')
+            await asyncio.sleep(1)
+    startup_timer.mark_ready()
+    print(startup_timer.summary())
 
 
 @app.on_event('startup')
@@ -44,14 +178,44 @@ async def startup_event():
     애플리케이션 시작 시 실행되는 이벤트 핸들러
     
     동작 흐름:
-    1. 데이터베이스 테이블이 존재하는지 확인
-    2. 없으면 생성 (Alembic 마이그레이션이 이미 실행되었다면 스킵됨)
+    1. fork 전에 준비되지 않았으면 prepare_database() 실행
+    2. 질문 수 카운터를 주기적으로 다시 보정하는 작업 시작 (여러 워커이면 0번 워커만)
+    3. 그룹 커밋 모드이면 질문 쓰기 스레드 시작
+    4. DB 예열을 백그라운드로 시작 (끝나면 GET /ready가 200 반환)
+    
+    예열을 기다리지 않고 반환하므로 서버는 스키마 확인 직후부터 요청을 받습니다.
+    """
+    startup_timer.mark('server.boot')
+    if not getattr(app.state, 'database_prepared', False):
+        prepare_database()
+    
+    app.state.reconcile_task = None
+    if COUNT_RECONCILE_INTERVAL > 0 and getattr(app.state, 'worker_id', 0) == 0:
+        app.state.reconcile_task = asyncio.create_task(
+            run_periodically(COUNT_RECONCILE_INTERVAL, reconcile_counts)
+        )
+    if question_writer is not None:
+        question_writer.start()
+    app.state.warmup_task = asyncio.create_task(warm_up_database())
+
+
+@app.on_event('shutdown')
+async def shutdown_event():
+    """
+    애플리케이션 종료 시 실행되는 이벤트 핸들러
+
+    주기 작업을 취소하고, 실시간 스트림 구독자에게 close 이벤트를 보내고,
+    그룹 커밋 큐에 남은 질문을 커밋한 뒤 쓰기 스레드를 종료하고,
+    비동기 모드에서 aiosqlite 연결(각각 전용 스레드를 가짐)을 모두 닫습니다.
     """
-    # 동작: models.py에 정의된 모든 모델의 테이블을 데이터베이스에 생성합니다.
-    # 이미 테이블이 존재하는 경우 아무 작업도 수행하지 않습니다.
-    # 주의: Alembic을 사용하는 경우 마이그레이션으로 테이블을 관리하는 것이 권장됩니다.
-    Base.metadata.create_all(bind=engine)
-    print('데이터베이스 테이블이 준비되었습니다.')
+    if getattr(app.state, 'reconcile_task', None) is not None:
+        app.state.reconcile_task.cancel()
+    if getattr(app.state, 'warmup_task', None) is not None:
+        app.state.warmup_task.cancel()
+    question_events.close()
+    if question_writer is not None:
+        await asyncio.to_thread(question_writer.stop)
+    await dispose_async_engines()
 
 
 if __name__ == '__main__':
@@ -59,9 +223,9 @@ if __name__ == '__main__':
     메인 실행 흐름:
     
     1. 모듈 import 단계
-       - FastAPI, uvicorn import
+       - FastAPI import (uvicorn과 server.py는 서버를 시작할 때 import)
        - database.py에서 engine import
-       - models.py에서 Base import
+       - migrations.py에서 upgrade import
        - domain.question.question_router에서 router import
     
     2. FastAPI 앱 생성 및 라우터 등록
@@ -69,11 +233,21 @@ if __name__ == '__main__':
        - 질문 라우터 등록
     
     3. 서버 시작
-       - uvicorn을 사용하여 서버 실행
-       - 기본 포트: 8000
+       - BOARD_WORKERS가 1이면 uvicorn으로 단일 프로세스 실행
+       - 2 이상이면 server.py가 스키마를 한 번 준비한 뒤 워커 프로세스를 fork
+       - 기본 주소: 0.0.0.0:8000 (BOARD_HOST, BOARD_PORT)
     """
-    # 동작: uvicorn을 사용하여 FastAPI 애플리케이션을 실행합니다.
-    # host='0.0.0.0': 모든 네트워크 인터페이스에서 접근 가능
-    # port=8000: 기본 포트 번호
-    uvicorn.run(app, host='0.0.0.0', port=8000)
+    if WORKERS > 1:
+        # 동작: 이 파일이 __main__으로 실행되었으므로 main을 다시 import하지 않도록
+        # 이미 만든 app을 그대로 넘깁니다.
+        from server import serve
+        serve(app, prepare_database, workers=WORKERS, host=HOST, port=PORT)
+    else:
+        from server import run
+        
+        # 동작: uvicorn을 사용하여 FastAPI 애플리케이션을 실행합니다.
+        # host='0.0.0.0': 모든 네트워크 인터페이스에서 접근 가능
+        # port=8000: 기본 포트 번호
+        # 종료 시그널을 받으면 실시간 스트림 구독자에게 close 이벤트를 먼저 보냅니다.
+        run(app, host=HOST, port=PORT)
 
@@ -0,0 +1,320 @@
+"""
+요청 계측 모듈
+
+라우트별로 다음 네 가지 시간을 프로세스 메모리의 히스토그램에 기록하고,
+GET /metrics에서 Prometheus 텍스트 형식으로 제공합니다.
+
+- board_db_session_wait_seconds: 연결 풀에서 DB 연결을 얻기까지 기다린 시간
+- board_db_query_seconds: SQL 실행 시간 (요청 하나의 합계)
+- board_serialization_seconds: ApiResponse(Pydantic) 직렬화 시간 (요청 하나의 합계)
+- board_request_duration_seconds: 요청 처리 전체 시간
+
+그룹 커밋(BOARD_GROUP_COMMIT=1)을 켜면 트랜잭션마다 커밋한 질문 수도
+board_group_commit_batch_size로 기록합니다. 응답을 압축하면(compression.py) 응답 하나를
+압축하는 데 쓴 CPU 시간을 board_compression_seconds로 기록합니다.
+
+입장 제어(admission.py)가 거절한 요청 수는 카운터 board_admission_shed_total로,
+쓰기 동시 실행 슬롯을 기다린 시간은 board_admission_queue_wait_seconds로 기록합니다.
+
+요청 중에 쌓인 값은 ContextVar에 보관한 RequestTimings에 더해 두었다가, 요청이
+끝날 때 매칭된 라우트 경로(예: /questions/{question_id})를 레이블로 한 번에 기록합니다.
+요청당 히스토그램 기록 네 번과 perf_counter 호출 몇 번만 추가되므로 운영 환경에서
+계속 켜 두어도 부담이 없습니다.
+
+여러 워커(BOARD_WORKERS)로 실행하면 값은 워커 프로세스마다 따로 쌓이므로,
+GET /metrics는 그 요청을 받은 워커 하나의 값만 보여 줍니다.
+"""
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from startup import startup_timer
+
+# 동작: 0.5ms ~ 10s 구간을 나눈 히스토그램 버킷 상한(초)
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+class Histogram:
+    """
+    레이블별 누적 히스토그램
+
+    레이블 값 조합마다 버킷별 개수, 합계, 개수를 보관합니다.
+    여러 스레드에서 동시에 기록하므로 잠금으로 보호합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = ('method', 'route'),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # 레이블 값 -> [버킷별 개수..., +Inf 개수, 합계]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, labels: Tuple[str, ...]) -> None:
+        """값 하나를 기록합니다."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식의 줄 목록을 반환합니다. (버킷은 누적 개수)"""
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} histogram',
+        ]
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        for labels, series in sorted(snapshot.items()):
+            label_text = ','.join(
+                f'{key}="{_escape(value)}"' for key, value in zip(self.labelnames, labels)
+            )
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{{{label_text},le="{le}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {series[-1]!r}')
+            lines.append(f'{self.name}_count{{{label_text}}} {cumulative}')
+        return lines
+
+
+class Counter:
+    """
+    레이블별 누적 카운터
+
+    여러 스레드에서 동시에 증가시키므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1) -> None:
+        """값을 amount만큼 증가시킵니다."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Tuple[str, ...]) -> float:
+        """레이블 조합의 현재 값을 반환합니다."""
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식의 줄 목록을 반환합니다."""
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} counter',
+        ]
+        with self._lock:
+            snapshot = dict(self._values)
+        for labels, value in sorted(snapshot.items()):
+            label_text = ','.join(
+                f'{key}="{_escape(label)}"' for key, label in zip(self.labelnames, labels)
+            )
+            lines.append(f'{self.name}{{{label_text}}} {value!r}')
+        return lines
+
+
+def _escape(value: str) -> str:
+    """Prometheus 레이블 값의 특수문자를 이스케이프합니다."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+SESSION_WAIT = Histogram(
+    'board_db_session_wait_seconds',
+    'Time spent waiting for a pooled DB connection per request.'
+)
+QUERY_TIME = Histogram(
+    'board_db_query_seconds',
+    'Total SQL execution time per request.'
+)
+SERIALIZATION_TIME = Histogram(
+    'board_serialization_seconds',
+    'Total Pydantic response serialization time per request.'
+)
+REQUEST_DURATION = Histogram(
+    'board_request_duration_seconds',
+    'Total request handling time.',
+    labelnames=('method', 'route', 'status')
+)
+GROUP_COMMIT_BATCH_SIZE = Histogram(
+    'board_group_commit_batch_size',
+    'Number of questions committed per group-commit transaction.',
+    labelnames=('writer',),
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+)
+COMPRESSION_TIME = Histogram(
+    'board_compression_seconds',
+    'CPU time spent compressing one response body.',
+    labelnames=('encoding',),
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+)
+ADMISSION_QUEUE_WAIT = Histogram(
+    'board_admission_queue_wait_seconds',
+    'Time a request waited for a concurrency slot before it was admitted or shed.',
+    labelnames=('budget',)
+)
+HISTOGRAMS = (
+    SESSION_WAIT, QUERY_TIME, SERIALIZATION_TIME, REQUEST_DURATION, GROUP_COMMIT_BATCH_SIZE,
+    COMPRESSION_TIME, ADMISSION_QUEUE_WAIT
+)
+ADMISSION_SHED = Counter(
+    'board_admission_shed_total',
+    'Requests rejected by admission control.',
+    labelnames=('budget', 'reason')
+)
+COUNTERS = (ADMISSION_SHED,)
+
+
+class RequestTimings:
+    """요청 하나 동안 누적한 구간별 시간(초)"""
+    __slots__ = ('session_wait', 'query', 'serialization', 'used_db')
+
+    def __init__(self):
+        self.session_wait = 0.0
+        self.query = 0.0
+        self.serialization = 0.0
+        self.used_db = False
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    'board_request_timings', default=None
+)
+
+
+def add_session_wait(seconds: float) -> None:
+    """현재 요청의 연결 대기 시간에 더합니다. 요청 밖(시작 작업 등)에서는 무시합니다."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.session_wait += seconds
+        timings.used_db = True
+
+
+def add_query_time(seconds: float) -> None:
+    """현재 요청의 SQL 실행 시간에 더합니다."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.query += seconds
+        timings.used_db = True
+
+
+def add_serialization_time(seconds: float) -> None:
+    """현재 요청의 직렬화 시간에 더합니다."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.serialization += seconds
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info['board_query_started'] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    # 동작: 실행 중 에러가 나면 after 이벤트가 호출되지 않으므로, 시작 시각은
+    # 스택에 쌓지 않고 다음 before 이벤트가 덮어쓰게 둡니다.
+    started = conn.info.pop('board_query_started', None)
+    if started is not None:
+        add_query_time(time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    엔진에서 실행되는 모든 SQL의 실행 시간을 현재 요청에 기록하도록 이벤트를 등록합니다.
+
+    Args:
+        engine: 동기 엔진 (비동기 엔진은 async_engine.sync_engine을 전달)
+    """
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """
+    요청마다 RequestTimings를 만들고, 요청이 끝나면 히스토그램에 기록하는 ASGI 미들웨어
+
+    BaseHTTPMiddleware와 달리 요청/응답 본문을 감싸지 않는 순수 ASGI 미들웨어이므로
+    스트리밍 응답에도 추가 비용이 거의 없습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            _current_timings.reset(token)
+            startup_timer.mark_first_request()
+            # 동작: 라우터가 매칭한 경로 템플릿을 레이블로 사용해 ID마다 시계열이 늘지 않게 합니다.
+            route = scope.get('route')
+            labels = (scope['method'], getattr(route, 'path', UNMATCHED_ROUTE))
+            REQUEST_DURATION.observe(elapsed, labels + (str(status_code),))
+            if timings.used_db:
+                SESSION_WAIT.observe(timings.session_wait, labels)
+                QUERY_TIME.observe(timings.query, labels)
+            if timings.serialization:
+                SERIALIZATION_TIME.observe(timings.serialization, labels)
+
+
+def render_metrics() -> str:
+    """모든 히스토그램과 카운터를 Prometheus 텍스트 형식으로 반환합니다."""
+    lines: List[str] = []
+    for histogram in HISTOGRAMS:
+        lines.extend(histogram.render())
+    for counter in COUNTERS:
+        lines.extend(counter.render())
+    return '\n'.join(lines) + '\n'
+
+
+router = APIRouter()
+
+
+@router.get('/metrics', response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """
+    요청 계측 히스토그램과 카운터를 Prometheus 텍스트 형식으로 조회합니다.
+
+    Returns:
+        text/plain; version=0.0.4 형식의 응답
+    """
+    return PlainTextResponse(
+        render_metrics(), media_type='text/plain; version=0.0.4; charset=utf-8'
+    )
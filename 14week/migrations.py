@@ -0,0 +1,288 @@
+"""
+스키마 마이그레이션 모듈
+
+create_all은 없는 테이블만 만들 뿐, 이미 존재하는 board.db에 새 인덱스나 컬럼을
+추가하지 않습니다. 이 모듈은 SQLite의 PRAGMA user_version에 적용된 마이그레이션
+번호를 기록해 두고, 아직 적용되지 않은 마이그레이션만 순서대로 실행합니다.
+
+새 마이그레이션은 MIGRATIONS 리스트 끝에 추가합니다. 새로 만든 데이터베이스에는
+create_all이 먼저 최신 스키마를 만들기 때문에 각 마이그레이션은 이미 적용된
+상태에서 다시 실행되어도 안전해야 합니다 (IF NOT EXISTS 등).
+
+create_all은 이미 최신인 데이터베이스에서도 테이블마다 존재 여부를 조회하므로, upgrade가
+끝나면 models.py의 DDL과 마이그레이션 목록으로 만든 스키마 지문을 schema_meta 테이블에
+저장해 둡니다. 시작할 때 schema_is_current()로 지문과 user_version이 그대로인지만 확인하면
+create_all과 마이그레이션 확인을 건너뛸 수 있습니다.
+"""
+import hashlib
+from typing import Callable, List, Optional
+from sqlalchemy import text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateIndex, CreateTable
+from models import Base
+
+
+def _add_question_keyset_index(conn: Connection) -> None:
+    """커서 페이지네이션용 (create_date, id) 복합 인덱스를 추가합니다."""
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_question_create_date_id '
+        'ON question (create_date, id)'
+    ))
+
+
+def _add_question_fts(conn: Connection) -> None:
+    """
+    제목/내용 전문 검색용 FTS5 테이블과 동기화 트리거를 추가합니다.
+
+    - content='question': 본문은 question 테이블에서 읽고 FTS에는 인덱스만 저장
+    - tokenize='trigram': 띄어쓰기 단위 분리가 맞지 않는 한국어도 부분 일치로 검색
+    - 트리거가 INSERT/UPDATE/DELETE마다 인덱스를 갱신하므로 어떤 쓰기 경로든 동기화됨
+    """
+    conn.execute(text(
+        'CREATE VIRTUAL TABLE IF NOT EXISTS question_fts USING fts5('
+        "subject, content, content='question', content_rowid='id', "
+        "tokenize='trigram')"
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS question_fts_ai AFTER INSERT ON question BEGIN '
+        'INSERT INTO question_fts(rowid, subject, content) '
+        'VALUES (new.id, new.subject, new.content); '
+        'END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS question_fts_ad AFTER DELETE ON question BEGIN '
+        "INSERT INTO question_fts(question_fts, rowid, subject, content) "
+        "VALUES ('delete', old.id, old.subject, old.content); "
+        'END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS question_fts_au AFTER UPDATE OF subject, content ON question BEGIN '
+        "INSERT INTO question_fts(question_fts, rowid, subject, content) "
+        "VALUES ('delete', old.id, old.subject, old.content); "
+        'INSERT INTO question_fts(rowid, subject, content) '
+        'VALUES (new.id, new.subject, new.content); '
+        'END'
+    ))
+    # 동작: 마이그레이션 이전에 저장된 질문을 인덱스에 채웁니다.
+    conn.execute(text("INSERT INTO question_fts(question_fts) VALUES ('rebuild')"))
+
+
+def _add_question_version(conn: Connection) -> None:
+    """ETag와 낙관적 동시성 제어용 version 컬럼을 추가합니다."""
+    columns = {row[1] for row in conn.execute(text('PRAGMA table_info(question)'))}
+    if 'version' not in columns:
+        conn.execute(text(
+            'ALTER TABLE question ADD COLUMN version INTEGER NOT NULL DEFAULT 1'
+        ))
+
+
+def _add_question_counter(conn: Connection) -> None:
+    """
+    질문 수 카운터와 동기화 트리거를 추가합니다.
+
+    트리거가 INSERT/DELETE와 같은 트랜잭션에서 row_counter를 갱신하므로, 쓰기가
+    롤백되면 카운터 변경도 함께 롤백됩니다. 초기값은 현재 행 수로 채웁니다.
+    """
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS row_counter ('
+        'name VARCHAR NOT NULL PRIMARY KEY, '
+        'value INTEGER NOT NULL DEFAULT 0)'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS question_count_ai AFTER INSERT ON question BEGIN '
+        "UPDATE row_counter SET value = value + 1 WHERE name = 'question'; "
+        'END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS question_count_ad AFTER DELETE ON question BEGIN '
+        "UPDATE row_counter SET value = value - 1 WHERE name = 'question'; "
+        'END'
+    ))
+    conn.execute(text(
+        'INSERT OR REPLACE INTO row_counter (name, value) '
+        "SELECT 'question', COUNT(*) FROM question"
+    ))
+
+
+def _add_question_change_feed(conn: Connection) -> None:
+    """
+    변경 피드(GET /questions/changes)용 컬럼, 인덱스, 트리거를 추가합니다.
+
+    - updated_at, deleted_at, change_seq 컬럼 추가 (기존 행은 change_seq = id, updated_at = create_date)
+    - change_seq 인덱스 추가
+    - INSERT와 제목/내용/삭제 여부 UPDATE마다 change_seq를 새 순번으로 바꾸는 트리거 추가
+    - 질문 수 트리거를 삭제 표시(tombstone)된 행을 세지 않는 트리거로 교체
+    """
+    columns = {row[1] for row in conn.execute(text('PRAGMA table_info(question)'))}
+    if 'updated_at' not in columns:
+        conn.execute(text('ALTER TABLE question ADD COLUMN updated_at DATETIME'))
+    if 'deleted_at' not in columns:
+        conn.execute(text('ALTER TABLE question ADD COLUMN deleted_at DATETIME'))
+    if 'change_seq' not in columns:
+        conn.execute(text(
+            'ALTER TABLE question ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0'
+        ))
+    # 동작: 기존 행은 ID 순서가 곧 생성 순서이므로 ID를 변경 순번으로 사용합니다.
+    conn.execute(text(
+        'UPDATE question SET change_seq = id, updated_at = COALESCE(updated_at, create_date) '
+        'WHERE change_seq = 0'
+    ))
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_question_change_seq ON question (change_seq)'
+    ))
+    conn.execute(text(
+        'INSERT OR REPLACE INTO row_counter (name, value) '
+        "SELECT 'question_change_seq', COALESCE(MAX(change_seq), 0) FROM question"
+    ))
+    # 동작: 트리거 안의 UPDATE는 change_seq와 updated_at만 바꾸므로 아래 UPDATE OF 트리거나
+    # 전문 검색 트리거를 다시 실행하지 않습니다.
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS question_change_ai AFTER INSERT ON question BEGIN '
+        "UPDATE row_counter SET value = value + 1 WHERE name = 'question_change_seq'; "
+        'UPDATE question SET '
+        "change_seq = (SELECT value FROM row_counter WHERE name = 'question_change_seq'), "
+        'updated_at = COALESCE(new.updated_at, new.create_date) '
+        'WHERE id = new.id; '
+        'END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS question_change_au '
+        'AFTER UPDATE OF subject, content, deleted_at ON question BEGIN '
+        "UPDATE row_counter SET value = value + 1 WHERE name = 'question_change_seq'; "
+        'UPDATE question SET '
+        "change_seq = (SELECT value FROM row_counter WHERE name = 'question_change_seq') "
+        'WHERE id = new.id; '
+        'END'
+    ))
+    conn.execute(text('DROP TRIGGER IF EXISTS question_count_ai'))
+    conn.execute(text('DROP TRIGGER IF EXISTS question_count_ad'))
+    conn.execute(text(
+        'CREATE TRIGGER question_count_ai AFTER INSERT ON question '
+        'WHEN new.deleted_at IS NULL BEGIN '
+        "UPDATE row_counter SET value = value + 1 WHERE name = 'question'; "
+        'END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER question_count_ad AFTER DELETE ON question '
+        'WHEN old.deleted_at IS NULL BEGIN '
+        "UPDATE row_counter SET value = value - 1 WHERE name = 'question'; "
+        'END'
+    ))
+    conn.execute(text(
+        'CREATE TRIGGER IF NOT EXISTS question_count_au AFTER UPDATE OF deleted_at ON question '
+        'WHEN (old.deleted_at IS NULL) != (new.deleted_at IS NULL) BEGIN '
+        "UPDATE row_counter SET value = value + (CASE WHEN new.deleted_at IS NULL THEN 1 ELSE -1 END) "
+        "WHERE name = 'question'; "
+        'END'
+    ))
+
+
+def _add_question_live_keyset_index(conn: Connection) -> None:
+    """
+    삭제되지 않은 질문만 담은 (create_date, id) 부분 인덱스로 목록 인덱스를 바꿉니다.
+
+    목록 조회는 모두 deleted_at IS NULL 조건을 붙이므로 SQLite가 부분 인덱스를 사용하며,
+    작성일시 범위(created_after/created_before)와 내림차순 정렬도 이 인덱스를 범위 탐색하거나
+    거꾸로 읽어 처리합니다. 삭제 표시된 행을 건너뛰려고 테이블을 읽지 않아도 되고, 같은 열의
+    전체 인덱스(ix_question_create_date_id)는 더 이상 쓰이지 않으므로 삭제합니다.
+    """
+    conn.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_question_live_create_date_id '
+        'ON question (create_date, id) WHERE deleted_at IS NULL'
+    ))
+    conn.execute(text('DROP INDEX IF EXISTS ix_question_create_date_id'))
+
+
+# 동작: 리스트의 순서(1부터 시작)가 곧 마이그레이션 번호입니다.
+# 이미 배포된 항목의 순서를 바꾸거나 삭제하지 않습니다.
+MIGRATIONS: List[Callable[[Connection], None]] = [
+    _add_question_keyset_index,
+    _add_question_fts,
+    _add_question_version,
+    _add_question_counter,
+    _add_question_change_feed,
+    _add_question_live_keyset_index,
+]
+
+
+def schema_fingerprint() -> str:
+    """
+    models.py의 테이블/인덱스 DDL과 마이그레이션 목록으로 스키마 지문을 만듭니다.
+
+    모델이나 마이그레이션이 바뀌면 지문도 바뀌므로 다음 시작 때 upgrade가 다시 실행됩니다.
+
+    Returns:
+        16자리 16진수 문자열
+    """
+    dialect = sqlite.dialect()
+    parts = []
+    for table in Base.metadata.sorted_tables:
+        parts.append(str(CreateTable(table).compile(dialect=dialect)))
+        parts.extend(
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in sorted(table.indexes, key=lambda index: index.name or '')
+        )
+    parts.extend(migration.__name__ for migration in MIGRATIONS)
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+
+def _stored_fingerprint(conn: Connection) -> Optional[str]:
+    """schema_meta에 저장된 스키마 지문을 반환합니다. 테이블이 없으면 None을 반환합니다."""
+    try:
+        return conn.execute(text(
+            "SELECT value FROM schema_meta WHERE name = 'fingerprint'"
+        )).scalar()
+    except OperationalError:
+        return None
+
+
+def schema_is_current(engine: Engine) -> bool:
+    """
+    저장된 스키마 지문과 user_version이 현재 코드와 같은지 확인합니다.
+
+    True이면 create_all과 마이그레이션을 실행해도 바뀌는 것이 없으므로 upgrade를 건너뛰어도 됩니다.
+
+    Args:
+        engine: 확인할 엔진
+
+    Returns:
+        스키마가 최신 상태인지 여부
+    """
+    with engine.connect() as conn:
+        if _stored_fingerprint(conn) != schema_fingerprint():
+            return False
+        current = conn.execute(text('PRAGMA user_version')).scalar() or 0
+    return current == len(MIGRATIONS)
+
+
+def upgrade(engine: Engine) -> int:
+    """
+    테이블을 생성하고 적용되지 않은 마이그레이션을 실행한 뒤 스키마 지문을 저장합니다.
+
+    Args:
+        engine: 마이그레이션을 적용할 엔진
+
+    Returns:
+        적용 후의 스키마 버전 (user_version)
+    """
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        current = conn.execute(text('PRAGMA user_version')).scalar() or 0
+        for version, migration in enumerate(MIGRATIONS, start=1):
+            if version <= current:
+                continue
+            migration(conn)
+            conn.execute(text(f'PRAGMA user_version = {version}'))
+            current = version
+        conn.execute(text(
+            'CREATE TABLE IF NOT EXISTS schema_meta ('
+            'name VARCHAR NOT NULL PRIMARY KEY, '
+            'value VARCHAR NOT NULL)'
+        ))
+        conn.execute(
+            text("INSERT OR REPLACE INTO schema_meta (name, value) VALUES ('fingerprint', :value)"),
+            {'value': schema_fingerprint()}
+        )
+    return current
@@ -4,7 +4,7 @@ ORM 모델 정의 모듈
 이 모듈은 SQLAlchemy의 선언적 베이스를 사용하여 데이터베이스 테이블을 Python 클래스로 정의합니다.
 프로젝트의 모델 계층 초기화 단계에서 실행됩니다.
 """
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -28,8 +28,29 @@ class Question(Base):
     - subject: 질문 제목 (필수 입력)
     - content: 질문 내용 (필수 입력)
     - create_date: 질문 작성일시 (자동으로 현재 시간 설정)
+    - version: 행 버전 (수정될 때마다 1씩 증가, ETag와 낙관적 동시성 제어에 사용)
+    - updated_at: 마지막으로 생성/수정/삭제된 일시
+    - deleted_at: 삭제 일시 (NULL이면 살아 있는 질문, 값이 있으면 삭제 표시(tombstone))
+    - change_seq: 변경 순번 (생성/수정/삭제가 커밋될 때마다 전체에서 1씩 증가하는 값)
+    
+    삭제는 행을 지우지 않고 deleted_at을 채우고 제목/내용을 비우는 방식(soft delete)이므로,
+    GET /questions/changes가 삭제된 질문도 변경 내역으로 알려줄 수 있습니다.
+    조회 경로는 모두 deleted_at IS NULL 조건으로 삭제된 질문을 제외합니다.
     """
     __tablename__ = 'question'
+
+    # 동작: 목록 조회(커서 페이지네이션, 작성일시 범위, 오름/내림차순)가 (create_date, id)
+    # 순서로 인덱스를 바로 탐색하도록 복합 인덱스를 정의합니다. 목록은 항상 삭제되지 않은
+    # 질문만 조회하므로 삭제 표시된 행은 인덱스에 넣지 않습니다(부분 인덱스).
+    # 기존 데이터베이스에는 migrations.py가 추가합니다.
+    # 변경 피드가 change_seq 순서로 인덱스를 바로 탐색하도록 change_seq 인덱스도 정의합니다.
+    __table_args__ = (
+        Index(
+            'ix_question_live_create_date_id', 'create_date', 'id',
+            sqlite_where=text('deleted_at IS NULL')
+        ),
+        Index('ix_question_change_seq', 'change_seq'),
+    )
     
     # 동작: Primary Key로 설정되어 자동으로 고유 번호가 할당됩니다.
     id = Column(Integer, primary_key=True)
@@ -42,4 +63,43 @@ class Question(Base):
     
     # 동작: default=datetime.now로 설정되어 레코드 생성 시 자동으로 현재 시간이 저장됩니다.
     create_date = Column(DateTime, nullable=False, default=datetime.now)
+    
+    # 동작: 수정/삭제마다 서비스 계층의 UPDATE ... RETURNING 문이 직접 1 증가시킵니다.
+    # If-Match가 있으면 'WHERE version = 기대한 값' 조건을 같은 문장에 붙이고, 수정된 행이
+    # 없으면 VersionConflictError를 발생시켜 덮어쓰기(lost update)를 막습니다.
+    # (service.build_update_statement 참고)
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+    
+    # 동작: 생성 시에는 migrations.py의 INSERT 트리거가 create_date로 채우고,
+    # 수정/삭제 시에는 서비스 계층이 현재 시각으로 갱신합니다.
+    updated_at = Column(DateTime, nullable=True)
+    
+    # 동작: NULL이면 살아 있는 질문입니다. 삭제하면 삭제 일시가 저장됩니다.
+    deleted_at = Column(DateTime, nullable=True)
+    
+    # 동작: migrations.py의 트리거가 INSERT와 제목/내용/삭제 여부 UPDATE마다
+    # row_counter의 'question_change_seq' 값을 1 늘려 저장합니다. SQLite는 쓰기 트랜잭션을
+    # 하나씩만 실행하므로 이 순서가 곧 커밋 순서입니다.
+    change_seq = Column(Integer, nullable=False, default=0, server_default='0')
 
+
+class RowCounter(Base):
+    """
+    테이블 행 수 카운터 모델 클래스
+    
+    목록 응답의 total 값을 COUNT(*) 전체 스캔 없이 기본 키 조회 한 번으로 읽기 위해
+    테이블별 행 수를 보관합니다. 값은 migrations.py에서 만든 트리거가 같은 트랜잭션
+    안에서 갱신하므로 어떤 쓰기 경로(단건, 대량 등록, 삭제)든 반영됩니다.
+    삭제 표시(tombstone)된 질문은 행 수에 포함하지 않습니다.
+    
+    질문 변경 순번(question.change_seq)의 마지막 값도 'question_change_seq' 행에 보관합니다.
+    
+    테이블 구조:
+    - name: 대상 이름 (Primary Key, 예: 'question', 'question_change_seq')
+    - value: 현재 행 수 또는 마지막 변경 순번
+    """
+    __tablename__ = 'row_counter'
+    
+    name = Column(String, primary_key=True)
+    
+    value = Column(Integer, nullable=False, default=0, server_default='0')
@@ -0,0 +1,281 @@
+"""
+SQL 프로파일러 모듈
+
+BOARD_SQL_PROFILER=1 일 때만 엔진에 이벤트를 등록해 다음 정보를 수집합니다.
+결과는 GET /debug/sql에서 조회하고 POST /debug/sql/reset으로 초기화합니다.
+
+- 정규화한 SQL 문장별 실행 횟수, 합계/최대 시간
+- 가장 느린 N개 쿼리와 바인딩 파라미터
+- 한 요청 안에서 같은 문장이 반복 실행된 경우 (N+1 의심)
+- 임계 시간을 넘은 쿼리의 EXPLAIN QUERY PLAN 결과와 전체 테이블 스캔 여부
+
+EXPLAIN은 정규화한 문장마다 한 번만 실행하고, 모든 저장소는 크기 제한이 있으므로
+켜 둔 채로 부하 테스트를 해도 메모리가 계속 늘지 않습니다.
+"""
+import heapq
+import itertools
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from config import (
+    SQL_PROFILER_SLOWEST,
+    SQL_PROFILER_EXPLAIN_MS,
+    SQL_PROFILER_REPEAT_THRESHOLD,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_STATEMENTS = 500
+MAX_EVENTS = 100
+MAX_PARAMS_CHARS = 200
+
+_WHITESPACE = re.compile(r'\s+')
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'IN \((?:\?, )+\?\)', re.IGNORECASE)
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    리터럴 값과 공백을 정리해 같은 형태의 SQL 문장이 같은 키가 되도록 만듭니다.
+
+    예: "SELECT ... WHERE id IN (?, ?, ?) LIMIT 20" -> "SELECT ... WHERE id IN (...) LIMIT ?"
+    """
+    normalized = _WHITESPACE.sub(' ', statement).strip()
+    normalized = _STRING_LITERAL.sub('?', normalized)
+    normalized = _NUMBER_LITERAL.sub('?', normalized)
+    return _IN_LIST.sub('IN (...)', normalized)
+
+
+def _is_full_scan(detail: str) -> bool:
+    """EXPLAIN QUERY PLAN의 detail이 인덱스 없는 전체 테이블 스캔인지 판단합니다."""
+    return detail.startswith('SCAN ') and 'USING' not in detail and 'VIRTUAL TABLE' not in detail
+
+
+class _RequestProfile:
+    """요청 하나에서 실행된 문장별 횟수"""
+    __slots__ = ('scope', 'counts')
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.counts: Counter = Counter()
+
+    @property
+    def route(self) -> Optional[str]:
+        return getattr(self.scope.get('route'), 'path', None)
+
+
+_current_profile: ContextVar[Optional[_RequestProfile]] = ContextVar(
+    'board_sql_profile', default=None
+)
+
+
+class SqlProfiler:
+    """
+    SQL 실행 통계 수집기
+
+    여러 스레드의 요청이 동시에 기록하므로 잠금으로 보호합니다.
+    """
+
+    def __init__(
+        self,
+        slowest: int = SQL_PROFILER_SLOWEST,
+        explain_ms: float = SQL_PROFILER_EXPLAIN_MS,
+        repeat_threshold: int = SQL_PROFILER_REPEAT_THRESHOLD
+    ):
+        self.slowest = slowest
+        self.explain_seconds = explain_ms / 1000
+        self.repeat_threshold = repeat_threshold
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self.reset()
+
+    def reset(self) -> None:
+        """수집한 통계를 모두 비웁니다."""
+        with self._lock:
+            # 정규화 문장 -> [횟수, 합계 시간, 최대 시간]
+            self._statements: Dict[str, List[float]] = {}
+            # (시간, 순번, 항목) 최소 힙. 가장 빠른 항목이 맨 앞에 있어 바로 교체할 수 있음
+            self._slow_heap: List[Tuple[float, int, Dict[str, Any]]] = []
+            self._plans: Dict[str, List[str]] = {}
+            self._full_scans: Deque[Dict[str, Any]] = deque(maxlen=MAX_EVENTS)
+            self._repeats: Deque[Dict[str, Any]] = deque(maxlen=MAX_EVENTS)
+            self.dropped_statements = 0
+
+    def install(self, engine: Engine) -> None:
+        """
+        엔진에 프로파일링 이벤트를 등록합니다.
+
+        Args:
+            engine: 동기 엔진 (비동기 엔진은 async_engine.sync_engine을 전달)
+        """
+        self.enabled = True
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info['board_profiler_started'] = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop('board_profiler_started', None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        normalized = normalize_statement(statement)
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.counts[normalized] += 1
+
+        with self._lock:
+            stats = self._statements.get(normalized)
+            if stats is None:
+                if len(self._statements) >= MAX_STATEMENTS:
+                    self.dropped_statements += 1
+                else:
+                    self._statements[normalized] = [1, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                if elapsed > stats[2]:
+                    stats[2] = elapsed
+
+            is_slow = self.slowest > 0 and (
+                len(self._slow_heap) < self.slowest or elapsed > self._slow_heap[0][0]
+            )
+            if is_slow:
+                entry = {
+                    'statement': _WHITESPACE.sub(' ', statement).strip(),
+                    'parameters': repr(parameters)[:MAX_PARAMS_CHARS],
+                    'duration_ms': round(elapsed * 1000, 3),
+                    'route': profile.route if profile is not None else None,
+                    'at': time.time(),
+                }
+                item = (elapsed, next(self._sequence), entry)
+                if len(self._slow_heap) < self.slowest:
+                    heapq.heappush(self._slow_heap, item)
+                else:
+                    heapq.heapreplace(self._slow_heap, item)
+            needs_plan = (
+                elapsed >= self.explain_seconds
+                and not executemany
+                and normalized not in self._plans
+                and statement.lstrip()[:6].upper() == 'SELECT'
+            )
+            if needs_plan:
+                # 동작: 다른 스레드가 같은 문장을 중복으로 EXPLAIN하지 않도록 자리를 먼저 잡습니다.
+                self._plans[normalized] = []
+
+        if needs_plan:
+            self._explain(conn, statement, parameters, normalized, profile)
+
+    def _explain(self, conn, statement, parameters, normalized, profile) -> None:
+        """
+        느린 SELECT의 실행 계획을 조회하고 전체 테이블 스캔이면 기록합니다.
+
+        SQLAlchemy 이벤트가 다시 호출되지 않도록 DBAPI 커서로 직접 실행합니다.
+        """
+        try:
+            cursor = conn.connection.cursor()
+            try:
+                cursor.execute('EXPLAIN QUERY PLAN ' + statement, parameters)
+                plan = [row[3] for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+        except Exception:
+            logger.debug('EXPLAIN QUERY PLAN 실패: %s', normalized, exc_info=True)
+            return
+
+        scans = [detail for detail in plan if _is_full_scan(detail)]
+        with self._lock:
+            self._plans[normalized] = plan
+            if scans:
+                self._full_scans.append({
+                    'statement': normalized,
+                    'scans': scans,
+                    'route': profile.route if profile is not None else None,
+                    'at': time.time(),
+                })
+        if scans:
+            logger.warning('전체 테이블 스캔 쿼리: %s (%s)', normalized, '; '.join(scans))
+
+    def finish_request(self, profile: _RequestProfile) -> None:
+        """요청이 끝났을 때 같은 문장이 임계 횟수 이상 반복되었으면 N+1 의심으로 기록합니다."""
+        repeated = [
+            (statement, count) for statement, count in profile.counts.items()
+            if count >= self.repeat_threshold
+        ]
+        if not repeated:
+            return
+        route = profile.route
+        with self._lock:
+            for statement, count in repeated:
+                self._repeats.append({
+                    'route': route,
+                    'statement': statement,
+                    'count': count,
+                    'at': time.time(),
+                })
+        for statement, count in repeated:
+            logger.warning('N+1 의심: %s 요청에서 같은 쿼리를 %d번 실행했습니다: %s', route, count, statement)
+
+    def snapshot(self, limit: int = 50) -> Dict[str, Any]:
+        """
+        수집한 통계를 딕셔너리로 반환합니다.
+
+        Args:
+            limit: 반환할 문장 통계의 최대 개수 (합계 시간 순)
+        """
+        with self._lock:
+            statements = sorted(self._statements.items(), key=lambda kv: kv[1][1], reverse=True)
+            slowest = [entry for _, _, entry in sorted(self._slow_heap, reverse=True)]
+            plans = {statement: list(plan) for statement, plan in self._plans.items() if plan}
+            full_scans = list(self._full_scans)
+            repeats = list(self._repeats)
+            dropped = self.dropped_statements
+        return {
+            'enabled': self.enabled,
+            'statements': [
+                {
+                    'statement': statement,
+                    'count': int(count),
+                    'total_ms': round(total * 1000, 3),
+                    'avg_ms': round(total * 1000 / count, 3),
+                    'max_ms': round(maximum * 1000, 3),
+                    'plan': plans.get(statement),
+                }
+                for statement, (count, total, maximum) in statements[:limit]
+            ],
+            'dropped_statements': dropped,
+            'slowest': slowest,
+            'full_scans': full_scans,
+            'possible_n_plus_one': repeats,
+        }
+
+
+sql_profiler = SqlProfiler()
+
+
+class ProfilerMiddleware:
+    """요청마다 실행된 문장 횟수를 모아 N+1 의심 패턴을 찾는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        profile = _RequestProfile(scope)
+        token = _current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_profile.reset(token)
+            sql_profiler.finish_request(profile)
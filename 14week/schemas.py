@@ -3,9 +3,11 @@ Pydantic 스키마 모델 정의
 
 API 요청/응답에 사용되는 데이터 모델을 정의합니다.
 """
-from pydantic import BaseModel, field_validator
+import time
+from pydantic import BaseModel, field_validator, model_serializer
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from metrics import add_serialization_time
 
 
 class QuestionCreate(BaseModel):
@@ -50,6 +52,16 @@ class ApiResponse(BaseModel):
     message: Optional[str] = None
     data: Optional[Dict[str, Any]] = None
 
+    # 동작: 라우트가 직접 호출하는 model_dump_json과 FastAPI의 response_model 직렬화를
+    # 모두 거치는 지점이므로, 여기서 걸린 시간을 요청별 직렬화 시간으로 기록합니다.
+    @model_serializer(mode='wrap')
+    def _timed_serialize(self, handler):
+        started = time.perf_counter()
+        try:
+            return handler(self)
+        finally:
+            add_serialization_time(time.perf_counter() - started)
+
 
 class Question(BaseModel):
     """
@@ -64,4 +76,36 @@ class Question(BaseModel):
 
     class Config:
         # ORM 객체(SQLAlchemy 등)를 Pydantic 모델로 변환 허용
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class QuestionListItem(BaseModel):
+    """
+    질문 목록의 항목 모델
+
+    fields 쿼리 파라미터로 고른 필드만 포함되므로 id 외의 필드는 생략될 수 있습니다.
+    기본값은 id, subject, create_date입니다.
+    """
+    id: int
+    subject: Optional[str] = None
+    content: Optional[str] = None
+    create_date: Optional[datetime] = None
+
+
+class QuestionListData(BaseModel):
+    """질문 목록 응답의 data 모델"""
+    questions: List[QuestionListItem]
+    count: int
+    total: int
+    next_cursor: Optional[str] = None
+
+
+class QuestionListApiResponse(BaseModel):
+    """
+    질문 목록 API 응답 모델
+
+    목록 엔드포인트의 OpenAPI 문서용입니다. 실제 본문은 검증/직렬화 비용을 줄이기 위해
+    domain.question.serialization이 조회 결과 행에서 같은 형태로 직접 만듭니다.
+    """
+    status: str
+    message: Optional[str] = None
+    data: QuestionListData
@@ -0,0 +1,173 @@
+"""
+멀티 워커 실행 모듈
+
+uvicorn 프로세스 하나는 CPU 코어 하나만 사용하므로, BOARD_WORKERS를 2 이상으로 두면
+python main.py가 이 모듈로 워커 프로세스 여러 개를 띄웁니다.
+
+동작 흐름 (POSIX prefork):
+1. 부모 프로세스가 스키마 준비(prepare_database)를 한 번만 실행하고 DB 연결을 닫음
+2. 부모가 리슨 소켓을 열고 워커 수만큼 fork (워커들이 같은 소켓에서 accept)
+3. 각 워커는 부모의 연결 풀을 버리고 uvicorn.Server로 요청을 처리
+4. 워커가 예기치 않게 종료되면 부모가 같은 번호로 다시 fork
+5. 부모가 SIGTERM/SIGINT를 받으면 워커들에게 SIGTERM을 보내고 모두 종료될 때까지 대기
+
+워커 간 공유 상태:
+- 데이터 버전(cache.py)은 fork 전에 만든 공유 메모리 값이라 한 워커의 쓰기가
+  다른 워커의 목록 캐시와 ETag도 무효화함
+- 질문 수 카운터는 DB에 있으므로 자연히 공유되고, 주기적 보정은 0번 워커만 실행
+- 그 밖의 캐시, 그룹 커밋 큐, 실시간 이벤트 허브, /metrics 값은 워커마다 따로 유지됨
+
+fork를 지원하지 않는 플랫폼에서는 단일 프로세스로 실행합니다.
+"""
+import os
+import signal
+import socket
+import time
+from typing import Callable, Dict
+import uvicorn
+from fastapi import FastAPI
+from database import reset_connection_pools
+from domain.question.events import question_events
+
+# 동작: 워커가 시작 직후 계속 죽는 경우 재시작이 폭주하지 않도록 두는 간격(초)
+RESTART_DELAY = 1.0
+
+
+class BoardServer(uvicorn.Server):
+    """
+    종료 시그널을 받으면 실시간 스트림 연결부터 닫는 uvicorn 서버
+
+    uvicorn은 열린 연결이 모두 끝나야 종료를 마치므로, SSE/WebSocket 구독자에게 바로
+    close 이벤트를 보내지 않으면 종료가 끝나지 않습니다.
+    """
+
+    def handle_exit(self, sig, frame) -> None:
+        question_events.close()
+        super().handle_exit(sig, frame)
+
+
+def run(app: FastAPI, host: str, port: int) -> None:
+    """
+    단일 프로세스로 서버를 실행합니다.
+
+    Args:
+        app: 실행할 FastAPI 앱
+        host: 바인드할 주소
+        port: 바인드할 포트
+    """
+    BoardServer(uvicorn.Config(app, host=host, port=port)).run()
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    """
+    워커들이 함께 accept할 리슨 소켓을 엽니다.
+
+    Args:
+        host: 바인드할 주소
+        port: 바인드할 포트
+
+    Returns:
+        fork한 워커에 상속되는 리슨 소켓
+    """
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app: FastAPI, worker_id: int, sock: socket.socket) -> None:
+    """fork된 워커 프로세스에서 uvicorn 서버를 실행합니다."""
+    # 동작: 부모의 시그널 처리기를 되돌립니다. uvicorn이 서버 시작 시 자기 처리기를 다시 등록합니다.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    reset_connection_pools(close=False)
+    app.state.worker_id = worker_id
+    server = BoardServer(uvicorn.Config(app, lifespan='on'))
+    server.run(sockets=[sock])
+
+
+def _spawn(app: FastAPI, worker_id: int, sock: socket.socket) -> int:
+    """워커 프로세스 하나를 fork하고 pid를 반환합니다."""
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _run_worker(app, worker_id, sock)
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        finally:
+            # 동작: 부모의 atexit 처리기나 finally 블록이 워커에서 실행되지 않도록 바로 종료합니다.
+            os._exit(code)
+    return pid
+
+
+def serve(
+    app: FastAPI,
+    prepare: Callable[[], None],
+    workers: int,
+    host: str,
+    port: int
+) -> None:
+    """
+    워커 프로세스 여러 개로 애플리케이션을 실행합니다.
+
+    Args:
+        app: 실행할 FastAPI 애플리케이션
+        prepare: fork 전에 한 번 실행할 준비 함수 (main.prepare_database)
+        workers: 워커 프로세스 수
+        host: 바인드할 주소
+        port: 바인드할 포트
+    """
+    if not hasattr(os, 'fork'):
+        print('이 플랫폼은 fork를 지원하지 않아 단일 프로세스로 실행합니다.')
+        run(app, host=host, port=port)
+        return
+
+    prepare()
+    # 동작: 준비 단계에서 연 DB 연결을 닫아 워커에 열린 SQLite 연결이 넘어가지 않게 합니다.
+    reset_connection_pools(close=True)
+
+    sock = _bind_socket(host, port)
+    children: Dict[int, int] = {}
+    stopping = False
+
+    def handle_stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, handle_stop)
+    signal.signal(signal.SIGINT, handle_stop)
+
+    for worker_id in range(workers):
+        children[_spawn(app, worker_id, sock)] = worker_id
+    print(f'워커 {workers}개로 http://{host}:{port} 에서 실행합니다. (부모 pid {os.getpid()})')
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        worker_id = children.pop(pid, None)
+        if worker_id is None or stopping:
+            continue
+        print(f'워커 {worker_id}(pid {pid})가 종료되어(상태 {status}) 다시 시작합니다.')
+        time.sleep(RESTART_DELAY)
+        if not stopping:
+            children[_spawn(app, worker_id, sock)] = worker_id
+    sock.close()
+
+
+if __name__ == '__main__':
+    from config import HOST, PORT, WORKERS
+    from main import app, prepare_database
+    serve(app, prepare_database, workers=max(WORKERS, 1), host=HOST, port=PORT)
@@ -0,0 +1,123 @@
+"""
+시작 시간 계측 모듈
+
+자동 확장으로 새 인스턴스가 뜰 때는 프로세스 시작부터 첫 요청을 처리하기까지의 시간이
+곧 부하를 받아 줄 수 있을 때까지의 지연입니다. 이 모듈은 시작 과정을 단계별로 나눠
+각 단계에 걸린 시간을 기록합니다.
+
+- main.py가 import 묶음과 앱 구성이 끝날 때마다 mark()로 단계를 기록
+- startup 이벤트와 백그라운드 예열(warm-up)이 스키마 확인, 연결 예열 등의 단계를 기록
+- 예열이 끝나면 mark_ready(), 첫 요청을 처리하면 mark_first_request()
+
+각 단계의 시간은 직전 mark()부터의 경과 시간이며, 첫 단계(interpreter)는 프로세스
+시작부터 이 모듈이 import될 때까지입니다 (/proc를 읽을 수 있는 Linux에서만 기록).
+결과는 GET /debug/startup과 GET /ready에서 확인할 수 있습니다.
+
+모듈 단위의 자세한 import 시간은 python -X importtime main.py 또는
+benchmarks/cold_start.py --importtime으로 확인합니다.
+
+main.py가 다른 모듈보다 먼저 import해야 하므로 표준 라이브러리만 사용합니다.
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _seconds_since_process_start() -> Optional[float]:
+    """
+    프로세스가 시작된 뒤 지난 시간(초)을 반환합니다.
+
+    Returns:
+        /proc/self/stat의 시작 시각 기준 경과 시간 (읽을 수 없으면 None, 해상도는 보통 10ms)
+    """
+    try:
+        with open('/proc/self/stat') as stat_file:
+            # 동작: 두 번째 필드(프로세스 이름)에 공백이 있을 수 있으므로 ')' 뒤부터 나눕니다.
+            fields = stat_file.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as uptime_file:
+            uptime = float(uptime_file.read().split()[0])
+        started = int(fields[19]) / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return None
+    return max(uptime - started, 0.0)
+
+
+class StartupTimer:
+    """시작 단계별 소요 시간과 준비 완료/첫 요청 시각을 기록하는 타이머"""
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._last = self._origin
+        self._lock = threading.Lock()
+        self._phases: List[Tuple[str, float]] = []
+        self._ready_at: Optional[float] = None
+        self._first_request_at: Optional[float] = None
+        self.details: Dict[str, Any] = {}
+        # 동작: 프로세스 시작부터 이 모듈 import까지(인터프리터 기동, site 등)를 첫 단계로 둡니다.
+        before = _seconds_since_process_start()
+        if before is not None:
+            self._origin -= before
+            self._phases.append(('interpreter', before))
+
+    def mark(self, name: str) -> float:
+        """
+        직전 mark()부터 지금까지를 한 단계로 기록합니다.
+
+        Args:
+            name: 단계 이름 (예: import.fastapi, startup.schema)
+
+        Returns:
+            이 단계에 걸린 시간(초)
+        """
+        now = time.perf_counter()
+        with self._lock:
+            elapsed = now - self._last
+            self._last = now
+            self._phases.append((name, elapsed))
+        return elapsed
+
+    def mark_ready(self) -> None:
+        """예열이 끝나 요청을 받을 준비가 된 시각을 기록합니다."""
+        self._ready_at = time.perf_counter()
+
+    def mark_first_request(self) -> None:
+        """첫 요청을 처리한 시각을 기록합니다. 두 번째 호출부터는 무시합니다."""
+        if self._first_request_at is None:
+            self._first_request_at = time.perf_counter()
+
+    @property
+    def ready(self) -> bool:
+        """예열이 끝났는지 여부"""
+        return self._ready_at is not None
+
+    def _since_origin_ms(self, moment: Optional[float]) -> Optional[float]:
+        return None if moment is None else round((moment - self._origin) * 1000, 1)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        단계별 소요 시간을 반환합니다.
+
+        Returns:
+            phases_ms(단계별 ms), ready_ms(준비 완료까지 ms), first_request_ms(첫 요청까지 ms),
+            details(스키마 확인 결과 등 단계별 부가 정보)를 담은 딕셔너리
+        """
+        with self._lock:
+            phases = {name: round(elapsed * 1000, 1) for name, elapsed in self._phases}
+        return {
+            'phases_ms': phases,
+            'ready': self.ready,
+            'ready_ms': self._since_origin_ms(self._ready_at),
+            'first_request_ms': self._since_origin_ms(self._first_request_at),
+            'details': dict(self.details),
+        }
+
+    def summary(self) -> str:
+        """단계별 소요 시간을 한 줄로 요약한 문자열을 반환합니다."""
+        report = self.report()
+        phases = ', '.join(f'{name}={elapsed}ms' for name, elapsed in report['phases_ms'].items())
+        return f"준비 완료까지 {report['ready_ms']}ms ({phases})"
+
+
+# 동작: main.py가 가장 먼저 import하므로 타이머 기준 시각이 앱 모듈 import 직전이 됩니다.
+startup_timer = StartupTimer()
@@ -0,0 +1,23 @@
+"""
+테스트 공용 설정
+
+- 테스트가 14week 디렉터리의 앱 모듈(config, database, admission 등)을 import할 수 있게 함
+- database 모듈은 import될 때 BOARD_DATABASE_URL을 읽으므로, 어떤 앱 모듈보다 먼저
+  테스트 세션 전용 임시 SQLite 파일을 가리키게 함 (board.db를 건드리지 않음)
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+_DATABASE_DIR = tempfile.mkdtemp(prefix='board-test-')
+os.environ['BOARD_DATABASE_URL'] = f"sqlite:///{os.path.join(_DATABASE_DIR, 'board.db')}"
+os.environ.pop('BOARD_READ_REPLICA_URLS', None)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_DATABASE_DIR, ignore_errors=True)
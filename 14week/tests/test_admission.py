@@ -0,0 +1,31 @@
+"""
+입장 제어 동시 실행 제한기(ConcurrencyLimiter) 테스트
+
+슬롯을 넘겨받는 것과 대기 시간 초과가 겹쳐도 슬롯이 사라지지 않는지 확인합니다.
+"""
+import asyncio
+import pytest
+import admission
+from admission import ConcurrencyLimiter, OverloadedError
+
+
+def test_slot_handed_over_at_timeout_is_released(monkeypatch):
+    limiter = ConcurrencyLimiter(limit=1, queue_size=1, queue_timeout_ms=1000)
+
+    async def wait_for_racing_release(future, timeout):
+        # 동작: 슬롯을 가진 요청이 반납해 대기자의 Future가 완료된 순간 시간 초과가 발생한 경우
+        limiter.release()
+        assert future.done()
+        raise asyncio.TimeoutError
+
+    async def scenario():
+        await limiter.acquire()
+        monkeypatch.setattr(admission.asyncio, 'wait_for', wait_for_racing_release)
+        with pytest.raises(OverloadedError) as excinfo:
+            await limiter.acquire()
+        assert excinfo.value.reason == 'queue_timeout'
+
+    asyncio.run(scenario())
+    assert limiter.active == 0
+    assert limiter.waiting == 0
+
@@ -0,0 +1,46 @@
+"""
+질문 등록 그룹 커밋(GroupCommitWriter) 테스트
+
+커밋 뒤의 캐시 무효화나 이벤트 발행이 실패해도 배치를 다시 저장하지 않는지 확인합니다.
+"""
+from concurrent.futures import Future
+import pytest
+from sqlalchemy import func, select
+from database import SessionLocal, engine
+from migrations import upgrade
+from models import Question
+from schemas import QuestionCreate
+from domain.question import group_commit
+from domain.question.group_commit import GroupCommitWriter
+
+
+@pytest.fixture(scope='module', autouse=True)
+def schema():
+    upgrade(engine)
+
+
+def _count() -> int:
+    with SessionLocal() as db:
+        return db.execute(select(func.count(Question.id))).scalar_one()
+
+
+def test_publish_failure_after_commit_does_not_insert_twice(monkeypatch):
+    def failing_publish(question):
+        raise RuntimeError('subscriber failure')
+
+    monkeypatch.setattr(group_commit, 'publish_created', failing_publish)
+    writer = GroupCommitWriter()
+    batch = [
+        (QuestionCreate(subject=f'subject {i}', content=f'content {i}'), Future())
+        for i in range(3)
+    ]
+    before = _count()
+
+    writer._commit(batch)
+
+    ids = [future.result(timeout=0) for _, future in batch]
+    assert _count() == before + 3
+    assert len({question.id for question in ids}) == 3
+    stats = writer.stats()
+    assert stats['retried_batches'] == 0
+    assert stats['failed'] == 0
@@ -0,0 +1,40 @@
+"""
+질문 목록 조회 실행 계획 테스트
+
+benchmarks/list_query_plan.py의 확인(check_plans)을 작은 임시 DB에서 실행해, 모든
+정렬/범위/커서/필드 조합이 전체 테이블 스캔이나 정렬용 임시 B-tree 없이
+ix_question_live_create_date_id 인덱스를 쓰는지 확인합니다.
+
+실행 방법 (14week 디렉터리에서):
+    python -m pytest tests
+"""
+import os
+import sys
+import pytest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='module')
+def seeded_engine():
+    """최신 스키마에 질문 2000개(10%는 삭제 표시)를 넣은 테스트 DB(conftest.py)의 쓰기 엔진"""
+    sys.path.insert(0, os.path.join(APP_DIR, 'benchmarks'))
+    from database import engine
+    from migrations import upgrade
+    from list_query_plan import seed
+
+    upgrade(engine)
+    seed(engine, 2000)
+    return engine
+
+
+def test_list_queries_use_live_index(seeded_engine):
+    from list_query_plan import check_plans
+
+    results = check_plans(seeded_engine)
+    failures = [
+        f"{label}: {', '.join(found)} ({' | '.join(plan)})"
+        for label, plan, found in results if found
+    ]
+    assert results
+    assert not failures, '\n'.join(failures)